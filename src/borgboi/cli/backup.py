@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import json
+import socket
 from typing import TYPE_CHECKING, Annotated, cast
 
 from cyclopts import App, Parameter
 
-from borgboi.cli.main import ContextArg, confirm_action, print_error_and_exit
+from borgboi.cli.main import BorgBoiContext, ContextArg, confirm_action, print_error_and_exit
 from borgboi.core.logging import get_logger
 from borgboi.lib.diff import format_diff_change, summarize_diff_changes
 from borgboi.rich_utils import console
@@ -196,12 +197,21 @@ def backup_daily(
     *,
     path: Annotated[str | None, Parameter(name=["--path", "-p"], help="Repository path")] = None,
     name: Annotated[str | None, Parameter(name=["--name", "-n"], help="Repository name")] = None,
+    all_repos: Annotated[
+        bool, Parameter(name="--all", negative="", help="Back up every repository on this host")
+    ] = False,
+    concurrency: Annotated[int, Parameter(name="--concurrency", help="Repositories to back up at once with --all")] = 4,
     passphrase: Annotated[str | None, Parameter(name="--passphrase", help="Passphrase override")] = None,
     no_s3_sync: Annotated[bool, Parameter(name="--no-s3-sync", negative="", help="Skip S3 sync after backup")] = False,
     ctx: ContextArg,
 ) -> None:
     """Perform daily backup with prune and compact."""
     logger.info("Running daily backup command", repo_name=name, repo_path=path, no_s3_sync=no_s3_sync)
+    if all_repos:
+        if name or path or passphrase:
+            print_error_and_exit("--all cannot be combined with --name, --path, or --passphrase.")
+        _backup_daily_all(ctx, concurrency=concurrency, sync_to_s3=not no_s3_sync)
+        return
     if not name and not path:
         logger.info("Daily backup command missing repository selector")
         print_error_and_exit("Provide either --name or --path to select a repository.")
@@ -226,6 +236,27 @@ def backup_daily(
         print_error_and_exit(str(error), error=error)
 
 
+def _backup_daily_all(ctx: BorgBoiContext, *, concurrency: int, sync_to_s3: bool) -> None:
+    """Run daily backups for every repository registered to this host."""
+    try:
+        hostname = socket.gethostname()
+        repos = [repo for repo in ctx.orchestrator.list_repos() if repo.hostname == hostname]
+        if not repos:
+            console.print(f"No repositories found for host [bold]{hostname}[/]")
+            return
+        failures = ctx.orchestrator.daily_backup_all(repos, sync_to_s3=sync_to_s3, concurrency=concurrency)
+    except Exception as error:
+        logger.exception("Daily backup command failed", error=str(error), all_repos=True)
+        print_error_and_exit(str(error), error=error)
+
+    logger.info("Daily backup command completed", repo_count=len(repos), failure_count=len(failures))
+    if failures:
+        for repo_name, failure in failures.items():
+            console.print(f"[bold red]{repo_name}:[/] {failure}")
+        print_error_and_exit(f"Daily backup failed for {len(failures)} of {len(repos)} repositories.")
+    console.print(f"[bold green]Daily backup completed successfully for {len(repos)} repositories[/]")
+
+
 @backup.command(name="list")
 def backup_list(
     *,
@@ -235,29 +266,46 @@ def backup_list(
     ctx: ContextArg,
 ) -> None:
     """List archives in a repository."""
+    from datetime import UTC, datetime
+
+    from rich.live import Live
+    from rich.table import Table
+
     from borgboi.lib import utils
     from borgboi.lib.colors import COLOR_HEX
 
     logger.info("Running archive list command", repo_name=name, repo_path=path)
     try:
         repo_info = ctx.orchestrator.get_repo(name=name, path=path)
-        archives = ctx.orchestrator.list_archives(repo_info, passphrase=passphrase)
-        archives.sort(key=lambda archive: archive.name, reverse=True)
+        title = f"[bold]Archives for {_repo_name(repo_info, name)}[/]"
+        rows: list[tuple[str, str, str]] = []
+
+        def render_table() -> Table:
+            table = Table(title=title, expand=True)
+            table.add_column("Archive", style=f"bold {COLOR_HEX.sky}")
+            table.add_column("Age", style=f"bold {COLOR_HEX.green}")
+            table.add_column("ID", style=COLOR_HEX.mauve)
+            for row in reversed(rows):
+                table.add_row(*row)
+            return table
+
+        # Borg emits archives oldest-first. Rendering them newest-first keeps the
+        # listing order and puts each new row at the top, so it stays visible
+        # while the live view crops a table taller than the terminal. The full
+        # table is printed once streaming finishes.
+        now = datetime.now(tz=UTC)
+        with Live(console=console, refresh_per_second=10, get_renderable=render_table):
+            rows.extend(
+                (archive.name, utils.calculate_archive_age(archive.name, now), archive.id)
+                for archive in ctx.orchestrator.iter_archives(repo_info, passphrase=passphrase)
+            )
+
         logger.info(
             "Archive list command completed",
             repo_name=_repo_name(repo_info, name),
             repo_path=_repo_path(repo_info, path),
-            archive_count=len(archives),
+            archive_count=len(rows),
         )
-
-        console.rule(f"[bold]Archives for {_repo_name(repo_info, name)}[/]")
-        for archive in archives:
-            console.print(
-                f"  [bold {COLOR_HEX.sky}]{archive.name}[/]  "
-                f"[bold {COLOR_HEX.green}]Age: {utils.calculate_archive_age(archive.name)}[/]  "
-                f"[{COLOR_HEX.mauve}]ID: {archive.id}[/]"
-            )
-        console.rule()
     except Exception as error:
         logger.exception("Archive list command failed", error=str(error), repo_name=name, repo_path=path)
         print_error_and_exit(str(error), error=error)
@@ -7,14 +7,13 @@ from typing import Annotated, Literal, cast
 import yaml
 from cyclopts import App, Parameter
 from rich.panel import Panel
-from rich.syntax import Syntax
 from rich.text import Text
 from rich.tree import Tree
 
 from borgboi.cli.main import BorgBoiContext, ContextArg, print_error_and_exit
 from borgboi.config import Config, get_default_config_path, get_env_overrides, load_config_from_path
 from borgboi.core.logging import get_logger
-from borgboi.lib.colors import COLOR_HEX, PYGMENTS_STYLES
+from borgboi.lib.colors import COLOR_HEX
 from borgboi.rich_utils import console
 
 logger = get_logger(__name__)
@@ -95,6 +94,10 @@ def _render_tree_panel(config_dict: dict[str, object], env_overrides: dict[str,
 
 
 def _render_syntax_panel(config_dict: dict[str, object], output_format: str) -> None:
+    from rich.syntax import Syntax
+
+    from borgboi.lib.syntax_themes import PYGMENTS_STYLES
+
     if output_format == "json":
         output = json.dumps(config_dict, indent=2)
     else:
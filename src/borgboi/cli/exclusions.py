@@ -90,18 +90,16 @@ def exclusions_add(
     logger.info("Running exclusions add command", repo_name=name, pattern=pattern)
     try:
         repo_info = ctx.orchestrator.get_repo(name=name)
-        ctx.orchestrator.add_exclusion(repo_info, pattern)
+        line_number = ctx.orchestrator.add_exclusion(repo_info, pattern)
 
         excludes_path = ctx.config.borgboi_dir / f"{repo_info.name}_{ctx.config.excludes_filename}"
-        with excludes_path.open("r") as file_obj:
-            line_count = sum(1 for _ in file_obj)
         logger.info(
             "Exclusions add command completed",
             repo_name=repo_info.name,
             excludes_path=str(excludes_path),
-            line_number=line_count,
+            line_number=line_number,
         )
-        rich_utils.render_excludes_file(excludes_path.as_posix(), lines_to_highlight={line_count})
+        rich_utils.render_excludes_file(excludes_path.as_posix(), lines_to_highlight={line_number})
     except Exception as error:
         logger.exception("Exclusions add command failed", error=str(error), repo_name=name, pattern=pattern)
         print_error_and_exit(str(error), error=error)
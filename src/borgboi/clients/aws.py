@@ -0,0 +1,27 @@
+"""Shared boto3 session for BorgBoi's AWS clients.
+
+Every boto3 session resolves credentials (environment, shared config, SSO,
+IMDS/STS) independently the first time one of its clients signs a request.
+S3, CloudWatch, and DynamoDB clients are therefore all created from a single
+session per AWS profile so that credential discovery happens once per process.
+"""
+
+from functools import cache
+
+import boto3
+
+
+@cache
+def get_session(profile: str | None) -> boto3.session.Session:
+    """Return the process-wide boto3 session for an AWS profile.
+
+    boto3 sessions are not safe to create clients from concurrently, so clients
+    should be created up front rather than from worker threads.
+
+    Args:
+        profile: Named AWS profile, or None for the default credential chain
+
+    Returns:
+        The cached session for ``profile``
+    """
+    return boto3.session.Session(profile_name=profile) if profile else boto3.session.Session()
@@ -16,7 +16,9 @@ from borgboi.clients.borg_models import (
     RepoInfo,
     Repository,
     Stats,
+    construct_from_borg_json,
 )
+from borgboi.clients.utils.streams import iter_process_lines
 from borgboi.config import config
 from borgboi.core.logging import get_logger
 from borgboi.lib.utils import create_archive_name
@@ -178,17 +180,9 @@ def create_archive(
     if out_stream is None:
         raise RuntimeError("Failed to capture stderr stream")
 
-    while out_stream.readable():
-        line = out_stream.readline()
-        if not line:
-            if proc.stdout:
-                proc.stdout.close()
-            if proc.stderr:
-                proc.stderr.close()
-            break
-        yield line.decode("utf-8")
-
-    # stdout no longer readable so wait for return code
+    yield from iter_process_lines(proc, out_stream)
+
+    # stream reached EOF so wait for return code
     returncode = proc.wait()
     if returncode != 0 and returncode != 1:
         logger.error(
@@ -207,7 +201,7 @@ def info(repo_path: str, passphrase: str | None = None) -> RepoInfo:
     if result.returncode != 0 and result.returncode != 1:
         logger.error("Failed to get repository info", repo_path=repo_path, returncode=result.returncode)
         raise sp.CalledProcessError(returncode=result.returncode, cmd=cmd, output=result.stdout, stderr=result.stderr)
-    repo_info = RepoInfo.model_validate_json(result.stdout)
+    repo_info = construct_from_borg_json(RepoInfo, result.stdout)
     logger.debug(
         "Retrieved repository info",
         repo_path=repo_path,
@@ -302,17 +296,9 @@ def prune(
     if out_stream is None:
         raise RuntimeError("Failed to capture stderr stream")
 
-    while out_stream.readable():
-        line = out_stream.readline()
-        if not line:
-            if proc.stdout:
-                proc.stdout.close()
-            if proc.stderr:
-                proc.stderr.close()
-            break
-        yield line.decode("utf-8")
-
-    # stdout no longer readable so wait for return code
+    yield from iter_process_lines(proc, out_stream)
+
+    # stream reached EOF so wait for return code
     returncode = proc.wait()
     if returncode != 0 and returncode != 1:
         logger.error("Borg prune failed", repo_path=repo_path, returncode=returncode)
@@ -343,17 +329,9 @@ def compact(repo_path: str, log_json: bool = True, passphrase: str | None = None
     if out_stream is None:
         raise RuntimeError("Failed to capture stderr stream")
 
-    while out_stream.readable():
-        line = out_stream.readline()
-        if not line:
-            if proc.stdout:
-                proc.stdout.close()
-            if proc.stderr:
-                proc.stderr.close()
-            break
-        yield line.decode("utf-8")
-
-    # stdout no longer readable so wait for return code
+    yield from iter_process_lines(proc, out_stream)
+
+    # stream reached EOF so wait for return code
     returncode = proc.wait()
     if returncode != 0 and returncode != 1:
         logger.error("Borg compact failed", repo_path=repo_path, returncode=returncode)
@@ -394,17 +372,9 @@ def extract(repo_path: str, archive_name: str, log_json: bool = True, passphrase
     if out_stream is None:
         raise RuntimeError("Failed to capture stderr stream")
 
-    while out_stream.readable():
-        line = out_stream.readline()
-        if not line:
-            if proc.stdout:
-                proc.stdout.close()
-            if proc.stderr:
-                proc.stderr.close()
-            break
-        yield line.decode("utf-8")
-
-    # stdout no longer readable so wait for return code
+    yield from iter_process_lines(proc, out_stream)
+
+    # stream reached EOF so wait for return code
     returncode = proc.wait()
     if returncode != 0 and returncode != 1:
         raise sp.CalledProcessError(returncode=proc.returncode, cmd=cmd)
@@ -453,17 +423,9 @@ def delete(
     if out_stream is None:
         raise RuntimeError("Failed to capture stderr stream")
 
-    while out_stream.readable():
-        line = out_stream.readline()
-        if not line:
-            if proc.stdout:
-                proc.stdout.close()
-            if proc.stderr:
-                proc.stderr.close()
-            break
-        yield line.decode("utf-8")
-
-    # stdout no longer readable so wait for return code
+    yield from iter_process_lines(proc, out_stream)
+
+    # stream reached EOF so wait for return code
     returncode = proc.wait()
     if returncode != 0 and returncode != 1:
         logger.error("Borg repository delete failed", repo_path=repo_path, returncode=returncode, dry_run=dry_run)
@@ -521,17 +483,9 @@ def delete_archive(
     if out_stream is None:
         raise RuntimeError("Failed to capture stderr stream")
 
-    while out_stream.readable():
-        line = out_stream.readline()
-        if not line:
-            if proc.stdout:
-                proc.stdout.close()
-            if proc.stderr:
-                proc.stderr.close()
-            break
-        yield line.decode("utf-8")
-
-    # stdout no longer readable so wait for return code
+    yield from iter_process_lines(proc, out_stream)
+
+    # stream reached EOF so wait for return code
     returncode = proc.wait()
     if returncode != 0 and returncode != 1:
         logger.error(
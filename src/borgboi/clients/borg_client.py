@@ -5,9 +5,10 @@ It supports dependency injection for configuration and output handling,
 making it easier to test and customize behavior.
 """
 
+import functools
 import io
-import json
 import os
+import shutil
 import subprocess as sp
 import threading
 from collections.abc import Generator
@@ -22,8 +23,10 @@ from borgboi.clients.borg_models import (
     ArchiveInfo,
     DiffEntry,
     DiffResult,
+    ListArchivesOutput,
     RepoArchive,
     RepoInfo,
+    construct_from_borg_json,
 )
 from borgboi.config import BorgConfig, Config, get_config
 from borgboi.core.errors import BorgError, BorgExitCode
@@ -35,9 +38,45 @@ from borgboi.lib.utils import create_archive_name
 
 logger = get_logger(__name__)
 _STDERR_DRAIN_JOIN_TIMEOUT_SECONDS = 5.0
+# `borg list --json` emits one document for the whole repository, so archive
+# streaming uses a NUL-separated line format that can be parsed as it arrives.
+_ARCHIVE_LINE_FORMAT = "{archive}{NUL}{id}{NUL}{start:%Y-%m-%dT%H:%M:%S.%f}{NUL}{time:%Y-%m-%dT%H:%M:%S.%f}{NL}"
+_ARCHIVE_LINE_FIELD_COUNT = 4
 tracer = get_tracer(__name__)
 
 
+@functools.cache
+def _resolve_executable(executable: str) -> str:
+    """Resolve a bare executable name to an absolute path once per process.
+
+    subprocess only takes its posix_spawn fast path when the executable includes
+    a directory, so a bare `borg` would otherwise force the fork/exec path.
+    """
+    return shutil.which(executable) or executable
+
+
+def _spawn_args(cmd: list[str]) -> list[str]:
+    # Commands are also spawned with close_fds=False: descriptors Python opens are
+    # non-inheritable by default (PEP 446), so the child inherits nothing extra and
+    # the interpreter can skip the per-spawn descriptor sweep.
+    return [_resolve_executable(cmd[0]), *cmd[1:]]
+
+
+def _start_stderr_drain(proc: sp.Popen[bytes]) -> tuple[threading.Thread, list[bytes]]:
+    """Collect a process's stderr on a background thread until EOF."""
+    chunks: list[bytes] = []
+
+    def drain() -> None:
+        if proc.stderr is None:
+            return
+        while chunk := proc.stderr.read(65536):
+            chunks.append(chunk)
+
+    thread = threading.Thread(target=drain, name="borgboi-borg-stderr", daemon=True)
+    thread.start()
+    return thread, chunks
+
+
 @dataclass(frozen=True, slots=True)
 class ExtractedFileContent:
     """Archived file bytes plus whether extraction stopped at a size cap."""
@@ -153,7 +192,8 @@ class BorgClient:
                 },
             )
             env = self._build_env_with_passphrase(passphrase)
-            result = sp.run(cmd, check=False, capture_output=capture_output, text=True, env=env)  # noqa: S603
+            spawn_cmd = _spawn_args(cmd)
+            result = sp.run(spawn_cmd, check=False, capture_output=capture_output, text=True, env=env, close_fds=False)  # noqa: S603
             span.set_attribute("process.exit_code", result.returncode)
             self._handle_exit_code(result.returncode, cmd, result.stdout, result.stderr)
             return result
@@ -180,7 +220,7 @@ class BorgClient:
                 },
             )
             env = self._build_env_with_passphrase(passphrase)
-            result = sp.run(cmd, check=False, capture_output=True, env=env)  # noqa: S603
+            result = sp.run(_spawn_args(cmd), check=False, capture_output=True, env=env, close_fds=False)  # noqa: S603
             span.set_attribute("process.exit_code", result.returncode)
             stdout_text = result.stdout.decode("utf-8", errors="replace") if result.stdout else ""
             stderr_text = result.stderr.decode("utf-8", errors="replace") if result.stderr else ""
@@ -217,7 +257,7 @@ class BorgClient:
         try:
             with trace.use_span(span, end_on_exit=False):
                 env = self._build_env_with_passphrase(passphrase)
-                proc = sp.Popen(cmd, stdout=sp.DEVNULL, stderr=sp.PIPE, env=env)  # noqa: S603
+                proc = sp.Popen(_spawn_args(cmd), stdout=sp.DEVNULL, stderr=sp.PIPE, env=env, close_fds=False)  # noqa: S603
 
             # Borg progress messages use \r to overwrite the current terminal line.
             # TextIOWrapper's universal newlines translate \r, \n, and \r\n into \n,
@@ -243,6 +283,70 @@ class BorgClient:
         finally:
             span.end()
 
+    def _run_stdout_streaming_command(
+        self,
+        cmd: list[str],
+        passphrase: str | None = None,
+    ) -> Generator[str]:
+        """Run a Borg command and yield its stdout line by line.
+
+        Args:
+            cmd: Command to execute
+            passphrase: Optional passphrase for encrypted repos
+
+        Yields:
+            Lines from stdout with the trailing newline removed
+
+        Raises:
+            BorgError: If the command fails
+        """
+        subcommand = cmd[1] if len(cmd) > 1 else cmd[0]
+        span = tracer.start_span("borg.command.stream", kind=SpanKind.CLIENT)
+        set_span_attributes(
+            span,
+            {
+                "process.command.name": cmd[0],
+                "borgboi.borg.subcommand": subcommand,
+                "borgboi.stream_output": True,
+            },
+        )
+        try:
+            with trace.use_span(span, end_on_exit=False):
+                env = self._build_env_with_passphrase(passphrase)
+                proc = sp.Popen(_spawn_args(cmd), stdout=sp.PIPE, stderr=sp.PIPE, env=env, close_fds=False)  # noqa: S603
+
+            # stderr is drained while stdout streams; warnings (or --log-json output)
+            # could otherwise fill its pipe and block Borg before stdout reaches EOF.
+            stderr_thread, stderr_chunks = _start_stderr_drain(proc)
+
+            text_stream = (
+                io.TextIOWrapper(proc.stdout, encoding="utf-8", errors="replace", newline="\n") if proc.stdout else None
+            )
+
+            iteration_completed = False
+            try:
+                if text_stream is not None:
+                    for line in text_stream:
+                        yield line.rstrip("\n")
+                iteration_completed = True
+            finally:
+                if text_stream is not None:
+                    text_stream.close()
+                elif proc.stdout:
+                    proc.stdout.close()
+                if proc.poll() is None:
+                    proc.terminate()
+                returncode = proc.wait()
+                stderr_thread.join(timeout=_STDERR_DRAIN_JOIN_TIMEOUT_SECONDS)
+                stderr_text = b"".join(stderr_chunks).decode("utf-8", errors="replace")
+                if proc.stderr:
+                    proc.stderr.close()
+                span.set_attribute("process.exit_code", returncode)
+                if iteration_completed:
+                    self._handle_exit_code(returncode, cmd, stderr=stderr_text)
+        finally:
+            span.end()
+
     # Core Operations
 
     def init(
@@ -312,7 +416,7 @@ class BorgClient:
         logger.debug("Getting repository info via client", repo_path=repo_path)
         cmd = [self.executable_path, "info", "--json", repo_path]
         result = self._run_command(cmd, passphrase=passphrase)
-        repo_info = RepoInfo.model_validate_json(result.stdout)
+        repo_info = construct_from_borg_json(RepoInfo, result.stdout)
         logger.debug(
             "Retrieved repository info via client",
             repo_path=repo_path,
@@ -561,7 +665,7 @@ class BorgClient:
                 },
             )
             env = self._build_env_with_passphrase(passphrase)
-            proc = sp.Popen(cmd, stdout=sp.PIPE, stderr=sp.PIPE, env=env)  # noqa: S603
+            proc = sp.Popen(_spawn_args(cmd), stdout=sp.PIPE, stderr=sp.PIPE, env=env, close_fds=False)  # noqa: S603
             if proc.stdout is None:
                 msg = "borg extract stdout pipe was not created"
                 raise RuntimeError(msg)
@@ -757,11 +861,47 @@ class BorgClient:
         logger.debug("Listing archives via client", repo_path=repo_path)
         cmd = [self.executable_path, "list", "--json", repo_path]
         result = self._run_command(cmd, passphrase=passphrase)
-        data = json.loads(result.stdout)
-        archives = [RepoArchive.model_validate(arch) for arch in data.get("archives", [])]
+        archives = ListArchivesOutput.model_validate_json(result.stdout).archives
         logger.debug("Listed archives via client", repo_path=repo_path, archive_count=len(archives))
         return archives
 
+    def iter_archives(
+        self,
+        repo_path: str,
+        passphrase: str | None = None,
+    ) -> Generator[RepoArchive]:
+        """Yield archives in a repository as Borg lists them.
+
+        Unlike `list_archives`, archives are parsed one line at a time so callers
+        can render results before Borg has finished enumerating the repository.
+
+        Args:
+            repo_path: Path to the repository
+            passphrase: Passphrase for encrypted repos
+
+        Yields:
+            Archives in the order Borg lists them (oldest first)
+
+        Raises:
+            BorgError: If the command fails
+        """
+        logger.debug("Streaming archives via client", repo_path=repo_path)
+        cmd = [self.executable_path, "list", "--format", _ARCHIVE_LINE_FORMAT, repo_path]
+        for line in self._run_stdout_streaming_command(cmd, passphrase=passphrase):
+            if not line:
+                continue
+            fields = line.split("\0")
+            if len(fields) != _ARCHIVE_LINE_FIELD_COUNT:
+                logger.warning(
+                    "Skipping malformed archive list line",
+                    repo_path=repo_path,
+                    field_count=len(fields),
+                    expected_field_count=_ARCHIVE_LINE_FIELD_COUNT,
+                )
+                continue
+            archive, archive_id, start, time = fields
+            yield RepoArchive(archive=archive, id=archive_id, name=archive, start=start, time=time)
+
     def list_archive_contents(
         self,
         repo_path: str,
@@ -1,10 +1,13 @@
 from datetime import datetime
 from functools import cached_property
 from pathlib import Path
+from typing import cast
 
-from pydantic import BaseModel, Field, computed_field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, computed_field
 
 GIBIBYTES_IN_GIGABYTE = 0.93132257461548
+_GIGABYTES_PER_BYTE = 1 / (1024**3 * GIBIBYTES_IN_GIGABYTE)
+_JSON_OBJECT_ADAPTER = TypeAdapter(dict[str, object])
 
 
 class Stats(BaseModel):
@@ -17,6 +20,10 @@ class Stats(BaseModel):
 
 
 class RepoCache(BaseModel):
+    # Borg's info output is read-only once parsed; frozen keeps the cached
+    # *_gb values below from going stale.
+    model_config = ConfigDict(frozen=True)
+
     path: str
     stats: Stats
 
@@ -24,19 +31,19 @@ class RepoCache(BaseModel):
     @cached_property
     def total_size_gb(self) -> str:
         """Original size in gigabytes."""
-        return f"{(self.stats.total_size / 1024 / 1024 / 1024 / GIBIBYTES_IN_GIGABYTE):.2f}"
+        return f"{self.stats.total_size * _GIGABYTES_PER_BYTE:.2f}"
 
     @computed_field  # type: ignore[prop-decorator]
     @cached_property
     def total_csize_gb(self) -> str:
         """Compressed size in gigabytes."""
-        return f"{(self.stats.total_csize / 1024 / 1024 / 1024 / GIBIBYTES_IN_GIGABYTE):.2f}"
+        return f"{self.stats.total_csize * _GIGABYTES_PER_BYTE:.2f}"
 
     @computed_field  # type: ignore[prop-decorator]
     @cached_property
     def unique_csize_gb(self) -> str:
         """Deduplicated size in gigabytes."""
-        return f"{(self.stats.unique_csize / 1024 / 1024 / 1024 / GIBIBYTES_IN_GIGABYTE):.2f}"
+        return f"{self.stats.unique_csize * _GIGABYTES_PER_BYTE:.2f}"
 
 
 class Encryption(BaseModel):
@@ -50,6 +57,8 @@ class Repository(BaseModel):
 
 
 class RepoInfo(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     cache: RepoCache
     encryption: Encryption
     repository: Repository
@@ -86,7 +95,7 @@ class RepoArchive(BaseModel):
 
 
 class ListArchivesOutput(BaseModel):
-    archives: list[RepoArchive]
+    archives: list[RepoArchive] = Field(default_factory=list)
 
 
 class ArchivedFile(BaseModel):
@@ -123,3 +132,36 @@ class DiffResult(BaseModel):
     archive1: str
     archive2: str
     entries: list[DiffEntry] = Field(default_factory=list)
+
+
+def construct_from_borg_json[ModelT: BaseModel](model: type[ModelT], json_data: str | bytes) -> ModelT:
+    """Build a model from JSON that Borg itself produced, skipping per-field validation.
+
+    Nested model fields are constructed recursively and unknown keys are dropped,
+    as validation would. If a required field is missing the input is not the
+    shape Borg emits, so full validation runs instead and raises the usual
+    ``ValidationError``.
+
+    Args:
+        model: Model class to build
+        json_data: JSON document printed by a Borg ``--json`` command
+
+    Returns:
+        An instance of ``model``
+    """
+    return _construct_trusted(model, _JSON_OBJECT_ADAPTER.validate_json(json_data))
+
+
+def _construct_trusted[ModelT: BaseModel](model: type[ModelT], data: dict[str, object]) -> ModelT:
+    values: dict[str, object] = {}
+    for name, field in model.model_fields.items():
+        if name not in data:
+            if field.is_required():
+                return model.model_validate(data)
+            continue
+        value = data[name]
+        annotation = field.annotation
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel) and isinstance(value, dict):
+            value = _construct_trusted(annotation, cast(dict[str, object], value))
+        values[name] = value
+    return model.model_construct(_fields_set=set(values), **values)
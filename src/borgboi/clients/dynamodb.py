@@ -2,12 +2,12 @@ import socket
 from datetime import datetime
 from typing import cast
 
-import boto3
 from boto3.dynamodb.conditions import Key
 from botocore.config import Config
 from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
 from borgboi import validator
+from borgboi.clients.aws import get_session
 from borgboi.clients.borg_client import BorgClient, create_borg_client
 from borgboi.config import config
 from borgboi.core.logging import get_logger
@@ -15,7 +15,13 @@ from borgboi.lib.passphrase import resolve_passphrase
 from borgboi.models import BorgBoiRepo, RetentionPolicy
 from borgboi.rich_utils import console
 
-boto_config = Config(retries={"mode": "standard"})
+boto_config = Config(
+    retries={"mode": "standard"},
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    connect_timeout=3,
+    read_timeout=10,
+)
 logger = get_logger(__name__)
 
 
@@ -166,7 +172,9 @@ def add_repo_to_table(repo: BorgBoiRepo) -> None:
         repo_path=repo.path,
         table_name=config.aws.dynamodb_repos_table,
     )
-    table = boto3.resource("dynamodb", config=boto_config).Table(config.aws.dynamodb_repos_table)
+    table = (
+        get_session(config.aws.profile).resource("dynamodb", config=boto_config).Table(config.aws.dynamodb_repos_table)
+    )
     table.put_item(Item=_convert_repo_to_table_item(repo).model_dump(exclude_none=True))
     logger.info("Repository added to DynamoDB table", repo_name=repo.name, repo_path=repo.path)
     console.print(f"Added repo to DynamoDB table: [bold cyan]{repo.path}[/]")
@@ -180,7 +188,9 @@ def get_all_repos() -> list[BorgBoiRepo]:
         list[BorgBoiRepo]: List of Borg repositories
     """
     logger.debug("Listing repositories from DynamoDB client", table_name=config.aws.dynamodb_repos_table)
-    table = boto3.resource("dynamodb", config=boto_config).Table(config.aws.dynamodb_repos_table)
+    table = (
+        get_session(config.aws.profile).resource("dynamodb", config=boto_config).Table(config.aws.dynamodb_repos_table)
+    )
     response = table.scan()
     db_repo_items: list[BorgBoiRepoTableItem] = []
     skipped_count = 0
@@ -217,7 +227,9 @@ def get_repo_by_path(repo_path: str, hostname: str = socket.gethostname()) -> Bo
         BorgBoiRepo: Borg repository
     """
     logger.debug("Getting repository from DynamoDB client by path", repo_path=repo_path, hostname=hostname)
-    table = boto3.resource("dynamodb", config=boto_config).Table(config.aws.dynamodb_repos_table)
+    table = (
+        get_session(config.aws.profile).resource("dynamodb", config=boto_config).Table(config.aws.dynamodb_repos_table)
+    )
     response = table.get_item(Key={"repo_path": repo_path, "hostname": hostname})
     repo = _convert_table_item_to_repo(BorgBoiRepoTableItem.model_validate(response.get("Item")))
     logger.debug("Retrieved repository from DynamoDB client by path", repo_name=repo.name, repo_path=repo.path)
@@ -235,7 +247,9 @@ def get_repo_by_name(repo_name: str) -> BorgBoiRepo:
         BorgBoiRepo: Borg repository
     """
     logger.debug("Getting repository from DynamoDB client by name", repo_name=repo_name)
-    table = boto3.resource("dynamodb", config=boto_config).Table(config.aws.dynamodb_repos_table)
+    table = (
+        get_session(config.aws.profile).resource("dynamodb", config=boto_config).Table(config.aws.dynamodb_repos_table)
+    )
     response = table.query(
         IndexName="name_gsi",
         KeyConditionExpression=Key("repo_name").eq(repo_name),
@@ -254,7 +268,9 @@ def delete_repo(repo: BorgBoiRepo) -> None:
         repo (BorgBoiRepo): Borg repository to delete
     """
     logger.info("Deleting repository from DynamoDB table", repo_name=repo.name, repo_path=repo.path)
-    table = boto3.resource("dynamodb", config=boto_config).Table(config.aws.dynamodb_repos_table)
+    table = (
+        get_session(config.aws.profile).resource("dynamodb", config=boto_config).Table(config.aws.dynamodb_repos_table)
+    )
     table.delete_item(Key={"repo_path": repo.path, "hostname": repo.hostname})
     logger.info("Repository deleted from DynamoDB table", repo_name=repo.name, repo_path=repo.path)
     console.print(f"Deleted repo from DynamoDB table: [bold cyan]{repo.path}[/]")
@@ -268,7 +284,9 @@ def update_repo(repo: BorgBoiRepo) -> None:
         repo (BorgBoiRepo): Borg repository to update
     """
     logger.info("Updating repository in DynamoDB table", repo_name=repo.name, repo_path=repo.path)
-    table = boto3.resource("dynamodb", config=boto_config).Table(config.aws.dynamodb_repos_table)
+    table = (
+        get_session(config.aws.profile).resource("dynamodb", config=boto_config).Table(config.aws.dynamodb_repos_table)
+    )
     table.put_item(Item=_convert_repo_to_table_item(repo).model_dump(exclude_none=True))
     logger.info("Repository updated in DynamoDB table", repo_name=repo.name, repo_path=repo.path)
     console.print(f"Updated repo in DynamoDB table: [bold cyan]{repo.path}[/]")
@@ -292,7 +310,11 @@ def add_archive_to_table(item: BorgBoiArchiveTableItem) -> None:
         archive_name=item.archive_name,
         table_name=config.aws.dynamodb_archives_table,
     )
-    table = boto3.resource("dynamodb", config=boto_config).Table(config.aws.dynamodb_archives_table)
+    table = (
+        get_session(config.aws.profile)
+        .resource("dynamodb", config=boto_config)
+        .Table(config.aws.dynamodb_archives_table)
+    )
     table.put_item(Item=item.model_dump(exclude_none=True))
     logger.info("Archive added to DynamoDB table", repo_name=item.repo_name, archive_name=item.archive_name)
     console.print(f"Added archive to DynamoDB table: [bold cyan]{item.archive_name}[/]")
@@ -309,7 +331,11 @@ def get_archives_by_repo(repo_name: str) -> list[BorgBoiArchiveTableItem]:
         List of archive metadata items
     """
     logger.debug("Getting archives from DynamoDB client by repository", repo_name=repo_name)
-    table = boto3.resource("dynamodb", config=boto_config).Table(config.aws.dynamodb_archives_table)
+    table = (
+        get_session(config.aws.profile)
+        .resource("dynamodb", config=boto_config)
+        .Table(config.aws.dynamodb_archives_table)
+    )
     response = table.query(
         KeyConditionExpression=Key("repo_name").eq(repo_name),
     )
@@ -331,7 +357,11 @@ def get_archive_by_id(archive_id: str) -> BorgBoiArchiveTableItem | None:
         Archive metadata if found, None otherwise
     """
     logger.debug("Getting archive from DynamoDB client by ID", archive_id=archive_id)
-    table = boto3.resource("dynamodb", config=boto_config).Table(config.aws.dynamodb_archives_table)
+    table = (
+        get_session(config.aws.profile)
+        .resource("dynamodb", config=boto_config)
+        .Table(config.aws.dynamodb_archives_table)
+    )
     response = table.query(
         IndexName="archive_id_gsi",
         KeyConditionExpression=Key("archive_id").eq(archive_id),
@@ -357,7 +387,11 @@ def get_archives_by_hostname(hostname: str) -> list[BorgBoiArchiveTableItem]:
         List of archive metadata items
     """
     logger.debug("Getting archives from DynamoDB client by hostname", hostname=hostname)
-    table = boto3.resource("dynamodb", config=boto_config).Table(config.aws.dynamodb_archives_table)
+    table = (
+        get_session(config.aws.profile)
+        .resource("dynamodb", config=boto_config)
+        .Table(config.aws.dynamodb_archives_table)
+    )
     response = table.query(
         IndexName="hostname_gsi",
         KeyConditionExpression=Key("hostname").eq(hostname),
@@ -376,7 +410,11 @@ def delete_archive(repo_name: str, iso_timestamp: str) -> None:
         iso_timestamp: ISO timestamp of the archive (sort key)
     """
     logger.info("Deleting archive from DynamoDB table", repo_name=repo_name, iso_timestamp=iso_timestamp)
-    table = boto3.resource("dynamodb", config=boto_config).Table(config.aws.dynamodb_archives_table)
+    table = (
+        get_session(config.aws.profile)
+        .resource("dynamodb", config=boto_config)
+        .Table(config.aws.dynamodb_archives_table)
+    )
     table.delete_item(Key={"repo_name": repo_name, "iso_timestamp": iso_timestamp})
     logger.info("Archive deleted from DynamoDB table", repo_name=repo_name, iso_timestamp=iso_timestamp)
     console.print(f"Deleted archive from DynamoDB table: [bold cyan]{repo_name}::{iso_timestamp}[/]")
@@ -26,8 +26,7 @@ def _get_repo_metadata(repo_name: str) -> BorgBoiRepo | None:
     metadata_file = METADATA_DIR / f"{repo_name}.json"
     logger.debug("Loading offline repository metadata", repo_name=repo_name, metadata_file=str(metadata_file))
     if metadata_file.exists():
-        with metadata_file.open("r") as f:
-            metadata = BorgBoiRepo.model_validate_json(f.read())
+        metadata = BorgBoiRepo.model_validate_json(metadata_file.read_bytes())
         logger.debug("Loaded offline repository metadata", repo_name=repo_name, metadata_file=str(metadata_file))
         return metadata
     logger.debug("Offline repository metadata not found", repo_name=repo_name, metadata_file=str(metadata_file))
@@ -10,13 +10,14 @@ from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import IO, TYPE_CHECKING, Protocol, cast
 
-import boto3
 from botocore.config import Config as BotoConfig
 from botocore.exceptions import BotoCoreError, ClientError
 
 if TYPE_CHECKING:
     from mypy_boto3_s3.client import S3Client
 
+from borgboi.clients.aws import get_session
+from borgboi.clients.utils.streams import iter_process_lines
 from borgboi.config import Config, get_config
 from borgboi.core.errors import StorageError
 from borgboi.core.logging import get_logger
@@ -94,7 +95,7 @@ _STORAGE_TYPE_BREAKDOWN: dict[str, tuple[str, str]] = {
 
 def _create_cloudwatch_client(cfg: Config) -> CloudWatchClientProtocol:
     """Create a CloudWatch client using configured AWS region/profile."""
-    session = boto3.session.Session(profile_name=cfg.aws.profile) if cfg.aws.profile else boto3.session.Session()
+    session = get_session(cfg.aws.profile)
     return cast(
         CloudWatchClientProtocol,
         session.client(
@@ -107,7 +108,7 @@ def _create_cloudwatch_client(cfg: Config) -> CloudWatchClientProtocol:
 
 def _create_s3_client(cfg: Config) -> S3Client:
     """Create an S3 client using configured AWS region/profile."""
-    session = boto3.session.Session(profile_name=cfg.aws.profile) if cfg.aws.profile else boto3.session.Session()
+    session = get_session(cfg.aws.profile)
     return session.client(
         "s3",
         region_name=cfg.aws.region,
@@ -358,7 +359,7 @@ def _get_inventory_manifest(
     if not isinstance(manifest_bytes, bytes):
         return None
 
-    manifest_json = json.loads(manifest_bytes.decode("utf-8"))
+    manifest_json = json.loads(manifest_bytes)
     if not isinstance(manifest_json, dict):
         return None
 
@@ -729,17 +730,9 @@ def sync_with_s3(repo_path: str, repo_name: str, cfg: Config | None = None) -> G
     if not out_stream:
         raise ValueError("stdout is None")
 
-    while out_stream.readable():
-        line = out_stream.readline()
-        if not line:
-            if proc.stdout:
-                proc.stdout.close()
-            if proc.stderr:
-                proc.stderr.close()
-            break
-        yield line.decode("utf-8")
+    yield from iter_process_lines(proc, out_stream)
 
-    # stdout no longer readable so wait for return code
+    # stream reached EOF so wait for return code
     returncode = proc.wait()
     if returncode != 0:
         logger.error("S3 sync failed", repo_path=repo_path, repo_name=repo_name, returncode=returncode)
@@ -793,17 +786,9 @@ def restore_from_s3(repo_path: str, repo_name: str, dry_run: bool, cfg: Config |
     if not out_stream:
         raise ValueError("stdout is None")
 
-    while out_stream.readable():
-        line = out_stream.readline()
-        if not line:
-            if proc.stdout:
-                proc.stdout.close()
-            if proc.stderr:
-                proc.stderr.close()
-            break
-        yield line.decode("utf-8")
+    yield from iter_process_lines(proc, out_stream)
 
-    # stdout no longer readable so wait for return code
+    # stream reached EOF so wait for return code
     returncode = proc.wait()
     if returncode != 0:
         logger.error(
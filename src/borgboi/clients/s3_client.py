@@ -8,6 +8,7 @@ for testing and different S3 backends.
 import io
 import json
 import subprocess as sp
+import threading
 from abc import ABC, abstractmethod
 from collections.abc import Generator
 from datetime import datetime
@@ -21,6 +22,15 @@ from borgboi.storage.models import S3RepoStats
 
 logger = get_logger(__name__)
 
+# Borg's transient repository lock files. They exist only while a Borg command
+# holds the repository (e.g. the `borg info` that runs during a daily backup's
+# S3 sync) and must never be uploaded, or a restored copy would appear locked.
+_BORG_LOCK_EXCLUDE_ARGS = ("--exclude", "lock.exclusive/*", "--exclude", "lock.roster")
+# Pipe reads pull up to this many bytes per syscall; a verbose `aws s3 sync`
+# emits one line per object, so small reads would dominate the loop.
+_STREAM_READ_BUFFER_BYTES = 64 * 1024
+_STDERR_DRAIN_JOIN_TIMEOUT_SECONDS = 5.0
+
 
 class S3ClientInterface(ABC):
     """Abstract interface for S3 operations.
@@ -172,10 +182,23 @@ class S3Client(S3ClientInterface):
         Raises:
             StorageError: If the command fails
         """
-        proc = sp.Popen(cmd, stdout=sp.PIPE, stderr=sp.PIPE)  # noqa: S603
+        proc = sp.Popen(cmd, stdout=sp.PIPE, stderr=sp.PIPE, bufsize=_STREAM_READ_BUFFER_BYTES)  # noqa: S603
         if not proc.stdout:
             raise StorageError(f"{error_msg}: stdout is None")
 
+        # stderr is drained concurrently so that a chatty stderr (e.g. per-object
+        # warnings) cannot fill its pipe and stall the CLI while stdout is read.
+        stderr_chunks: list[bytes] = []
+
+        def drain_stderr() -> None:
+            if proc.stderr is None:
+                return
+            while chunk := proc.stderr.read(_STREAM_READ_BUFFER_BYTES):
+                stderr_chunks.append(chunk)
+
+        stderr_thread = threading.Thread(target=drain_stderr, name="borgboi-s3-stderr", daemon=True)
+        stderr_thread.start()
+
         # AWS CLI progress messages use \r to redraw the current terminal line.
         # Universal newlines normalize \r, \n, and \r\n so each update renders separately.
         text_stream = io.TextIOWrapper(proc.stdout, encoding="utf-8", errors="replace")
@@ -186,9 +209,10 @@ class S3Client(S3ClientInterface):
             text_stream.close()
 
         returncode = proc.wait()
+        stderr_thread.join(timeout=_STDERR_DRAIN_JOIN_TIMEOUT_SECONDS)
         try:
             if returncode != 0:
-                stderr = proc.stderr.read().decode("utf-8") if proc.stderr else ""
+                stderr = b"".join(stderr_chunks).decode("utf-8", errors="replace")
                 raise StorageError(f"{error_msg} (exit code {returncode}): {stderr}", operation="s3_sync")
         finally:
             if proc.stderr:
@@ -213,6 +237,7 @@ class S3Client(S3ClientInterface):
             self._s3_uri(repo_name),
             "--storage-class",
             self.storage_class,
+            *_BORG_LOCK_EXCLUDE_ARGS,
         ]
         logger.info(
             "S3 sync to bucket",
@@ -63,13 +63,19 @@ _JSON_OBJECT_ADAPTER = TypeAdapter(dict[str, object])
 _TYPED_EVENT_ADAPTER: TypeAdapter[ArchiveProgress | ProgressMessage | ProgressPercent | LogMessage | FileStatus] = (
     TypeAdapter(BorgLogEvent)
 )
+_SHAPE_CANDIDATES: tuple[
+    tuple[type[ArchiveProgress | ProgressPercent | ProgressMessage | FileStatus], frozenset[str]], ...
+] = tuple(
+    (model, frozenset(name for name, field in model.model_fields.items() if field.is_required()))
+    for model in (ArchiveProgress, ProgressPercent, ProgressMessage, FileStatus)
+)
+_MODELS_BY_TYPE: dict[str, type[ArchiveProgress | ProgressMessage | ProgressPercent | LogMessage | FileStatus]] = {
+    model.model_fields["type"].default: model
+    for model in (ArchiveProgress, ProgressMessage, ProgressPercent, LogMessage, FileStatus)
+}
 logger = get_logger(__name__)
 
 
-def _is_unknown_union_tag_error(exc: ValidationError) -> bool:
-    return any(error.get("type") == "union_tag_invalid" for error in exc.errors())
-
-
 def _normalize_payload_type(payload: dict[str, object]) -> None:
     """Borg sends type=progress_message for payloads that are semantically ProgressPercent."""
     if payload.get("type") == "progress_message" and ("current" in payload or "total" in payload):
@@ -77,38 +83,62 @@ def _normalize_payload_type(payload: dict[str, object]) -> None:
 
 
 def _parse_by_shape(payload: dict[str, object]) -> BorgLogEvent:
-    try:
-        return ArchiveProgress.model_validate(payload)
-    except ValidationError:
-        try:
-            return ProgressPercent.model_validate(payload)
-        except ValidationError:
+    # Models are tried in priority order, but only when the payload carries every
+    # key the model requires; a model missing a required key could never validate,
+    # so skipping it avoids raising and catching a ValidationError per candidate.
+    keys = payload.keys()
+    for model, required_keys in _SHAPE_CANDIDATES:
+        if required_keys <= keys:
             try:
-                return ProgressMessage.model_validate(payload)
+                return model.model_validate(payload)
             except ValidationError:
-                try:
-                    return FileStatus.model_validate(payload)
-                except ValidationError:
-                    return LogMessage.model_validate(payload)
+                continue
+    return LogMessage.model_validate(payload)
+
+
+def _may_be_percent_progress(log_line: str) -> bool:
+    # Keys appear quoted in the raw JSON while quotes inside string values are
+    # escaped, so a miss here reliably means neither key is present.
+    return '"current"' in log_line or '"total"' in log_line
 
 
 def parse_borg_log_line(log_line: str) -> BorgLogEvent:
     """Parse a Borg JSON log line into a strongly typed event model."""
+    # Fast path: well-formed typed events validate straight from JSON in one pass,
+    # without building an intermediate dict. ProgressMessage results only go through
+    # the payload path when they carry percent keys, because Borg reuses that type
+    # for percent-style progress. Lines that cannot be a JSON object (plain stderr)
+    # skip straight to the payload path, which rejects them with one failed parse.
+    if log_line.lstrip().startswith("{"):
+        try:
+            event = _TYPED_EVENT_ADAPTER.validate_json(log_line)
+        except ValidationError:
+            pass
+        else:
+            if not isinstance(event, ProgressMessage) or not _may_be_percent_progress(log_line):
+                return event
+    return _parse_borg_log_payload(log_line)
+
+
+def _parse_borg_log_payload(log_line: str) -> BorgLogEvent:
     payload = _JSON_OBJECT_ADAPTER.validate_json(log_line)
     if "type" in payload:
         payload_type = str(payload.get("type"))
         _normalize_payload_type(payload)
+        # Dispatch on the tag directly: an unknown tag goes to the shape fallback
+        # without raising a union_tag_invalid error just to detect it.
+        model = _MODELS_BY_TYPE.get(str(payload["type"]))
+        if model is None:
+            payload_without_type = {key: value for key, value in payload.items() if key != "type"}
+            logger.debug(
+                "Falling back to Borg log parsing by payload shape",
+                payload_type=payload_type,
+                payload_keys=sorted(payload_without_type),
+            )
+            return _parse_by_shape(payload_without_type)
         try:
-            return _TYPED_EVENT_ADAPTER.validate_python(payload)
+            return model.model_validate(payload)
         except ValidationError as exc:
-            if _is_unknown_union_tag_error(exc):
-                payload_without_type = {key: value for key, value in payload.items() if key != "type"}
-                logger.debug(
-                    "Falling back to Borg log parsing by payload shape",
-                    payload_type=payload_type,
-                    payload_keys=sorted(payload_without_type),
-                )
-                return _parse_by_shape(payload_without_type)
             logger.error(
                 "Failed to parse Borg log payload",
                 payload_type=payload_type,
@@ -0,0 +1,28 @@
+import io
+import subprocess as sp
+from collections.abc import Generator
+from typing import IO
+
+
+def iter_process_lines(proc: sp.Popen[bytes], stream: IO[bytes]) -> Generator[str]:
+    """Yield decoded lines from a subprocess pipe until EOF.
+
+    Borg and the AWS CLI redraw progress with a bare ``\\r``. Universal newlines
+    treat that as a line break too, so each redraw is yielded as soon as it is
+    written instead of stalling until the next ``\\n``.
+
+    Args:
+        proc: Process that owns ``stream``; its pipes are closed once iteration ends
+        stream: Binary pipe to read (stdout or stderr of ``proc``)
+
+    Yields:
+        Lines of output, newline-terminated
+    """
+    text_stream = io.TextIOWrapper(stream, encoding="utf-8", errors="replace")
+    try:
+        yield from text_stream
+    finally:
+        text_stream.close()
+        for pipe in (proc.stdout, proc.stderr):
+            if pipe is not None:
+                pipe.close()
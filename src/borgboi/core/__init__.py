@@ -4,6 +4,7 @@ This module contains the core models, error types, and orchestration logic
 for the BorgBoi backup system.
 """
 
+from importlib import import_module
 from typing import TYPE_CHECKING
 
 from borgboi.core.errors import (
@@ -34,17 +35,20 @@ if TYPE_CHECKING:
     from borgboi.core.validator import Validator
 
 
-def __getattr__(name: str) -> object:
-    """Lazy import for classes that may cause circular imports."""
-    if name == "Orchestrator":
-        from borgboi.core.orchestrator import Orchestrator
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "Orchestrator": "borgboi.core.orchestrator",
+    "Validator": "borgboi.core.validator",
+}
 
-        return Orchestrator
-    if name == "Validator":
-        from borgboi.core.validator import Validator
 
-        return Validator
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+def __getattr__(name: str) -> object:
+    """Lazy import for classes that may cause circular imports."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value: object = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
 
 
 __all__ = [
@@ -11,10 +11,11 @@ from functools import cached_property
 from pathlib import Path
 from platform import system
 
-from pydantic import BaseModel, Field, computed_field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, computed_field, field_validator, model_validator
 
 # Conversion factor for bytes to gigabytes (accounting for GiB vs GB)
 GIBIBYTES_IN_GIGABYTE = 0.93132257461548
+_GIGABYTES_PER_BYTE = 1 / (1024**3 * GIBIBYTES_IN_GIGABYTE)
 STORAGE_QUOTA_PATTERN = re.compile(r"^\d+(?:\.\d+)?[KMGT]?$")
 STORAGE_QUOTA_MULTIPLIERS = {
     "": 1,
@@ -175,6 +176,9 @@ class RepoStats(BaseModel):
 class RepoCache(BaseModel):
     """Borg repository cache information."""
 
+    # Read-only once parsed; frozen keeps the cached *_gb values below from going stale.
+    model_config = ConfigDict(frozen=True)
+
     path: str
     stats: RepoStats
 
@@ -182,19 +186,19 @@ class RepoCache(BaseModel):
     @cached_property
     def total_size_gb(self) -> str:
         """Original size in gigabytes."""
-        return f"{(self.stats.total_size / 1024 / 1024 / 1024 / GIBIBYTES_IN_GIGABYTE):.2f}"
+        return f"{self.stats.total_size * _GIGABYTES_PER_BYTE:.2f}"
 
     @computed_field  # type: ignore[prop-decorator]
     @cached_property
     def total_csize_gb(self) -> str:
         """Compressed size in gigabytes."""
-        return f"{(self.stats.total_csize / 1024 / 1024 / 1024 / GIBIBYTES_IN_GIGABYTE):.2f}"
+        return f"{self.stats.total_csize * _GIGABYTES_PER_BYTE:.2f}"
 
     @computed_field  # type: ignore[prop-decorator]
     @cached_property
     def unique_csize_gb(self) -> str:
         """Deduplicated size in gigabytes."""
-        return f"{(self.stats.unique_csize / 1024 / 1024 / 1024 / GIBIBYTES_IN_GIGABYTE):.2f}"
+        return f"{self.stats.unique_csize * _GIGABYTES_PER_BYTE:.2f}"
 
 
 class RepoEncryption(BaseModel):
@@ -217,6 +221,8 @@ class RepoMetadata(BaseModel):
     This is compatible with the existing borg.RepoInfo model.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     cache: RepoCache
     encryption: RepoEncryption
     repository: RepoLocation
@@ -4,10 +4,13 @@ This module provides the main Orchestrator class that coordinates all
 backup operations using dependency injection for testability.
 """
 
+import os
 import shutil
 import socket
+import stat
 import tempfile
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from platform import system
@@ -43,6 +46,14 @@ from borgboi.storage.base import RepositoryStorage
 logger = get_logger(__name__)
 tracer = get_tracer(__name__)
 
+# Excludes files are tiny pattern lists; anything larger is streamed instead of read into memory.
+_EXCLUDES_INLINE_COPY_MAX_BYTES = 16 * 1024 * 1024
+_EXCLUDES_READ_CHUNK_CHARS = 64 * 1024
+# Scratch locations that skip Borg's additional_free_space reservation: any `tmp`
+# path component, and macOS per-user temp directories under /private/var.
+_TMP_PATH_PARTS = frozenset({"tmp"})
+_MACOS_PRIVATE_VAR_PARTS = ("/", "private", "var")
+
 
 class Orchestrator:
     """Main orchestrator for BorgBoi operations.
@@ -81,6 +92,9 @@ class Orchestrator:
         self.borg = borg_client or create_borg_client(config=self.config)
         self.storage = storage
         self.s3: S3ClientInterface | None = s3_client
+        # Config.borgboi_dir re-resolves the home directory on every access, so
+        # paths under it are built once per filename and reused.
+        self._borgboi_file_paths: dict[str, Path] = {}
 
     # Repository Workflows
 
@@ -140,29 +154,28 @@ class Orchestrator:
             self.output.on_log("info", f"Passphrase saved to: {passphrase_file_path}")
 
             repo_path = Path(path)
-            if repo_path.is_file():
-                logger.error("Repository path is a file, not a directory", repo_path=str(repo_path))
-                raise ValidationError(f"Path {repo_path} is a file, not a directory", field="path")
-            if not repo_path.exists():
-                repo_path.mkdir(parents=True)
-                logger.debug("Created repository directory", repo_path=str(repo_path))
+            repo_posix = repo_path.as_posix()
+            try:
+                repo_path.mkdir(parents=True, exist_ok=True)
+            except FileExistsError as e:
+                logger.error("Repository path is a file, not a directory", repo_path=repo_posix)
+                raise ValidationError(f"Path {repo_path} is a file, not a directory", field="path") from e
+            logger.debug("Ensured repository directory exists", repo_path=repo_posix)
 
             config_free_space = not self._should_skip_additional_free_space(repo_path)
             if not config_free_space:
-                logger.debug(
-                    "Skipping additional_free_space config for tmp/private directory", repo_path=str(repo_path)
-                )
+                logger.debug("Skipping additional_free_space config for tmp/private directory", repo_path=repo_posix)
 
-            logger.debug("Initializing Borg repository", repo_path=str(repo_path), config_free_space=config_free_space)
+            logger.debug("Initializing Borg repository", repo_path=repo_posix, config_free_space=config_free_space)
             self.borg.init(
-                repo_path.as_posix(),
+                repo_posix,
                 passphrase=resolved_passphrase,
                 additional_free_space=self.config.borg.additional_free_space if config_free_space else None,
             )
 
-            repo_info = self.borg.info(repo_path.as_posix(), passphrase=resolved_passphrase)
+            repo_info = self.borg.info(repo_posix, passphrase=resolved_passphrase)
             repo = BorgBoiRepo(
-                path=repo_path.as_posix(),
+                path=repo_posix,
                 backup_target=backup_target,
                 name=name,
                 hostname=socket.gethostname(),
@@ -760,24 +773,99 @@ class Orchestrator:
             self.compact(resolved_repo, passphrase=resolved_passphrase)
 
             if sync_to_s3 and not self.config.offline and self.s3:
-                self.output.on_log("info", "Syncing to S3...")
-                logger.debug("Syncing repository to S3", repo_name=resolved_repo.name)
-                self.sync_to_s3(resolved_repo)
-            elif sync_to_s3:
-                logger.warning(
-                    "S3 sync requested but not available",
-                    offline=self.config.offline,
-                    s3_configured=self.s3 is not None,
-                )
-
-            logger.debug("Refreshing repository metadata after daily backup", repo_name=resolved_repo.name)
-            repo_info = self.borg.info(resolved_repo.path, passphrase=resolved_passphrase)
-            resolved_repo.metadata = repo_info
-            self.storage.save(resolved_repo)
+                # `borg info` only reads the repository, so it runs alongside the
+                # bandwidth-bound S3 upload instead of after it.
+                logger.debug("Refreshing repository metadata after daily backup", repo_name=resolved_repo.name)
+                with ThreadPoolExecutor(max_workers=1, thread_name_prefix="borgboi-info") as executor:
+                    info_future = executor.submit(self.borg.info, resolved_repo.path, passphrase=resolved_passphrase)
+                    self.output.on_log("info", "Syncing to S3...")
+                    logger.debug("Syncing repository to S3", repo_name=resolved_repo.name)
+                    self.sync_to_s3(resolved_repo)
+                    repo_info = info_future.result()
+                self._store_repo_metadata(resolved_repo, repo_info)
+            else:
+                if sync_to_s3:
+                    logger.warning(
+                        "S3 sync requested but not available",
+                        offline=self.config.offline,
+                        s3_configured=self.s3 is not None,
+                    )
+                logger.debug("Refreshing repository metadata after daily backup", repo_name=resolved_repo.name)
+                self._refresh_repo_metadata(resolved_repo, resolved_passphrase)
 
             logger.info("Daily backup completed successfully", repo_name=resolved_repo.name)
             self.output.on_log("info", "Daily backup completed successfully")
 
+    def daily_backup_all(
+        self,
+        repos: Sequence[BorgBoiRepo | str],
+        sync_to_s3: bool = True,
+        concurrency: int = 4,
+    ) -> dict[str, Exception]:
+        """Run daily backups for several repositories concurrently.
+
+        Each repository runs its own Borg subprocesses in a worker thread, so disk-bound
+        archiving in one repository overlaps with pruning or S3 sync in another.
+
+        Args:
+            repos: Repositories or repository names to back up
+            sync_to_s3: Whether to sync each repository to S3 after backup
+            concurrency: Maximum number of repositories backed up at once
+
+        Returns:
+            Mapping of repository name to the error that failed its backup (empty on success)
+
+        Raises:
+            ValueError: If concurrency is less than 1
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        resolved_repos = [self._resolve_repo(repo) for repo in repos]
+        logger.info(
+            "Starting daily backup for multiple repositories", repo_count=len(resolved_repos), concurrency=concurrency
+        )
+
+        failures: dict[str, Exception] = {}
+        backup: Callable[[BorgBoiRepo, bool], None] = (
+            self._daily_backup_buffered
+            if concurrency > 1 and len(resolved_repos) > 1
+            else self._daily_backup_unbuffered
+        )
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="borgboi-daily") as executor:
+            futures = {executor.submit(backup, repo, sync_to_s3): repo for repo in resolved_repos}
+            for future in as_completed(futures):
+                repo = futures[future]
+                try:
+                    future.result()
+                except Exception as error:
+                    logger.exception("Daily backup failed", repo_name=repo.name, error=str(error))
+                    failures[repo.name] = error
+
+        logger.info(
+            "Daily backup for multiple repositories finished",
+            repo_count=len(resolved_repos),
+            failure_count=len(failures),
+        )
+        return failures
+
+    def _daily_backup_unbuffered(self, repo: BorgBoiRepo, sync_to_s3: bool) -> None:
+        """Run a daily backup writing straight to the output handler."""
+        self.daily_backup(repo, sync_to_s3=sync_to_s3)
+
+    def _daily_backup_buffered(self, repo: BorgBoiRepo, sync_to_s3: bool) -> None:
+        """Run a daily backup with its output captured and printed as one block.
+
+        The default console handler gives each concurrent worker its own console via
+        `DefaultOutputHandler.buffered`, so their spinners and log lines don't collide.
+        Other handlers receive the output directly.
+        """
+        if isinstance(self.output, DefaultOutputHandler):
+            with self.output.buffered():
+                self.daily_backup(repo, sync_to_s3=sync_to_s3)
+        else:
+            self.daily_backup(repo, sync_to_s3=sync_to_s3)
+
     def restore_archive(
         self,
         repo: BorgBoiRepo | str,
@@ -861,9 +949,7 @@ class Orchestrator:
             self.compact(resolved_repo, passphrase=resolved_passphrase)
 
             logger.debug("Refreshing repository metadata after archive deletion", repo_name=resolved_repo.name)
-            repo_info = self.borg.info(resolved_repo.path, passphrase=resolved_passphrase)
-            resolved_repo.metadata = repo_info
-            self.storage.save(resolved_repo)
+            self._refresh_repo_metadata(resolved_repo, resolved_passphrase)
             logger.info(
                 "Archive deleted and repository metadata refreshed",
                 repo_name=resolved_repo.name,
@@ -1065,6 +1151,25 @@ class Orchestrator:
 
         return self.borg.list_archives(resolved_repo.path, passphrase=resolved_passphrase)
 
+    def iter_archives(
+        self,
+        repo: BorgBoiRepo | str,
+        passphrase: str | None = None,
+    ) -> Iterator[RepoArchive]:
+        """Stream archives in a repository as Borg lists them.
+
+        Args:
+            repo: Repository or repository name
+            passphrase: Optional passphrase override
+
+        Yields:
+            Archives in the order Borg lists them (oldest first)
+        """
+        resolved_repo = self._resolve_repo(repo)
+        resolved_passphrase = self.resolve_passphrase(resolved_repo, passphrase)
+
+        yield from self.borg.iter_archives(resolved_repo.path, passphrase=resolved_passphrase)
+
     def get_repo_info(
         self,
         repo: BorgBoiRepo | str,
@@ -1225,11 +1330,11 @@ class Orchestrator:
             raise ValidationError("Exclude list already created", field="excludes")
 
         excludes_path.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy(source_file, excludes_path.as_posix())
-
-        if not excludes_path.exists():
+        try:
+            self._copy_excludes_file(Path(source_file), excludes_path)
+        except OSError as e:
             logger.error("Failed to create exclusion list", repo_name=resolved_repo.name, source_file=source_file)
-            raise StorageError("Excludes list not created", operation="create_exclusions")
+            raise StorageError("Excludes list not created", operation="create_exclusions", cause=e) from e
 
         logger.info(
             "Exclusion list created",
@@ -1262,12 +1367,15 @@ class Orchestrator:
         logger.debug("Retrieved exclusion patterns", repo_name=resolved_repo.name, count=len(patterns))
         return patterns
 
-    def add_exclusion(self, repo: BorgBoiRepo | str, pattern: str) -> None:
+    def add_exclusion(self, repo: BorgBoiRepo | str, pattern: str) -> int:
         """Add an exclusion pattern.
 
         Args:
             repo: Repository or repository name
             pattern: Exclusion pattern to add
+
+        Returns:
+            1-based line number of the added pattern
         """
         resolved_repo = self._resolve_repo(repo)
         excludes_path = self._get_excludes_path(resolved_repo.name)
@@ -1277,11 +1385,19 @@ class Orchestrator:
             raise ValidationError("Exclude list not created", field="excludes")
 
         logger.debug("Adding exclusion pattern", repo_name=resolved_repo.name, pattern=pattern)
-        with excludes_path.open("a") as f:
+        # Count existing lines in the same open used for the append so callers
+        # don't need to re-read the file to locate the new pattern.
+        newline_count = 0
+        with excludes_path.open("r+") as f:
+            while chunk := f.read(_EXCLUDES_READ_CHUNK_CHARS):
+                newline_count += chunk.count("\n")
+            f.seek(0, os.SEEK_END)
             f.write(pattern + "\n")
+        line_number = newline_count + 1
 
-        logger.info("Added exclusion pattern", repo_name=resolved_repo.name, pattern=pattern)
+        logger.info("Added exclusion pattern", repo_name=resolved_repo.name, pattern=pattern, line_number=line_number)
         self.output.on_log("info", f"Added exclusion pattern: {pattern}")
+        return line_number
 
     def remove_exclusion(self, repo: BorgBoiRepo | str, line_number: int) -> None:
         """Remove an exclusion pattern by line number.
@@ -1297,23 +1413,39 @@ class Orchestrator:
             logger.info("Cannot remove exclusion, list not created", repo_name=resolved_repo.name)
             raise ValidationError("Exclude list not created", field="excludes")
 
-        with excludes_path.open("r") as f:
-            lines = f.readlines()
-
-        if line_number < 1 or line_number > len(lines):
+        # Stream the surviving lines into a sibling temp file and swap it in, so
+        # large lists are never held in memory and are rewritten in one pass.
+        removed_pattern: str | None = None
+        total_lines = 0
+        with (
+            excludes_path.open("r") as src,
+            tempfile.NamedTemporaryFile(
+                "w", dir=excludes_path.parent, prefix=f".{excludes_path.name}.", delete=False
+            ) as dst,
+        ):
+            tmp_path = Path(dst.name)
+            try:
+                os.fchmod(dst.fileno(), stat.S_IMODE(os.fstat(src.fileno()).st_mode))
+                for total_lines, line in enumerate(src, start=1):
+                    if total_lines == line_number:
+                        removed_pattern = line.strip()
+                    else:
+                        dst.write(line)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
+
+        if removed_pattern is None:
+            tmp_path.unlink(missing_ok=True)
             logger.error(
                 "Invalid line number for exclusion removal",
                 repo_name=resolved_repo.name,
                 line_number=line_number,
-                total_lines=len(lines),
+                total_lines=total_lines,
             )
             raise ValidationError(f"Invalid line number: {line_number}", field="line_number")
 
-        removed_pattern = lines[line_number - 1].strip()
-        lines.pop(line_number - 1)
-
-        with excludes_path.open("w") as f:
-            f.writelines(lines)
+        tmp_path.replace(excludes_path)
 
         logger.info(
             "Removed exclusion pattern",
@@ -1380,9 +1512,24 @@ class Orchestrator:
                 f"Unable to resolve {label.lower()}: {normalized_path}", field=field, value=normalized_path
             ) from error
 
+    def _refresh_repo_metadata(self, repo: BorgBoiRepo, passphrase: str | None) -> None:
+        """Fetch `borg info` for a repository and persist it."""
+        self._store_repo_metadata(repo, self.borg.info(repo.path, passphrase=passphrase))
+
+    def _store_repo_metadata(self, repo: BorgBoiRepo, repo_info: RepoInfo) -> None:
+        """Persist freshly fetched `borg info` output, writing only the metadata field."""
+        repo.metadata = repo_info
+        self.storage.update_fields(repo, ("metadata",))
+
     def _should_skip_additional_free_space(self, repo_path: Path) -> bool:
         """Return whether additional free space should be skipped for this repository path."""
-        return "/private/var/" in str(repo_path) or "tmp" in repo_path.parts
+        parts = repo_path.parts
+        if (
+            len(parts) > len(_MACOS_PRIVATE_VAR_PARTS)
+            and parts[: len(_MACOS_PRIVATE_VAR_PARTS)] == _MACOS_PRIVATE_VAR_PARTS
+        ):
+            return True
+        return not _TMP_PATH_PARTS.isdisjoint(parts)
 
     def _get_directory_size_bytes(self, directory: Path) -> int:
         """Return the total size in bytes for all files under a directory."""
@@ -1512,11 +1659,18 @@ class Orchestrator:
         Returns:
             Path to excludes file
         """
-        return self.config.borgboi_dir / f"{repo_name}_{self.config.excludes_filename}"
+        return self._get_borgboi_file_path(f"{repo_name}_{self.config.excludes_filename}")
 
     def _get_default_excludes_path(self) -> Path:
         """Get the default shared excludes file path."""
-        return self.config.borgboi_dir / self.config.excludes_filename
+        return self._get_borgboi_file_path(self.config.excludes_filename)
+
+    def _get_borgboi_file_path(self, filename: str) -> Path:
+        """Get the path to a file directly under the borgboi directory, memoised per filename."""
+        file_path = self._borgboi_file_paths.get(filename)
+        if file_path is None:
+            file_path = self._borgboi_file_paths[filename] = self.config.borgboi_dir / filename
+        return file_path
 
     def _resolve_excludes_path_for_backup(self, repo_name: str) -> Path:
         """Resolve excludes file for backup.
@@ -1556,6 +1710,19 @@ class Orchestrator:
 
         return None
 
+    def _copy_excludes_file(self, source_path: Path, excludes_path: Path) -> None:
+        """Copy an excludes source file without mirroring its permission bits.
+
+        Small files are copied with a single read and a single write, sized with
+        fstat on the already-open source; files above the inline limit fall back
+        to a streamed `shutil.copyfile`.
+        """
+        with source_path.open("rb") as source:
+            if os.fstat(source.fileno()).st_size <= _EXCLUDES_INLINE_COPY_MAX_BYTES:
+                excludes_path.write_bytes(source.read())
+                return
+        shutil.copyfile(source_path, excludes_path)
+
     def _delete_excludes_file(self, repo_name: str) -> None:
         """Delete a repository's excludes file.
 
@@ -1563,10 +1730,12 @@ class Orchestrator:
             repo_name: Repository name
         """
         excludes_path = self._get_excludes_path(repo_name)
-        if excludes_path.exists():
+        try:
             excludes_path.unlink()
-            logger.info("Deleted excludes file", repo_name=repo_name, excludes_path=str(excludes_path))
-            self.output.on_log("info", f"Deleted excludes file for {repo_name}")
+        except FileNotFoundError:
+            return
+        logger.info("Deleted excludes file", repo_name=repo_name, excludes_path=str(excludes_path))
+        self.output.on_log("info", f"Deleted excludes file for {repo_name}")
 
     def _auto_migrate_passphrase(self, repo: BorgBoiRepo) -> BorgBoiRepo:
         """Auto-migrate passphrase to file storage if needed.
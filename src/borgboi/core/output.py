@@ -4,11 +4,17 @@ This module provides abstractions for handling output from Borg commands,
 allowing for flexible output processing (console, logging, silent, etc.).
 """
 
+import io
+import threading
+from collections import deque
 from collections.abc import Generator, Iterable
 from contextlib import AbstractContextManager, contextmanager, nullcontext
+from time import monotonic
 from typing import Protocol
 
 from pydantic import ValidationError
+from rich.console import Console, Group
+from rich.text import Text
 
 from borgboi.clients.utils.borg_logs import (
     ArchiveProgress,
@@ -21,6 +27,18 @@ from borgboi.clients.utils.borg_logs import (
 from borgboi.core.logging import get_logger
 from borgboi.lib.utils import format_size_bytes
 
+# Streamed command output keeps only the most recent lines on screen and redraws
+# them at most once per interval, so high-volume file listings do not pay for a
+# full Rich render per line. The tail is rebuilt (and batched log lines flushed,
+# which forces a redraw of the live region) at most once per spinner frame, since
+# anything faster is never shown.
+_COMMAND_TAIL_LINES = 20
+_COMMAND_TAIL_REFRESH_PER_SECOND = 8
+_COMMAND_TAIL_UPDATE_INTERVAL_SECONDS = 1 / _COMMAND_TAIL_REFRESH_PER_SECOND
+# Non-interactive output is flushed in batches of at most this many lines or this age.
+_BATCHED_OUTPUT_MAX_LINES = 512
+_BATCHED_OUTPUT_INTERVAL_SECONDS = 0.1
+
 _PROGRESS_MSGID_LABELS: dict[str, str] = {
     "cache.begin_transaction": "Cache initialization",
     "cache.commit": "Cache commit",
@@ -40,6 +58,12 @@ def _humanize_msgid(msgid: str | None) -> str:
     return msgid.replace(".", " ").replace("_", " ").title()
 
 
+def _tail_line(markup: str) -> Text:
+    text = Text.from_markup(markup, overflow="ellipsis")
+    text.no_wrap = True
+    return text
+
+
 class BaseOutputHandler(Protocol):
     """Compatibility protocol for Borg operation output handlers.
 
@@ -200,10 +224,73 @@ class DefaultOutputHandler:
     """Default output handler that prints to Rich console."""
 
     def __init__(self) -> None:
+        # Per-thread so concurrent commands (e.g. multi-repo daily backups) keep separate tails.
+        self._render_state = threading.local()
+
+    @property
+    def _console(self) -> Console:
         # Lazy import to avoid circular dependency
-        from borgboi.rich_utils import console
+        from borgboi.rich_utils import get_console
 
-        self._console = console
+        return get_console()
+
+    @contextmanager
+    def buffered(self) -> Generator[None]:
+        """Capture this context's output and print it as one block when the body exits.
+
+        Used by concurrent workers: each gets a private non-interactive console, so
+        no live spinner competes for the shared console and output doesn't interleave.
+        """
+        from borgboi.rich_utils import scoped_console
+
+        shared = self._console
+        buffer = io.StringIO()
+        # Styles are captured at full fidelity; the shared console downsamples on replay.
+        worker_console = Console(
+            file=buffer, width=shared.width, color_system="truecolor" if shared.color_system else None
+        )
+        try:
+            with scoped_console(worker_console):
+                yield
+        finally:
+            captured = buffer.getvalue()
+            if captured:
+                shared.print(Text.from_ansi(captured), end="")
+
+    def _active_tail(self) -> deque[str] | None:
+        tail: deque[str] | None = getattr(self._render_state, "tail", None)
+        return tail
+
+    def _print_log(self, markup: str) -> None:
+        """Print a permanent log line, batching it while a command is streaming."""
+        pending: list[str] | None = getattr(self._render_state, "pending_logs", None)
+        if pending is None:
+            self._console.print(markup)
+        else:
+            pending.append(markup)
+
+    def _flush_pending_logs(self) -> None:
+        """Print batched log lines with one console write (and one live refresh)."""
+        pending: list[str] | None = getattr(self._render_state, "pending_logs", None)
+        if not pending:
+            return
+        # Each line is rendered separately so unbalanced markup cannot bleed into the next.
+        self._console.print(*(self._console.render_str(markup) for markup in pending), sep="\n")
+        pending.clear()
+
+    def _emit(self, markup: str) -> None:
+        """Print a line, or buffer it in the live tail while a command is streaming."""
+        tail = self._active_tail()
+        if tail is None:
+            self._print_log(markup)
+        else:
+            tail.append(markup)
+
+    def _build_tail_renderable(self, status_markup: str) -> Group:
+        tail = self._active_tail() or ()
+        progress: str | None = getattr(self._render_state, "progress", None)
+        lines = [*tail, progress] if progress else list(tail)
+        return Group(Text.from_markup(status_markup), *(_tail_line(line) for line in lines))
 
     def on_progress(self, current: int, total: int, info: str | None = None) -> None:
         """Print progress to console."""
@@ -214,6 +301,14 @@ class DefaultOutputHandler:
             msg = f"Progress: {current}"
         if info:
             msg += f" - {info}"
+        if self._active_tail() is not None:
+            self._render_state.progress = msg
+            return
+        if getattr(self._render_state, "pending_logs", None) is not None:
+            # Batched command output: queue progress with the file and log lines
+            # so it is written in stream order rather than ahead of the batch.
+            self._print_log(msg)
+            return
         self._console.print(msg, end="\r")
 
     def on_log(self, level: str, message: str, **kwargs: object) -> None:
@@ -226,9 +321,9 @@ class DefaultOutputHandler:
         }
         style = style_map.get(level, "")
         if style:
-            self._console.print(f"[{style}]{message}[/]")
+            self._print_log(f"[{style}]{message}[/]")
         else:
-            self._console.print(message)
+            self._print_log(message)
 
     def on_file_status(self, status: str, path: str) -> None:
         """Print file status to console."""
@@ -241,9 +336,9 @@ class DefaultOutputHandler:
         }
         style = status_styles.get(status, "")
         if style:
-            self._console.print(f"[{style}]{status}[/] {path}")
+            self._emit(f"[{style}]{status}[/] {path}")
         else:
-            self._console.print(f"{status} {path}")
+            self._emit(f"{status} {path}")
 
     def on_stdout(self, line: str) -> None:
         """Print stdout line to console."""
@@ -258,13 +353,20 @@ class DefaultOutputHandler:
         try:
             event = parse_borg_log_line(cleaned_line)
         except ValidationError:
-            self._console.print(f"[dim]{cleaned_line}[/]")
+            self._emit(f"[dim]{cleaned_line}[/]")
             return
 
+        # Checked in order of how often Borg emits each event during `create --list`.
+        # Every check is an exact-class match, so an isinstance call costs about
+        # as much as a dict lookup on the type tag and keeps type narrowing intact.
         if isinstance(event, ArchiveProgress):
             self._render_archive_progress(event)
             return
 
+        if isinstance(event, FileStatus):
+            self.on_file_status(event.status, event.path)
+            return
+
         if isinstance(event, ProgressPercent):
             self._render_progress_percent(event)
             return
@@ -273,15 +375,11 @@ class DefaultOutputHandler:
             self._render_progress_message(event)
             return
 
-        if isinstance(event, FileStatus):
-            self.on_file_status(event.status, event.path)
-            return
-
         self._render_log_message(event)
 
     def _render_archive_progress(self, archive_progress: ArchiveProgress) -> None:
         if archive_progress.finished:
-            self._console.print("[bold green]Archive write complete[/]")
+            self._emit("[bold green]Archive write complete[/]")
             return
 
         details: list[str] = []
@@ -301,16 +399,16 @@ class DefaultOutputHandler:
             details.append(" | ".join(size_parts))
 
         if details:
-            self._console.print(f"[cyan]Backing up[/] {' | '.join(details)}")
+            self._emit(f"[cyan]Backing up[/] {' | '.join(details)}")
 
     def _render_progress_message(self, progress_message: ProgressMessage) -> None:
         if progress_message.message:
-            self._console.print(f"[cyan]{progress_message.message}[/]")
+            self._emit(f"[cyan]{progress_message.message}[/]")
             return
 
         if progress_message.finished:
             operation = _humanize_msgid(progress_message.msgid)
-            self._console.print(f"[green]✓[/] {operation} complete")
+            self._emit(f"[green]✓[/] {operation} complete")
 
     def _render_progress_percent(self, progress_percent: ProgressPercent) -> None:
         info_parts: list[str] = []
@@ -327,7 +425,7 @@ class DefaultOutputHandler:
 
         if progress_percent.finished:
             operation = _humanize_msgid(progress_percent.msgid)
-            self._console.print(f"[green]✓[/] {operation} complete")
+            self._emit(f"[green]✓[/] {operation} complete")
 
     def _render_log_message(self, log_message: LogMessage) -> None:
         message = log_message.message.strip()
@@ -371,13 +469,59 @@ class DefaultOutputHandler:
             ruler_color=ruler_color,
         )
         self._console.rule(f"[bold {TEXT_COLOR}]{status}[/]", style=ruler_color)
-        with self._console.status(status=f"[bold {COLOR_HEX.blue}]{status}[/]", spinner=spinner):
-            for line in log_stream:
-                self.on_stderr(line)
+        if self._console.is_terminal:
+            self._render_live_tail(f"[bold {COLOR_HEX.blue}]{status}[/]", spinner, log_stream)
+        else:
+            # Redirected output (CI logs, `> file`) never shows the transient spinner
+            # or its tail, so skip the live display and print every line as parsed.
+            self._render_batched(log_stream)
         self._console.rule(f":heavy_check_mark: [bold {TEXT_COLOR}]{success_msg}[/]", style=ruler_color)
         self._console.print("")
         logger.debug("Completed streaming command in default output handler", status=status, success_msg=success_msg)
 
+    def _render_batched(self, log_stream: Iterable[str]) -> None:
+        # Lines are written in batches (by count or age) rather than one console
+        # write per line, which dominates on progress-heavy streams.
+        pending: list[str] = []
+        self._render_state.pending_logs = pending
+        try:
+            last_flush = monotonic()
+            for line in log_stream:
+                self.on_stderr(line)
+                now = monotonic()
+                if len(pending) >= _BATCHED_OUTPUT_MAX_LINES or now - last_flush >= _BATCHED_OUTPUT_INTERVAL_SECONDS:
+                    self._flush_pending_logs()
+                    last_flush = now
+        finally:
+            self._flush_pending_logs()
+            self._render_state.pending_logs = None
+
+    def _render_live_tail(self, status_markup: str, spinner: str, log_stream: Iterable[str]) -> None:
+        # File and progress lines go to a bounded tail shown under the spinner; log
+        # messages (warnings, stats) are still printed permanently above it, but in
+        # batches per refresh so chatty commands don't redraw the spinner per line.
+        self._render_state.tail = deque(maxlen=_COMMAND_TAIL_LINES)
+        self._render_state.progress = None
+        self._render_state.pending_logs = []
+        try:
+            with self._console.status(
+                status=status_markup, spinner=spinner, refresh_per_second=_COMMAND_TAIL_REFRESH_PER_SECOND
+            ) as live_status:
+                last_update = 0.0
+                for line in log_stream:
+                    self.on_stderr(line)
+                    now = monotonic()
+                    if now - last_update >= _COMMAND_TAIL_UPDATE_INTERVAL_SECONDS:
+                        self._flush_pending_logs()
+                        live_status.update(status=self._build_tail_renderable(status_markup))
+                        last_update = now
+                self._flush_pending_logs()
+        finally:
+            self._flush_pending_logs()
+            self._render_state.tail = None
+            self._render_state.progress = None
+            self._render_state.pending_logs = None
+
     @contextmanager
     def section(self, status: str, success_msg: str) -> Generator[None]:
         """Render a Rich ruler + spinner around the yielded block."""
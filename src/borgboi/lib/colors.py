@@ -2,25 +2,6 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from pygments.style import Style  # type: ignore[import-untyped]
-from pygments.token import (  # type: ignore[import-untyped]
-    Comment,
-    Error,
-    Generic,
-    Keyword,
-    Literal,
-    Name,
-    Number,
-    Operator,
-    Other,
-    Punctuation,
-    String,
-    Text,
-    Whitespace,
-    _TokenType,
-)
-from rich.syntax import PygmentsSyntaxTheme
-
 
 @dataclass(frozen=True)
 class ColorHex:
@@ -167,138 +148,3 @@ COLOR_HEX = ColorHex(
     mantle="#181825",
     crust="#11111b",
 )
-
-
-def _make_styles(colors: ColorHex) -> dict[_TokenType, str]:
-    return {
-        Comment: colors.overlay2,
-        Comment.Hashbang: colors.overlay2,
-        Comment.Multiline: colors.overlay2,
-        Comment.Preproc: colors.pink,
-        Comment.Single: colors.overlay2,
-        Comment.Special: colors.overlay2,
-        Generic: colors.text,
-        Generic.Deleted: colors.red,
-        Generic.Emph: f"{colors.text} underline",
-        Generic.Error: colors.text,
-        Generic.Heading: f"{colors.text} bold",
-        Generic.Inserted: f"{colors.text} bold",
-        Generic.Output: colors.overlay0,
-        Generic.Prompt: colors.text,
-        Generic.Strong: colors.text,
-        Generic.Subheading: f"{colors.text} bold",
-        Generic.Traceback: colors.text,
-        Error: colors.text,
-        Keyword: colors.mauve,
-        Keyword.Constant: colors.mauve,
-        Keyword.Declaration: f"{colors.mauve} italic",
-        Keyword.Namespace: colors.mauve,
-        Keyword.Pseudo: colors.pink,
-        Keyword.Reserved: colors.mauve,
-        Keyword.Type: colors.yellow,
-        Literal: colors.text,
-        Literal.Date: colors.text,
-        Name: colors.text,
-        Name.Attribute: colors.green,
-        Name.Builtin: f"{colors.red} italic",
-        Name.Builtin.Pseudo: colors.red,
-        Name.Class: colors.yellow,
-        Name.Constant: colors.text,
-        Name.Decorator: colors.text,
-        Name.Entity: colors.text,
-        Name.Exception: colors.yellow,
-        Name.Function: colors.blue,
-        Name.Label: f"{colors.teal} italic",
-        Name.Namespace: colors.text,
-        Name.Other: colors.text,
-        Name.Tag: colors.blue,
-        Name.Variable: f"{colors.text} italic",
-        Name.Variable.Class: f"{colors.yellow} italic",
-        Name.Variable.Global: f"{colors.text} italic",
-        Name.Variable.Instance: f"{colors.text} italic",
-        Number: colors.peach,
-        Number.Bin: colors.peach,
-        Number.Float: colors.peach,
-        Number.Hex: colors.peach,
-        Number.Integer: colors.peach,
-        Number.Integer.Long: colors.peach,
-        Number.Oct: colors.peach,
-        Operator: colors.sky,
-        Operator.Word: colors.mauve,
-        Other: colors.text,
-        Punctuation: colors.overlay2,
-        String: colors.green,
-        String.Backtick: colors.green,
-        String.Char: colors.green,
-        String.Doc: colors.green,
-        String.Double: colors.green,
-        String.Escape: colors.pink,
-        String.Heredoc: colors.green,
-        String.Interpol: colors.green,
-        String.Other: colors.green,
-        String.Regex: colors.pink,
-        String.Single: colors.green,
-        String.Symbol: colors.red,
-        Text: colors.text,
-        Whitespace: colors.text,
-    }
-
-
-class LatteStyle(Style):
-    """Catppuccin Latte Pygments style."""
-
-    background_color = LATTE.mantle
-    highlight_color = LATTE.surface0
-    line_number_background_color = LATTE.mantle
-    line_number_color = LATTE.text
-    line_number_special_background_color = LATTE.mantle
-    line_number_special_color = LATTE.text
-
-    styles = _make_styles(LATTE)
-
-
-class FrappeStyle(Style):
-    """Catppuccin Frappé Pygments style."""
-
-    background_color = FRAPPE.mantle
-    highlight_color = FRAPPE.surface0
-    line_number_background_color = FRAPPE.mantle
-    line_number_color = FRAPPE.text
-    line_number_special_background_color = FRAPPE.mantle
-    line_number_special_color = FRAPPE.text
-
-    styles = _make_styles(FRAPPE)
-
-
-class MacchiatoStyle(Style):
-    """Catppuccin Macchiato Pygments style."""
-
-    background_color = MACCHIATO.mantle
-    highlight_color = MACCHIATO.surface0
-    line_number_background_color = MACCHIATO.mantle
-    line_number_color = MACCHIATO.text
-    line_number_special_background_color = MACCHIATO.mantle
-    line_number_special_color = MACCHIATO.text
-
-    styles = _make_styles(MACCHIATO)
-
-
-class MochaStyle(Style):
-    """Catppuccin Mocha Pygments style."""
-
-    background_color = COLOR_HEX.mantle
-    highlight_color = COLOR_HEX.surface0
-    line_number_background_color = COLOR_HEX.mantle
-    line_number_color = COLOR_HEX.text
-    line_number_special_background_color = COLOR_HEX.mantle
-    line_number_special_color = COLOR_HEX.text
-
-    styles = _make_styles(COLOR_HEX)
-
-
-PYGMENTS_STYLES = {
-    "catppuccin-latte": PygmentsSyntaxTheme(LatteStyle),
-    "catppuccin-frappe": PygmentsSyntaxTheme(FrappeStyle),
-    "catppuccin-macchiato": PygmentsSyntaxTheme(MacchiatoStyle),
-    "catppuccin-mocha": PygmentsSyntaxTheme(MochaStyle),
-}
@@ -17,7 +17,12 @@ import stat
 from pathlib import Path
 
 from borgboi.config import config
-from borgboi.rich_utils import console
+from borgboi.rich_utils import get_console
+
+# Passphrases read from disk, keyed by file path and stored alongside the stat
+# signature they were read with, so repeated lookups cost one stat() instead of
+# an open/read. Writes through this module invalidate their entry explicitly.
+_passphrase_file_cache: dict[Path, tuple[tuple[int, int, int, int], str]] = {}
 
 
 def generate_secure_passphrase() -> str:
@@ -67,6 +72,7 @@ def save_passphrase_to_file(repo_name: str, passphrase: str) -> Path:
 
     # Write passphrase to file
     passphrase_file = get_passphrase_file_path(repo_name)
+    _passphrase_file_cache.pop(passphrase_file, None)
     passphrase_file.write_text(passphrase, encoding="utf-8")
 
     # Set restrictive permissions immediately after creation
@@ -78,7 +84,8 @@ def save_passphrase_to_file(repo_name: str, passphrase: str) -> Path:
 def load_passphrase_from_file(repo_name: str) -> str | None:
     """Load a passphrase from its file.
 
-    Validates file permissions and warns if they are not 0o600.
+    Validates file permissions and warns if they are not 0o600. The file
+    contents are cached for as long as its stat signature is unchanged.
 
     Args:
         repo_name: Name of the repository
@@ -88,19 +95,29 @@ def load_passphrase_from_file(repo_name: str) -> str | None:
     """
     passphrase_file = get_passphrase_file_path(repo_name)
 
-    if not passphrase_file.exists():
+    try:
+        file_stat = passphrase_file.stat()
+    except FileNotFoundError:
+        _passphrase_file_cache.pop(passphrase_file, None)
         return None
 
     # Check file permissions and warn if insecure
-    file_stat = passphrase_file.stat()
     file_mode = stat.S_IMODE(file_stat.st_mode)
 
     if file_mode != 0o600:
-        console.print(f"[bold yellow]Warning: Passphrase file has insecure permissions: {oct(file_mode)}[/]")
-        console.print(f"[bold yellow]Expected 0o600 (owner read/write only) for {passphrase_file}[/]")
-        console.print(f"[bold yellow]Run: chmod 600 {passphrase_file}[/]")
+        active_console = get_console()
+        active_console.print(f"[bold yellow]Warning: Passphrase file has insecure permissions: {oct(file_mode)}[/]")
+        active_console.print(f"[bold yellow]Expected 0o600 (owner read/write only) for {passphrase_file}[/]")
+        active_console.print(f"[bold yellow]Run: chmod 600 {passphrase_file}[/]")
+
+    signature = (file_stat.st_ino, file_stat.st_size, file_stat.st_mtime_ns, file_stat.st_ctime_ns)
+    cached = _passphrase_file_cache.get(passphrase_file)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
 
-    return passphrase_file.read_text(encoding="utf-8").strip()
+    passphrase = passphrase_file.read_text(encoding="utf-8").strip()
+    _passphrase_file_cache[passphrase_file] = (signature, passphrase)
+    return passphrase
 
 
 def resolve_passphrase(
@@ -179,6 +196,7 @@ def migrate_repo_passphrase(repo_name: str, old_passphrase: str) -> Path:
     if loaded_passphrase != old_passphrase:
         # Clean up on failure
         passphrase_file.unlink(missing_ok=True)
+        _passphrase_file_cache.pop(passphrase_file, None)
         raise ValueError(f"Passphrase verification failed for repository '{repo_name}'. Migration aborted.")
 
     return passphrase_file
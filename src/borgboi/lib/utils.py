@@ -36,19 +36,22 @@ def shorten_archive_path(archive_path: str) -> str:
     return archive_path
 
 
-def calculate_archive_age(archive_time: str) -> str:
+def calculate_archive_age(archive_time: str, now: datetime | None = None) -> str:
     """
     Calculate the age of a Borg archive based on its creation time.
 
     Args:
         archive_time (str): The creation time of the archive in "YYYY-MM-DD_HH:MM:SS" format (UTC).
+        now (datetime | None): Reference time to measure from, so callers listing many archives can
+            read the clock once. Defaults to the current UTC time.
 
     Returns:
         str: A human-readable string representing the age of the archive (i.e. "2d 3h 15m").
     """
     # Parse the custom format string and make it timezone-aware (UTC)
     archive_datetime = datetime.strptime(archive_time, "%Y-%m-%d_%H:%M:%S").replace(tzinfo=UTC)
-    now = datetime.now(tz=UTC)
+    if now is None:
+        now = datetime.now(tz=UTC)
     age = now - archive_datetime
     days = age.days
     hours, remainder = divmod(age.seconds, 3600)
@@ -145,3 +148,8 @@ def format_duration_seconds(seconds: object) -> str:
 def is_ci_environment() -> bool:
     """Return whether the current process is running in a CI environment."""
     return os.environ.get("CI", "").lower() in {"1", "true", "yes"}
+
+
+def is_plain_output_requested() -> bool:
+    """Return whether plain tab-separated output was requested via BORGBOI_PLAIN."""
+    return os.environ.get("BORGBOI_PLAIN", "").lower() in {"1", "true", "yes"}
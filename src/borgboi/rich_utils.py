@@ -1,39 +1,142 @@
+import gzip
 from collections.abc import Generator, Iterable
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import UTC
 from functools import cache
+from pathlib import Path
 from typing import TYPE_CHECKING
 
-from rich.columns import Columns
 from rich.console import Console
 from rich.panel import Panel
-from rich.syntax import Syntax
-from rich.table import Table
-
-from borgboi.clients.utils.borg_logs import (
-    ArchiveProgress,
-    FileStatus,
-    LogMessage,
-    ProgressMessage,
-    ProgressPercent,
-    parse_borg_log_stream,
-)
-from borgboi.lib.colors import COLOR_HEX, PYGMENTS_STYLES
-from borgboi.lib.utils import format_last_backup, format_repo_size
+from rich.style import Style
+from rich.table import Column, Table
+from rich.text import Text
+
+from borgboi.lib.colors import COLOR_HEX
+from borgboi.lib.utils import format_last_backup, format_repo_size, is_plain_output_requested
 from borgboi.models import BorgBoiRepo
+from borgboi.validator import parse_logs
 
 if TYPE_CHECKING:
     from borgboi.clients.s3 import S3BucketStats
     from borgboi.core.output import DefaultOutputHandler
 
+__all__ = [
+    "TEXT_COLOR",
+    "confirm_deletion",
+    "console",
+    "get_console",
+    "output_repo_info",
+    "output_repos_table",
+    "output_s3_bucket_stats",
+    "parse_logs",
+    "record_console_output",
+    "render_cmd_output_lines",
+    "render_excludes_file",
+    "save_console_output",
+    "scoped_console",
+]
+
 TEXT_COLOR = COLOR_HEX.text
-console = Console(record=True)
+# Recording is opt-in (see `record_console_output`): a recording console keeps
+# every rendered segment in memory, which grows without bound over a long
+# `borg create` stream.
+console = Console()
+# Worker threads can swap in their own console (see `scoped_console`) so that
+# concurrent commands don't contend for, or interleave on, the shared one.
+_console_var: ContextVar[Console | None] = ContextVar("borgboi_console", default=None)
+
+_GIB_PER_BYTE = 1 / 1024**3
+
+# Markup for `output_repo_info`; only the values vary between calls.
+_SIZE_TOTAL_LABEL = "[bold blue]Total Size"
+_SIZE_COMPRESSED_LABEL = "[bold blue]Compressed Size"
+_SIZE_DEDUPLICATED_LABEL = "[bold blue]Deduplicated Size"
+_SIZE_VALUE_FMT = "[cyan]{} GB"
+_METADATA_ENCRYPTION_LABEL = "[bold green]Encryption"
+_METADATA_LOCATION_LABEL = "[bold green]Location"
+_METADATA_LAST_MODIFIED_LABEL = "[bold green]Last Modified"
+_METADATA_VALUE_FMT = "[orange3]{}"
+_REPO_INFO_NAME_FMT = f"[bold {COLOR_HEX.mauve}]Repo Name:[/] {{}}"
+_REPO_INFO_ID_FMT = f"[bold {COLOR_HEX.mauve}]Repo ID:[/] [{COLOR_HEX.mauve}]{{}}[/]"
+_S3_SUMMARY_LABEL_STYLE = Style.parse(f"bold {COLOR_HEX.blue}")
+_S3_SUMMARY_VALUE_STYLE = Style.parse(COLOR_HEX.text)
+
+# Cell styles for `output_repos_table`, parsed once instead of re-tokenizing
+# the same markup tags for every row.
+_REPO_NAME_STYLE = Style.parse(f"bold {COLOR_HEX.sky}")
+_REPO_PATH_STYLE = Style.parse(f"bold {COLOR_HEX.blue}")
+_REPO_HOSTNAME_STYLE = Style.parse("bold green")
+_REPO_TARGET_STYLE = Style.parse(f"bold {COLOR_HEX.mauve}")
+_REPO_LAST_BACKUP_STYLE = Style.parse(f"bold {COLOR_HEX.yellow}")
+_REPO_SIZE_STYLE = Style.parse(COLOR_HEX.peach)
+_REPO_MISSING_STYLE = Style.parse(f"italic {COLOR_HEX.red}")
+_REPO_NEVER_BACKED_UP = Text(format_last_backup(None), style=_REPO_MISSING_STYLE)
+_REPO_SIZE_UNKNOWN = Text.assemble("🤷", (format_repo_size(None), _REPO_MISSING_STYLE))
+
+# Column prototypes for the tables rendered on every call; each table gets
+# fresh copies (`Column.copy` drops any cells) instead of re-declaring them.
+_REPOS_TABLE_COLUMNS = (
+    Column("Name"),
+    Column("Local Path 📁"),
+    Column("Hostname 🖥"),
+    Column("Last Archive 📆"),
+    Column("Size 💾", justify="right"),
+    Column("Backup Target 🎯"),
+)
+_REPOS_PLAIN_HEADER = ("Name", "Local Path", "Hostname", "Last Archive", "Size", "Backup Target")
+_S3_COMPOSITION_PLAIN_HEADER = ("Storage Class", "Tier", "Size (GB)", "% of Bucket")
+_S3_COMPOSITION_COLUMNS = (
+    Column("Storage Class", style=Style.parse(f"bold {COLOR_HEX.sky}")),
+    Column("Tier", style=Style.parse(COLOR_HEX.green)),
+    Column("Size (GB)", justify="right", style=Style.parse(COLOR_HEX.peach)),
+    Column("% of Bucket", justify="right", style=Style.parse(COLOR_HEX.yellow)),
+)
+
+
+def get_console() -> Console:
+    """
+    Return the console for the current context: a scoped console if one is active, else the shared one.
+    """
+    return _console_var.get() or console
+
+
+@contextmanager
+def scoped_console(scoped: Console) -> Generator[Console]:
+    """
+    Route output that uses `get_console` in the current context to `scoped` for the duration of the block.
+    """
+    token = _console_var.set(scoped)
+    try:
+        yield scoped
+    finally:
+        _console_var.reset(token)
+
+
+def record_console_output() -> None:
+    """
+    Start recording console output so it can be saved with `save_console_output`.
+    """
+    console.record = True
 
 
-def save_console_output() -> None:
+def save_console_output(compress: bool = False) -> None:
     """
-    Save the console output to an HTML file.
+    Save the recorded console output to an HTML file and stop recording.
+
+    The recording is exported (and its segment buffer released) in one pass.
+
+    Args:
+        compress (bool, optional): write gzip-compressed `borgboi_output.html.gz` instead. Defaults to False.
     """
-    console.save_html("borgboi_output.html")
+    html = console.export_html(clear=True)
+    console.record = False
+    if compress:
+        with gzip.open("borgboi_output.html.gz", "wt", encoding="utf-8") as html_file:
+            html_file.write(html)
+    else:
+        Path("borgboi_output.html").write_text(html, encoding="utf-8")
 
 
 @cache
@@ -43,13 +146,23 @@ def _get_default_output_handler() -> "DefaultOutputHandler":
     return DefaultOutputHandler()
 
 
+def _use_plain_output() -> bool:
+    # Piped or redirected output gets tab-separated text instead of Rich layouts,
+    # which would only be flattened again and are awkward to grep or cut.
+    return is_plain_output_requested() or not console.is_terminal
+
+
+def _print_plain_rows(rows: Iterable[Iterable[object]]) -> None:
+    get_console().out("\n".join("\t".join(str(value) for value in row) for row in rows), highlight=False)
+
+
 def _build_size_panel(total_size_gb: str, total_csize_gb: str, unique_csize_gb: str) -> Panel:
     table = Table.grid(padding=(0, 1))
     table.add_column()
     table.add_column(justify="right")
-    table.add_row("[bold blue]Total Size", f"[cyan]{total_size_gb} GB")
-    table.add_row("[bold blue]Compressed Size", f"[cyan]{total_csize_gb} GB")
-    table.add_row("[bold blue]Deduplicated Size", f"[cyan]{unique_csize_gb} GB")
+    table.add_row(_SIZE_TOTAL_LABEL, _SIZE_VALUE_FMT.format(total_size_gb))
+    table.add_row(_SIZE_COMPRESSED_LABEL, _SIZE_VALUE_FMT.format(total_csize_gb))
+    table.add_row(_SIZE_DEDUPLICATED_LABEL, _SIZE_VALUE_FMT.format(unique_csize_gb))
     return Panel(table, title="Disk Usage 💾", border_style="blue", expand=False)
 
 
@@ -57,9 +170,9 @@ def _build_metadata_panel(encryption_mode: str, repo_id: str, repo_location: str
     table = Table.grid(padding=(0, 1))
     table.add_column()
     table.add_column()
-    table.add_row("[bold green]Encryption", f"[orange3]{encryption_mode}")
-    table.add_row("[bold green]Location", f"[orange3]{repo_location}")
-    table.add_row("[bold green]Last Modified", f"[orange3]{last_modified}")
+    table.add_row(_METADATA_ENCRYPTION_LABEL, _METADATA_VALUE_FMT.format(encryption_mode))
+    table.add_row(_METADATA_LOCATION_LABEL, _METADATA_VALUE_FMT.format(repo_location))
+    table.add_row(_METADATA_LAST_MODIFIED_LABEL, _METADATA_VALUE_FMT.format(last_modified))
     return Panel(table, title="Metadata 📝", border_style="green", expand=False)
 
 
@@ -77,43 +190,71 @@ def output_repo_info(
     """
     Pretty print Borg repository information.
     """
-    console.rule("[bold]Borg Repo Info", style=COLOR_HEX.blue)
-    console.print(f"[bold {COLOR_HEX.mauve}]Repo Name:[/] {name}")
+    if _use_plain_output():
+        _print_plain_rows(
+            [
+                ("Repo Name", name),
+                ("Repo ID", repo_id),
+                ("Total Size", f"{total_size_gb} GB"),
+                ("Compressed Size", f"{total_csize_gb} GB"),
+                ("Deduplicated Size", f"{unique_csize_gb} GB"),
+                ("Encryption", encryption_mode),
+                ("Location", repo_location),
+                ("Last Modified", last_modified),
+            ]
+        )
+        return
+    active_console = get_console()
+    active_console.rule("[bold]Borg Repo Info", style=COLOR_HEX.blue)
+    active_console.print(_REPO_INFO_NAME_FMT.format(name))
     size_panel = _build_size_panel(total_size_gb, total_csize_gb, unique_csize_gb)
     metadata_panel = _build_metadata_panel(encryption_mode, repo_id, repo_location, last_modified)
+    from rich.columns import Columns
+
     columns = Columns([size_panel, metadata_panel])
-    console.print(columns)
-    console.rule(f"[bold {COLOR_HEX.mauve}]Repo ID:[/] [{COLOR_HEX.mauve}]{repo_id}[/]", style=COLOR_HEX.blue)
+    active_console.print(columns)
+    active_console.rule(_REPO_INFO_ID_FMT.format(repo_id), style=COLOR_HEX.blue)
+
+
+def _repo_table_row(repo: BorgBoiRepo) -> tuple[Text, Text, Text, Text, Text, Text]:
+    # The static "Never"/"Unknown" cells are shared: Rich wraps and measures
+    # copies of a cell's Text when rendering, so the singletons are never mutated.
+    return (
+        Text(repo.name, style=_REPO_NAME_STYLE),
+        Text(repo.path, style=_REPO_PATH_STYLE),
+        Text(repo.hostname, style=_REPO_HOSTNAME_STYLE),
+        Text(format_last_backup(repo.last_backup), style=_REPO_LAST_BACKUP_STYLE)
+        if repo.last_backup
+        else _REPO_NEVER_BACKED_UP,
+        _REPO_SIZE_UNKNOWN if repo.metadata is None else Text(format_repo_size(repo.metadata), style=_REPO_SIZE_STYLE),
+        Text(repo.backup_target, style=_REPO_TARGET_STYLE),
+    )
 
 
 def output_repos_table(repos: list[BorgBoiRepo]) -> None:
-    table = Table(title="BorgBoi Repositories", show_lines=True)
-    table.add_column("Name")
-    table.add_column("Local Path 📁")
-    table.add_column("Hostname 🖥")
-    table.add_column("Last Archive 📆")
-    table.add_column("Size 💾", justify="right")
-    table.add_column("Backup Target 🎯")
-
-    for repo in repos:
-        name = f"[bold {COLOR_HEX.sky}]{repo.name}[/]"
-        local_path = f"[bold {COLOR_HEX.blue}]{repo.path}[/]"
-        env_var_name = f"[bold green]{repo.hostname}[/]"
-        backup_target = f"[bold {COLOR_HEX.mauve}]{repo.backup_target}[/]"
-        last_backup_str = format_last_backup(repo.last_backup)
-        if repo.last_backup:
-            archive_date = f"[bold {COLOR_HEX.yellow}]{last_backup_str}[/]"
-        else:
-            archive_date = f"[italic {COLOR_HEX.red}]{last_backup_str}[/]"
-
-        size_str = format_repo_size(repo.metadata)
-        if size_str == "Unknown":
-            size = f"🤷[italic {COLOR_HEX.red}]{size_str}[/]"
-        else:
-            size = f"[{COLOR_HEX.peach}]{size_str}[/]"
-
-        table.add_row(name, local_path, env_var_name, archive_date, size, backup_target)
-    console.print(table)
+    if _use_plain_output():
+        _print_plain_rows(
+            [
+                _REPOS_PLAIN_HEADER,
+                *(
+                    (
+                        repo.name,
+                        repo.path,
+                        repo.hostname,
+                        format_last_backup(repo.last_backup),
+                        format_repo_size(repo.metadata),
+                        repo.backup_target,
+                    )
+                    for repo in repos
+                ),
+            ]
+        )
+        return
+    table = Table(*(column.copy() for column in _REPOS_TABLE_COLUMNS), title="BorgBoi Repositories", show_lines=True)
+
+    for row in [_repo_table_row(repo) for repo in repos]:
+        table.add_row(*row)
+    get_console().print(table)
 
 
 def confirm_deletion(repo_name: str, archive_name: str = "") -> None:
@@ -133,28 +274,14 @@ def confirm_deletion(repo_name: str, archive_name: str = "") -> None:
     confirmation_key = repo_name
     if archive_name:
         confirmation_key = f"{repo_name}::{archive_name}"
+    expected = confirmation_key.casefold()
     resp = console.input(f"[{COLOR_HEX.red}]Type [bold]{confirmation_key}[/] to confirm deletion: ")
-    if resp.lower() == confirmation_key.lower():
+    if resp.casefold() == expected:
         return None
     console.print("Deletion aborted.")
     raise ValueError("Deletion aborted.")
 
 
-def parse_logs(
-    log_stream: Iterable[str],
-) -> Generator[ArchiveProgress | ProgressMessage | ProgressPercent | LogMessage | FileStatus]:
-    """
-    Parse the logs from the borg client
-
-    Args:
-        log_stream (Iterable[str]): logs from the borg client
-
-    Yields:
-        Generator[ArchiveProgress | ProgressMessage | ProgressPercent | LogMessage | FileStatus]: validated log message
-    """
-    yield from parse_borg_log_stream(log_stream)
-
-
 def render_cmd_output_lines(
     status: str, success_msg: str, log_stream: Iterable[str], spinner: str = "point", ruler_color: str = "#74c7ec"
 ) -> None:
@@ -188,6 +315,11 @@ def render_excludes_file(excludes_file_path: str, lines_to_highlight: set[int] |
     Returns:
         None
     """
+    # Imported on demand: Pygments lexers and themes are only needed here.
+    from rich.syntax import Syntax
+
+    from borgboi.lib.syntax_themes import PYGMENTS_STYLES
+
     syntax = Syntax.from_path(
         excludes_file_path,
         line_numbers=True,
@@ -196,73 +328,89 @@ def render_excludes_file(excludes_file_path: str, lines_to_highlight: set[int] |
         highlight_lines=lines_to_highlight,
     )
     panel = Panel(syntax, title="Excludes File", expand=False)
-    console.print(panel)
+    get_console().print(panel)
 
 
-def output_s3_bucket_stats(stats: "S3BucketStats") -> None:
-    """Render S3 bucket metrics with Rich panel/table output."""
+def _s3_summary_rows(stats: "S3BucketStats") -> list[tuple[str, str]]:
     timestamp = (
         stats.metrics_timestamp.astimezone(UTC).strftime("%Y-%m-%d %H:%M:%S UTC")
         if stats.metrics_timestamp
         else "Unavailable"
     )
-
-    summary_table = Table.grid(padding=(0, 1))
-    summary_table.add_column(style=f"bold {COLOR_HEX.blue}")
-    summary_table.add_column(style=f"{COLOR_HEX.text}")
-    summary_table.add_row("Bucket", stats.bucket_name)
-    summary_table.add_row("Total Size", f"{stats.total_size_bytes / (1024**3):.2f} GB")
-    summary_table.add_row("Total Objects", f"{stats.total_object_count:,}")
-    summary_table.add_row("CloudWatch Timestamp", timestamp)
-    summary_table.add_row("Metric Source", "AWS/S3 daily storage metrics")
+    rows = [
+        ("Bucket", stats.bucket_name),
+        ("Total Size", f"{stats.total_size_bytes * _GIB_PER_BYTE:.2f} GB"),
+        ("Total Objects", f"{stats.total_object_count:,}"),
+        ("CloudWatch Timestamp", timestamp),
+        ("Metric Source", "AWS/S3 daily storage metrics"),
+    ]
 
     forecast = stats.intelligent_tiering_forecast
     if forecast is None:
-        summary_table.add_row("Upcoming IT FA->IA (7d)", "Unavailable")
+        rows.append(("Upcoming IT FA->IA (7d)", "Unavailable"))
     elif not forecast.available:
-        summary_table.add_row("Upcoming IT FA->IA (7d)", "Unavailable")
+        rows.append(("Upcoming IT FA->IA (7d)", "Unavailable"))
         if forecast.unavailable_reason:
-            summary_table.add_row("Forecast Details", forecast.unavailable_reason)
+            rows.append(("Forecast Details", forecast.unavailable_reason))
     else:
-        summary_table.add_row(
-            "Upcoming IT FA->IA (7d)",
+        rows.append(
             (
-                f"{forecast.objects_transitioning_next_week:,} objects / "
-                f"{forecast.size_bytes_transitioning_next_week / (1024**3):.2f} GB"
-            ),
+                "Upcoming IT FA->IA (7d)",
+                (
+                    f"{forecast.objects_transitioning_next_week:,} objects / "
+                    f"{forecast.size_bytes_transitioning_next_week * _GIB_PER_BYTE:.2f} GB"
+                ),
+            )
         )
         inventory_generated_at = (
             forecast.inventory_generated_at.astimezone(UTC).strftime("%Y-%m-%d %H:%M:%S UTC")
             if forecast.inventory_generated_at
             else "Unavailable"
         )
-        summary_table.add_row("Inventory Timestamp", inventory_generated_at)
+        rows.append(("Inventory Timestamp", inventory_generated_at))
         if forecast.inventory_configuration_id:
-            summary_table.add_row("Inventory Config", forecast.inventory_configuration_id)
+            rows.append(("Inventory Config", forecast.inventory_configuration_id))
         if forecast.estimation_method:
-            summary_table.add_row("Forecast Method", forecast.estimation_method)
+            rows.append(("Forecast Method", forecast.estimation_method))
+    return rows
 
-    panel = Panel(summary_table, title="S3 Bucket Stats", border_style=COLOR_HEX.blue, expand=False)
-    console.print(panel)
 
-    composition_table = Table(title="Storage Class Composition", show_lines=True)
-    composition_table.add_column("Storage Class", style=f"bold {COLOR_HEX.sky}")
-    composition_table.add_column("Tier", style=f"{COLOR_HEX.green}")
-    composition_table.add_column("Size (GB)", justify="right", style=f"{COLOR_HEX.peach}")
-    composition_table.add_column("% of Bucket", justify="right", style=f"{COLOR_HEX.yellow}")
-
-    total_size = stats.total_size_bytes
+def _s3_composition_rows(stats: "S3BucketStats") -> list[tuple[str, str, str, str]]:
     if not stats.storage_breakdown:
-        composition_table.add_row("No data", "-", "0.00", "0.00%")
-    else:
-        for item in stats.storage_breakdown:
-            size_gb = item.size_bytes / (1024**3)
-            pct_of_bucket = (item.size_bytes / total_size * 100) if total_size > 0 else 0.0
-            composition_table.add_row(
-                item.storage_class,
-                item.tier,
-                f"{size_gb:.2f}",
-                f"{pct_of_bucket:.2f}%",
-            )
+        return [("No data", "-", "0.00", "0.00%")]
+    total_size = stats.total_size_bytes
+    pct_per_byte = 100 / total_size if total_size > 0 else 0.0
+    return [
+        (
+            item.storage_class,
+            item.tier,
+            f"{item.size_bytes * _GIB_PER_BYTE:.2f}",
+            f"{item.size_bytes * pct_per_byte:.2f}%",
+        )
+        for item in stats.storage_breakdown
+    ]
+
 
-    console.print(composition_table)
+def output_s3_bucket_stats(stats: "S3BucketStats") -> None:
+    """Render S3 bucket metrics with Rich panel/table output."""
+    summary_rows = _s3_summary_rows(stats)
+    composition_rows = _s3_composition_rows(stats)
+    if _use_plain_output():
+        _print_plain_rows([*summary_rows, (), _S3_COMPOSITION_PLAIN_HEADER, *composition_rows])
+        return
+
+    summary_table = Table.grid(padding=(0, 1))
+    summary_table.add_column(style=_S3_SUMMARY_LABEL_STYLE)
+    summary_table.add_column(style=_S3_SUMMARY_VALUE_STYLE)
+    for row in summary_rows:
+        summary_table.add_row(*row)
+    panel = Panel(summary_table, title="S3 Bucket Stats", border_style=COLOR_HEX.blue, expand=False)
+    active_console = get_console()
+    active_console.print(panel)
+
+    composition_table = Table(
+        *(column.copy() for column in _S3_COMPOSITION_COLUMNS), title="Storage Class Composition", show_lines=True
+    )
+    for composition_row in composition_rows:
+        composition_table.add_row(*composition_row)
+    active_console.print(composition_table)
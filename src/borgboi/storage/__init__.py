@@ -7,7 +7,8 @@ repository metadata, supporting both offline (local) and online
 All imports are lazy to avoid circular imports with borgboi.config.
 """
 
-from typing import TYPE_CHECKING, cast
+from importlib import import_module
+from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from borgboi.storage.base import RepositoryStorage
@@ -23,21 +24,19 @@ __all__ = [
 ]
 
 
-def __getattr__(name: str) -> object:
-    if name == "RepositoryStorage":
-        from borgboi.storage.base import RepositoryStorage
-
-        return RepositoryStorage
-    if name == "DynamoDBStorage":
-        from borgboi.storage.dynamodb import DynamoDBStorage
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "DynamoDBStorage": "borgboi.storage.dynamodb",
+    "RepositoryStorage": "borgboi.storage.base",
+    "S3RepoStats": "borgboi.storage.models",
+    "SQLiteStorage": "borgboi.storage.sqlite",
+}
 
-        return DynamoDBStorage
-    if name == "SQLiteStorage":
-        from borgboi.storage.sqlite import SQLiteStorage
 
-        return SQLiteStorage
-    if name == "S3RepoStats":
-        from borgboi.storage import models
-
-        return cast(object, models.S3RepoStats)
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value: object = getattr(import_module(module_name), name)
+    # Cache on the package so later lookups never reach __getattr__ again.
+    globals()[name] = value
+    return value
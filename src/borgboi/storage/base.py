@@ -6,6 +6,7 @@ underlying storage mechanism.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Collection
 
 from borgboi.models import BorgBoiRepo
 
@@ -76,6 +77,23 @@ class RepositoryStorage(ABC):
             StorageError: If saving fails
         """
 
+    def update_fields(self, repo: BorgBoiRepo, fields: Collection[str]) -> None:
+        """Persist only the given fields of an existing repository.
+
+        Backends that support partial writes override this to avoid rewriting
+        the whole record. The default implementation falls back to `save`.
+
+        Args:
+            repo: The repository holding the updated values
+            fields: Names of the `BorgBoiRepo` fields that changed
+
+        Raises:
+            ValueError: If a field cannot be partially updated
+            RepositoryNotFoundError: If the repository doesn't exist
+            StorageError: If updating fails
+        """
+        self.save(repo)
+
     @abstractmethod
     def delete(self, name: str) -> None:
         """Delete a repository by name.
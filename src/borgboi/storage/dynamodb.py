@@ -7,15 +7,23 @@ used when running in cloud mode with AWS connectivity.
 from __future__ import annotations
 
 import socket
+import tempfile
+import time
+from collections.abc import Collection
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import TYPE_CHECKING, override
 
-import boto3
-from boto3.dynamodb.conditions import Key
+from boto3.dynamodb.conditions import Attr, Key
 from botocore.config import Config as BotoConfig
-from pydantic import ValidationError
+from botocore.exceptions import ClientError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 if TYPE_CHECKING:
     from mypy_boto3_dynamodb.service_resource import DynamoDBServiceResource, Table
+    from mypy_boto3_dynamodb.type_defs import TableAttributeValueTypeDef, UpdateItemInputTableUpdateItemTypeDef
+
+from borgboi.clients.aws import get_session
 
 # Import the existing conversion helpers
 from borgboi.clients.dynamodb import (
@@ -27,12 +35,68 @@ from borgboi.config import Config, get_config
 from borgboi.core.errors import RepositoryNotFoundError, StorageError
 from borgboi.core.logging import get_logger
 from borgboi.models import BorgBoiRepo
-from borgboi.rich_utils import console
+from borgboi.rich_utils import get_console
 from borgboi.storage.base import RepositoryStorage
 
-boto_config = BotoConfig(retries={"mode": "standard"})
+# Keep-alive stops idle pooled sockets from being reaped by NAT gateways or
+# load balancers between calls, which would force a fresh TCP+TLS handshake;
+# the larger pool lets concurrent daily backups update the table in parallel.
+boto_config = BotoConfig(
+    retries={"mode": "standard"},
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    connect_timeout=3,
+    read_timeout=10,
+)
 logger = get_logger(__name__)
 
+_DEFAULT_CACHE_TTL_SECONDS = 60.0
+# Kept short because writes from other hosts, or through the legacy DynamoDB
+# client, do not clear this machine's snapshot.
+_DEFAULT_LIST_CACHE_TTL_SECONDS = 30.0
+# Segments scanned concurrently by list_all; each one is paginated independently.
+_LIST_SCAN_SEGMENTS = 4
+# Validates raw table items on every read path; built once so scans reuse its core schema.
+_TABLE_ITEM_ADAPTER = TypeAdapter(BorgBoiRepoTableItem)
+
+# Table item attributes that persist each updatable BorgBoiRepo field. The key
+# attributes (path, hostname) cannot change, and metadata is never stored in
+# DynamoDB because it is refreshed from Borg when items are read.
+_REPO_FIELD_ATTRIBUTES: dict[str, tuple[str, ...]] = {
+    "backup_target": ("backup_target_path",),
+    "name": ("repo_name",),
+    "os_platform": ("os_platform",),
+    "last_backup": ("last_backup",),
+    "last_s3_sync": ("last_s3_sync",),
+    "created_at": ("created_at",),
+    "metadata": (),
+    "retention_policy": (
+        "retention_keep_daily",
+        "retention_keep_weekly",
+        "retention_keep_monthly",
+        "retention_keep_yearly",
+    ),
+    "passphrase": ("passphrase",),
+    "passphrase_file_path": ("passphrase_file_path",),
+    "passphrase_migrated": ("passphrase_migrated",),
+}
+
+
+class _RepoListCacheFile(BaseModel):
+    """On-disk snapshot of a repository table scan."""
+
+    table_name: str
+    written_at: float
+    repos: list[BorgBoiRepo]
+
+
+def _repo_to_put_item(repo: BorgBoiRepo) -> dict[str, TableAttributeValueTypeDef]:
+    """Serialize a repository into the attribute dict sent with PutItem."""
+    item: dict[str, TableAttributeValueTypeDef] = _TABLE_ITEM_ADAPTER.dump_python(
+        _convert_repo_to_table_item(repo), exclude_none=True
+    )
+    return item
+
 
 class DynamoDBStorage(RepositoryStorage):
     """DynamoDB-backed storage for repository metadata.
@@ -40,31 +104,128 @@ class DynamoDBStorage(RepositoryStorage):
     Stores repository metadata in AWS DynamoDB, providing cloud-based
     persistence with global secondary indexes for efficient lookups.
 
+    Repositories fetched by name or path are cached in-process for a short
+    TTL, because every read costs a DynamoDB round-trip plus a ``borg info``
+    call for local repositories. Any write through this instance clears the
+    cache.
+
+    Full listings are additionally snapshotted to disk under the borgboi
+    directory so that back-to-back CLI invocations can skip the table scan.
+    Writes through this backend on this machine delete the snapshot; other
+    writers are only picked up once it expires, so its TTL is kept short.
+    Listings that include a legacy plaintext passphrase are never written to
+    disk, so the snapshot does not become a second copy of that secret.
+
     Attributes:
         table_name: Name of the DynamoDB table
     """
 
-    def __init__(self, config: Config | None = None, table_name: str | None = None) -> None:
+    def __init__(
+        self,
+        config: Config | None = None,
+        table_name: str | None = None,
+        cache_ttl_seconds: float = _DEFAULT_CACHE_TTL_SECONDS,
+        list_cache_ttl_seconds: float = _DEFAULT_LIST_CACHE_TTL_SECONDS,
+    ) -> None:
         """Initialize DynamoDB storage.
 
         Args:
             config: BorgBoi configuration (default: get_config())
             table_name: DynamoDB table name (default: from config)
+            cache_ttl_seconds: How long fetched repositories are reused (0 disables caching)
+            list_cache_ttl_seconds: How long the on-disk repository list is reused (0 disables it)
         """
         self._config = config or get_config()
         self.table_name = table_name or self._config.aws.dynamodb_repos_table
-        self._dynamodb: DynamoDBServiceResource = boto3.resource("dynamodb", config=boto_config)
+        self._dynamodb: DynamoDBServiceResource = get_session(self._config.aws.profile).resource(
+            "dynamodb", config=boto_config
+        )
+        # Built eagerly: daily backups share one storage across worker threads,
+        # and a lazily created resource would first be built concurrently.
+        self._table: Table = self._dynamodb.Table(self.table_name)
+        self._cache_ttl_seconds = cache_ttl_seconds
+        self._repo_cache: dict[tuple[str, ...], tuple[BorgBoiRepo, float]] = {}
+        self._list_cache_ttl_seconds = list_cache_ttl_seconds
+        self._repo_list_cache_path = self._config.borgboi_dir / "cache" / f"dynamodb-{self.table_name}-repos.json"
+
+    def _get_cached(self, key: tuple[str, ...]) -> BorgBoiRepo | None:
+        """Return a copy of a cached repository if its entry has not expired."""
+        entry = self._repo_cache.get(key)
+        if entry is None:
+            return None
+        repo, cached_at = entry
+        if time.monotonic() - cached_at >= self._cache_ttl_seconds:
+            self._repo_cache.pop(key, None)
+            return None
+        return repo.model_copy(deep=True)
+
+    def _cache(self, key: tuple[str, ...], repo: BorgBoiRepo) -> BorgBoiRepo:
+        """Remember a fetched repository and return it."""
+        if self._cache_ttl_seconds > 0:
+            self._repo_cache[key] = (repo.model_copy(deep=True), time.monotonic())
+        return repo
+
+    def invalidate_cache(self) -> None:
+        """Drop every cached repository so the next read goes to DynamoDB."""
+        self._repo_cache.clear()
+        try:
+            self._repo_list_cache_path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning("Failed to remove repository list cache", path=str(self._repo_list_cache_path), error=str(e))
 
-    @property
-    def _table(self) -> Table:
-        """Get the DynamoDB table resource."""
-        return self._dynamodb.Table(self.table_name)
+    def _load_repo_list_cache(self) -> list[BorgBoiRepo] | None:
+        """Return the on-disk repository list if it exists and has not expired."""
+        if self._list_cache_ttl_seconds <= 0:
+            return None
+        try:
+            snapshot = _RepoListCacheFile.model_validate_json(self._repo_list_cache_path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValidationError) as e:
+            logger.debug(
+                "Ignoring unreadable repository list cache", path=str(self._repo_list_cache_path), error=str(e)
+            )
+            return None
+        age_seconds = time.time() - snapshot.written_at
+        if snapshot.table_name != self.table_name or not 0 <= age_seconds < self._list_cache_ttl_seconds:
+            return None
+        return snapshot.repos
+
+    def _store_repo_list_cache(self, repos: list[BorgBoiRepo]) -> None:
+        """Atomically write the repository list snapshot, readable only by the owner."""
+        if self._list_cache_ttl_seconds <= 0:
+            return
+        if any(repo.passphrase for repo in repos):
+            logger.debug("Not caching repository list containing legacy passphrases", table_name=self.table_name)
+            return
+        snapshot = _RepoListCacheFile(table_name=self.table_name, written_at=time.time(), repos=repos)
+        cache_dir = self._repo_list_cache_path.parent
+        tmp_path: Path | None = None
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            # NamedTemporaryFile creates the file with 0o600, which the snapshot keeps
+            # because it records repository paths and passphrase file locations.
+            with tempfile.NamedTemporaryFile(
+                "w", dir=cache_dir, prefix=f".{self._repo_list_cache_path.name}.", delete=False, encoding="utf-8"
+            ) as tmp_file:
+                tmp_path = Path(tmp_file.name)
+                tmp_file.write(snapshot.model_dump_json())
+            tmp_path.replace(self._repo_list_cache_path)
+        except OSError as e:
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
+            logger.debug("Failed to write repository list cache", path=str(self._repo_list_cache_path), error=str(e))
 
     # RepositoryStorage implementation
 
     @override
     def get(self, name: str) -> BorgBoiRepo:
         """Retrieve a repository by name."""
+        cache_key = ("name", name)
+        if (cached := self._get_cached(cache_key)) is not None:
+            logger.debug("Using cached repository", repo_name=name)
+            return cached
+
         logger.debug("Getting repository from DynamoDB", repo_name=name)
         try:
             response = self._table.query(
@@ -76,8 +237,8 @@ class DynamoDBStorage(RepositoryStorage):
             if not items:
                 raise RepositoryNotFoundError(f"Repository '{name}' not found", name=name)
 
-            table_item = BorgBoiRepoTableItem.model_validate(items[0])
-            return _convert_table_item_to_repo(table_item)
+            table_item = _TABLE_ITEM_ADAPTER.validate_python(items[0])
+            return self._cache(cache_key, _convert_table_item_to_repo(table_item))
         except RepositoryNotFoundError:
             raise
         except ValidationError as e:
@@ -89,6 +250,11 @@ class DynamoDBStorage(RepositoryStorage):
     def get_by_path(self, path: str, hostname: str | None = None) -> BorgBoiRepo:
         """Retrieve a repository by its path."""
         host = hostname or socket.gethostname()
+        cache_key = ("path", path, host)
+        if (cached := self._get_cached(cache_key)) is not None:
+            logger.debug("Using cached repository", repo_path=path, hostname=host)
+            return cached
+
         logger.debug("Getting repository from DynamoDB by path", repo_path=path, hostname=host)
         try:
             response = self._table.get_item(Key={"repo_path": path, "hostname": host})
@@ -96,8 +262,8 @@ class DynamoDBStorage(RepositoryStorage):
             if not item:
                 raise RepositoryNotFoundError(f"Repository at path '{path}' not found", path=path)
 
-            table_item = BorgBoiRepoTableItem.model_validate(item)
-            return _convert_table_item_to_repo(table_item)
+            table_item = _TABLE_ITEM_ADAPTER.validate_python(item)
+            return self._cache(cache_key, _convert_table_item_to_repo(table_item))
         except RepositoryNotFoundError:
             raise
         except ValidationError as e:
@@ -105,38 +271,68 @@ class DynamoDBStorage(RepositoryStorage):
         except Exception as e:
             raise StorageError(f"Failed to get repository at {path}: {e}", operation="get_by_path", cause=e) from e
 
+    def _scan_all_items(self) -> list[dict[str, TableAttributeValueTypeDef]]:
+        """Return every table item using a paginated, segmented parallel scan."""
+        # Table resources are built up front: boto3 resources should not be
+        # created from worker threads, and each worker gets its own instance.
+        tables = [self._dynamodb.Table(self.table_name) for _ in range(_LIST_SCAN_SEGMENTS)]
+
+        def scan_segment(segment: int) -> list[dict[str, TableAttributeValueTypeDef]]:
+            table = tables[segment]
+            segment_items: list[dict[str, TableAttributeValueTypeDef]] = []
+            last_key: dict[str, TableAttributeValueTypeDef] | None = None
+            while True:
+                if last_key is None:
+                    response = table.scan(Segment=segment, TotalSegments=_LIST_SCAN_SEGMENTS)
+                else:
+                    response = table.scan(
+                        Segment=segment, TotalSegments=_LIST_SCAN_SEGMENTS, ExclusiveStartKey=last_key
+                    )
+                segment_items.extend(response.get("Items", []))
+                last_key = response.get("LastEvaluatedKey")
+                if not last_key:
+                    return segment_items
+
+        with ThreadPoolExecutor(max_workers=_LIST_SCAN_SEGMENTS, thread_name_prefix="borgboi-scan") as executor:
+            segments = executor.map(scan_segment, range(_LIST_SCAN_SEGMENTS))
+            return [item for segment_items in segments for item in segment_items]
+
+    @staticmethod
+    def _item_to_repo(item: dict[str, TableAttributeValueTypeDef]) -> BorgBoiRepo | None:
+        """Convert a raw table item, reporting and returning None for rows that cannot be loaded."""
+        try:
+            return _convert_table_item_to_repo(_TABLE_ITEM_ADAPTER.validate_python(item))
+        except ValidationError as e:
+            repo_identifier = str(item.get("common_name") or item.get("repo_path") or "unknown")
+            error_count = e.error_count()
+            get_console().print(
+                f"[dim]Skipping repo '{repo_identifier}': invalid data in DynamoDB ({error_count} validation error(s))[/dim]"
+            )
+            logger.warning(
+                "Skipping invalid repository data from DynamoDB",
+                repo_identifier=repo_identifier,
+                validation_errors=error_count,
+            )
+        except Exception:
+            repo_identifier = str(item.get("common_name") or item.get("repo_path") or "unknown")
+            get_console().print(f"[dim]Skipping repo '{repo_identifier}': failed to load from DynamoDB[/dim]")
+            logger.warning("Failed to load repository from DynamoDB", repo_identifier=repo_identifier)
+        return None
+
     @override
     def list_all(self) -> list[BorgBoiRepo]:
         """List all repositories in storage."""
+        if (cached_repos := self._load_repo_list_cache()) is not None:
+            logger.debug("Using cached repository list", table_name=self.table_name, repo_count=len(cached_repos))
+            return cached_repos
+
         logger.debug("Listing all repositories from DynamoDB", table_name=self.table_name)
         try:
-            response = self._table.scan()
-            repos = []
-            skipped_count = 0
-            for item in response.get("Items", []):
-                try:
-                    table_item = BorgBoiRepoTableItem.model_validate(item)
-                    repos.append(_convert_table_item_to_repo(table_item))
-                except ValidationError as e:
-                    skipped_count += 1
-                    repo_identifier = str(item.get("common_name") or item.get("repo_path") or "unknown")
-                    error_count = e.error_count()
-                    console.print(
-                        f"[dim]Skipping repo '{repo_identifier}': invalid data in DynamoDB ({error_count} validation error(s))[/dim]"
-                    )
-                    logger.warning(
-                        "Skipping invalid repository data from DynamoDB",
-                        repo_identifier=repo_identifier,
-                        validation_errors=error_count,
-                    )
-                    continue
-                except Exception:
-                    skipped_count += 1
-                    repo_identifier = str(item.get("common_name") or item.get("repo_path") or "unknown")
-                    console.print(f"[dim]Skipping repo '{repo_identifier}': failed to load from DynamoDB[/dim]")
-                    logger.warning("Failed to load repository from DynamoDB", repo_identifier=repo_identifier)
-                    continue
+            items = self._scan_all_items()
+            repos = [repo for item in items if (repo := self._item_to_repo(item)) is not None]
+            skipped_count = len(items) - len(repos)
             logger.debug("Listed repositories from DynamoDB", repo_count=len(repos), skipped_count=skipped_count)
+            self._store_repo_list_cache(repos)
             return repos
         except Exception as e:
             raise StorageError(f"Failed to list repositories: {e}", operation="list_all", cause=e) from e
@@ -146,20 +342,98 @@ class DynamoDBStorage(RepositoryStorage):
         """Save or update repository metadata."""
         logger.debug("Saving repository to DynamoDB", repo_name=repo.name, repo_path=repo.path)
         try:
-            table_item = _convert_repo_to_table_item(repo)
-            self._table.put_item(Item=table_item.model_dump(exclude_none=True))
+            self._table.put_item(Item=_repo_to_put_item(repo))
+            self.invalidate_cache()
             logger.debug("Repository saved to DynamoDB", repo_name=repo.name)
         except Exception as e:
             raise StorageError(f"Failed to save repository {repo.name}: {e}", operation="save", cause=e) from e
 
+    @override
+    def update_fields(self, repo: BorgBoiRepo, fields: Collection[str]) -> None:
+        """Update only the given fields with a single conditional UpdateItem call."""
+        unsupported = sorted(set(fields) - _REPO_FIELD_ATTRIBUTES.keys())
+        if unsupported:
+            raise ValueError(f"Cannot partially update repository field(s): {', '.join(unsupported)}")
+
+        self.invalidate_cache()
+        attributes = [attribute for field in fields for attribute in _REPO_FIELD_ATTRIBUTES[field]]
+        if not attributes:
+            logger.debug("No persisted DynamoDB attributes to update", repo_name=repo.name, fields=sorted(fields))
+            return
+
+        logger.debug("Updating repository fields in DynamoDB", repo_name=repo.name, fields=sorted(fields))
+        item = _convert_repo_to_table_item(repo).model_dump()
+        names: dict[str, str] = {}
+        values: dict[str, TableAttributeValueTypeDef] = {}
+        set_clauses: list[str] = []
+        remove_clauses: list[str] = []
+        for attribute in attributes:
+            names[f"#{attribute}"] = attribute
+            if item.get(attribute) is None:
+                remove_clauses.append(f"#{attribute}")
+            else:
+                values[f":{attribute}"] = item[attribute]
+                set_clauses.append(f"#{attribute} = :{attribute}")
+
+        update_expression = " ".join(
+            f"{action} {', '.join(clauses)}"
+            for action, clauses in (("SET", set_clauses), ("REMOVE", remove_clauses))
+            if clauses
+        )
+        update_kwargs: UpdateItemInputTableUpdateItemTypeDef = {
+            "Key": {"repo_path": repo.path, "hostname": repo.hostname},
+            "UpdateExpression": update_expression,
+            "ConditionExpression": Attr("repo_path").exists(),
+            "ExpressionAttributeNames": names,
+        }
+        if values:
+            update_kwargs["ExpressionAttributeValues"] = values
+
+        try:
+            self._table.update_item(**update_kwargs)
+            self.invalidate_cache()
+            logger.debug("Repository fields updated in DynamoDB", repo_name=repo.name)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") == "ConditionalCheckFailedException":
+                raise RepositoryNotFoundError(
+                    f"Repository at path '{repo.path}' not found", name=repo.name, path=repo.path
+                ) from e
+            raise StorageError(
+                f"Failed to update repository {repo.name}: {e}", operation="update_fields", cause=e
+            ) from e
+        except Exception as e:
+            raise StorageError(
+                f"Failed to update repository {repo.name}: {e}", operation="update_fields", cause=e
+            ) from e
+
     @override
     def delete(self, name: str) -> None:
         """Delete a repository by name."""
         logger.debug("Deleting repository from DynamoDB", repo_name=name)
         try:
-            # First get the repo to obtain path and hostname
-            repo = self.get(name)
-            self._table.delete_item(Key={"repo_path": repo.path, "hostname": repo.hostname})
+            # Only the key attributes are needed, so skip loading and converting
+            # the full item (which can refresh metadata from Borg).
+            response = self._table.query(
+                IndexName="name_gsi",
+                KeyConditionExpression=Key("repo_name").eq(name),
+                ProjectionExpression="repo_path, hostname",
+                Limit=1,
+            )
+            items = response.get("Items", [])
+            if not items:
+                raise RepositoryNotFoundError(f"Repository '{name}' not found", name=name)
+
+            try:
+                self._table.delete_item(
+                    Key={"repo_path": items[0]["repo_path"], "hostname": items[0]["hostname"]},
+                    ConditionExpression=Attr("repo_path").exists(),
+                )
+            except ClientError as e:
+                if e.response.get("Error", {}).get("Code") != "ConditionalCheckFailedException":
+                    raise
+                raise RepositoryNotFoundError(f"Repository '{name}' not found", name=name) from e
+            finally:
+                self.invalidate_cache()
             logger.debug("Repository deleted from DynamoDB", repo_name=name)
         except RepositoryNotFoundError:
             raise
@@ -173,9 +447,10 @@ class DynamoDBStorage(RepositoryStorage):
             response = self._table.query(
                 IndexName="name_gsi",
                 KeyConditionExpression=Key("repo_name").eq(name),
+                Select="COUNT",
                 Limit=1,
             )
-            exists_result = len(response.get("Items", [])) > 0
+            exists_result = response.get("Count", 0) > 0
             logger.debug("Checking repository existence in DynamoDB", repo_name=name, exists=exists_result)
             return exists_result
         except Exception:
@@ -201,6 +476,7 @@ class DynamoDBStorage(RepositoryStorage):
                 raise RepositoryNotFoundError(f"Repository at path '{path}' not found", path=path)
 
             self._table.delete_item(Key={"repo_path": path, "hostname": host})
+            self.invalidate_cache()
             logger.debug("Repository deleted from DynamoDB by path", repo_path=path, hostname=host)
         except RepositoryNotFoundError:
             raise
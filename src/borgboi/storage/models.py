@@ -12,6 +12,9 @@ BYTES_PER_KB = 1024
 BYTES_PER_MB = BYTES_PER_KB * 1024
 BYTES_PER_GB = BYTES_PER_MB * 1024
 
+# (divisor, unit, decimals) indexed by floor(log1024(size)), capped at GB.
+_SIZE_UNITS = ((BYTES_PER_KB, "KB", 1), (BYTES_PER_MB, "MB", 1), (BYTES_PER_GB, "GB", 2))
+
 
 class S3RepoStats(BaseModel):
     """S3 statistics for a single repository.
@@ -38,11 +41,9 @@ class S3RepoStats(BaseModel):
     @property
     def total_size_formatted(self) -> str:
         """Get human-readable total size."""
-        if self.total_size_bytes < BYTES_PER_KB:
-            return f"{self.total_size_bytes} B"
-        elif self.total_size_bytes < BYTES_PER_MB:
-            return f"{self.total_size_bytes / BYTES_PER_KB:.1f} KB"
-        elif self.total_size_bytes < BYTES_PER_GB:
-            return f"{self.total_size_bytes / BYTES_PER_MB:.1f} MB"
-        else:
-            return f"{self.total_size_gb:.2f} GB"
+        size = self.total_size_bytes
+        if size < BYTES_PER_KB:
+            return f"{size} B"
+        # Each unit is 2**10 larger, so the bit length picks the unit directly.
+        divisor, unit, decimals = _SIZE_UNITS[min((size.bit_length() - 1) // 10, len(_SIZE_UNITS)) - 1]
+        return f"{size / divisor:.{decimals}f} {unit}"
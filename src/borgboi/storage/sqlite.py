@@ -1,5 +1,6 @@
 """SQLite storage implementation for BorgBoi using SQLAlchemy."""
 
+from collections.abc import Collection
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import override
@@ -17,6 +18,28 @@ from borgboi.storage.models import S3RepoStats
 
 logger = get_logger(__name__)
 
+# Row columns that persist each updatable BorgBoiRepo field. Rows are keyed by
+# repository name, so renames still go through a full save.
+_REPO_FIELD_COLUMNS: dict[str, tuple[str, ...]] = {
+    "path": ("path",),
+    "backup_target": ("backup_target",),
+    "hostname": ("hostname",),
+    "os_platform": ("os_platform",),
+    "last_backup": ("last_backup",),
+    "last_s3_sync": ("last_s3_sync",),
+    "created_at": ("created_at",),
+    "metadata": ("metadata_json",),
+    "retention_policy": (
+        "retention_keep_daily",
+        "retention_keep_weekly",
+        "retention_keep_monthly",
+        "retention_keep_yearly",
+    ),
+    "passphrase": ("passphrase",),
+    "passphrase_file_path": ("passphrase_file_path",),
+    "passphrase_migrated": ("passphrase_migrated",),
+}
+
 
 class SQLiteStorage(RepositoryStorage):
     """SQLAlchemy-backed storage for repository metadata.
@@ -168,6 +191,31 @@ class SQLiteStorage(RepositoryStorage):
                 raise StorageError(f"Failed to save repository {repo.name}: {e}", operation="save", cause=e) from e
         logger.debug("Repository saved to SQLite", repo_name=repo.name)
 
+    @override
+    def update_fields(self, repo: BorgBoiRepo, fields: Collection[str]) -> None:
+        unsupported = sorted(set(fields) - _REPO_FIELD_COLUMNS.keys())
+        if unsupported:
+            raise ValueError(f"Cannot partially update repository field(s): {', '.join(unsupported)}")
+
+        logger.debug("Updating repository fields in SQLite", repo_name=repo.name, fields=sorted(fields))
+        data = self._repo_to_row_dict(repo)
+        with self._session_factory() as session:
+            row = session.query(RepositoryRow).filter_by(name=repo.name).first()
+            if row is None:
+                raise RepositoryNotFoundError(f"Repository '{repo.name}' not found", name=repo.name)
+            try:
+                for field in fields:
+                    for column in _REPO_FIELD_COLUMNS[field]:
+                        setattr(row, column, data[column])
+                row.updated_at = datetime.now(UTC)
+                session.commit()
+            except Exception as e:
+                session.rollback()
+                raise StorageError(
+                    f"Failed to update repository {repo.name}: {e}", operation="update_fields", cause=e
+                ) from e
+        logger.debug("Repository fields updated in SQLite", repo_name=repo.name)
+
     @override
     def delete(self, name: str) -> None:
         logger.debug("Deleting repository from SQLite", repo_name=name)
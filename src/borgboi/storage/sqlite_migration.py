@@ -14,6 +14,7 @@ import json
 import logging
 import shutil
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -24,6 +25,9 @@ from borgboi.storage.db import RepositoryRow, S3StatsCacheRow, get_session_facto
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on legacy JSON files read concurrently during migration.
+_MIGRATION_READ_WORKERS = 8
+
 
 def auto_migrate_if_needed(db_path: Path) -> Engine:
     """Check for legacy data and migrate to SQLite if needed.
@@ -127,21 +131,7 @@ def migrate_json_repositories(data_dir: Path, engine: Engine) -> int:
     if not repos_dir.exists():
         return 0
 
-    session_factory = get_session_factory(engine)
-    count = 0
-
-    for json_file in repos_dir.glob("*.json"):
-        try:
-            content = json_file.read_text()
-            data = json.loads(content)
-            _insert_repo_from_dict(session_factory, data)
-            count += 1
-        except (json.JSONDecodeError, KeyError, TypeError) as e:
-            logger.warning("Skipping invalid repository file %s: %s", json_file.name, e)
-        except Exception as e:
-            logger.warning("Failed to migrate repository file %s: %s", json_file.name, e)
-
-    return count
+    return _migrate_repository_files(sorted(repos_dir.glob("*.json")), engine, "repository")
 
 
 def migrate_legacy_repositories(legacy_dir: Path, engine: Engine) -> int:
@@ -152,32 +142,52 @@ def migrate_legacy_repositories(legacy_dir: Path, engine: Engine) -> int:
     if not legacy_dir.exists():
         return 0
 
+    return _migrate_repository_files(sorted(legacy_dir.glob("*.json")), engine, "legacy repository")
+
+
+def _migrate_repository_files(json_files: list[Path], engine: Engine, description: str) -> int:
+    """Insert repositories from JSON files, reading them concurrently.
+
+    Files are read and parsed on a small thread pool so that slow storage (e.g.
+    a network home directory) overlaps across files, while rows are inserted on
+    the calling thread in file order because SQLite allows a single writer.
+    Invalid files are logged and skipped.
+    """
+    if not json_files:
+        return 0
+
     session_factory = get_session_factory(engine)
     count = 0
-
-    for json_file in legacy_dir.glob("*.json"):
-        try:
-            content = json_file.read_text()
-            data = json.loads(content)
-            _insert_repo_from_dict(session_factory, data)
-            count += 1
-        except (json.JSONDecodeError, KeyError, TypeError) as e:
-            logger.warning("Skipping invalid legacy repository file %s: %s", json_file.name, e)
-        except Exception as e:
-            logger.warning("Failed to migrate legacy repository file %s: %s", json_file.name, e)
+    workers = min(_MIGRATION_READ_WORKERS, len(json_files))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="borgboi-migrate") as executor:
+        futures = [executor.submit(_read_json_file, json_file) for json_file in json_files]
+        for json_file, future in zip(json_files, futures, strict=True):
+            try:
+                _insert_repo_from_dict(session_factory, future.result())
+                count += 1
+            except (json.JSONDecodeError, KeyError, TypeError) as e:
+                logger.warning("Skipping invalid %s file %s: %s", description, json_file.name, e)
+            except Exception as e:
+                logger.warning("Failed to migrate %s file %s: %s", description, json_file.name, e)
 
     return count
 
 
+def _read_json_file(json_file: Path) -> dict[str, object]:
+    data: dict[str, object] = json.loads(json_file.read_bytes())
+    return data
+
+
 def migrate_s3_cache(cache_path: Path, engine: Engine) -> None:
     """Read S3 stats JSON cache and insert rows into s3_stats_cache table."""
-    content = cache_path.read_text()
-    data = json.loads(content)
+    data = json.loads(cache_path.read_bytes())
 
     repos_data = data.get("repos", {})
     if not repos_data:
         return
 
+    # Every migrated entry is cached as of the same moment.
+    cached_at = datetime.now(UTC)
     session_factory = get_session_factory(engine)
     with session_factory() as session:
         for repo_name, stats in repos_data.items():
@@ -191,7 +201,7 @@ def migrate_s3_cache(cache_path: Path, engine: Engine) -> None:
                 total_size_bytes=stats.get("total_size_bytes", 0),
                 object_count=stats.get("object_count", 0),
                 last_modified=last_modified,
-                cached_at=datetime.now(UTC),
+                cached_at=cached_at,
             )
             session.add(row)
         session.commit()
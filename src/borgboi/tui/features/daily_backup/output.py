@@ -342,14 +342,15 @@ class TuiOutputHandler:
             self._write(Text(cleaned_line, style="dim"))
             return
 
+        # Most frequent events first; see DefaultOutputHandler.on_stderr.
         if isinstance(event, ArchiveProgress):
             self._render_archive_progress(event)
+        elif isinstance(event, FileStatus):
+            self.on_file_status(event.status, event.path)
         elif isinstance(event, ProgressPercent):
             self._render_progress_percent(event)
         elif isinstance(event, ProgressMessage):
             self._render_progress_message(event)
-        elif isinstance(event, FileStatus):
-            self.on_file_status(event.status, event.path)
         else:
             self._render_log_message(event)
 
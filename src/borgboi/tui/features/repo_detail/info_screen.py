@@ -75,10 +75,10 @@ def _format_datetime(value: datetime | None) -> str:
     return value.astimezone(UTC).strftime("%a, %Y-%m-%d %H:%M:%S UTC")
 
 
-def _format_archive_age(archive_name: str) -> str:
+def _format_archive_age(archive_name: str, now: datetime | None = None) -> str:
     """Format the age of an archive, tolerating non-standard names."""
     try:
-        return calculate_archive_age(archive_name)
+        return calculate_archive_age(archive_name, now)
     except ValueError:
         return "Unknown"
 
@@ -696,11 +696,12 @@ class RepoInfoScreen(Screen[None]):
         self.query_one("#repo-info-compare-archives-btn", Button).disabled = not (
             self._is_local_repo() and len(archives) >= 2
         )
+        now = datetime.now(tz=UTC)
         for archive in archives:
             table.add_row(
                 archive.name,
                 format_iso_timestamp(archive.time),
-                _format_archive_age(archive.name),
+                _format_archive_age(archive.name, now),
                 archive.id[:12],
             )
 
@@ -0,0 +1,38 @@
+from typing import Any
+
+import pytest
+
+from borgboi.clients.aws import get_session
+
+
+def test_get_session_is_shared_per_profile(aws_credentials: None) -> None:
+    assert get_session(None) is get_session(None)
+
+
+def test_s3_and_dynamodb_clients_share_session(monkeypatch: pytest.MonkeyPatch, mocked_aws: None) -> None:
+    from borgboi.clients import s3
+    from borgboi.config import get_config
+    from borgboi.storage.dynamodb import DynamoDBStorage
+
+    cfg = get_config()
+    session = get_session(cfg.aws.profile)
+    created: list[str] = []
+    original_client = session.client
+    original_resource = session.resource
+
+    def _client(service_name: Any, **kwargs: Any) -> object:
+        created.append(service_name)
+        return original_client(service_name, **kwargs)
+
+    def _resource(service_name: Any, **kwargs: Any) -> object:
+        created.append(service_name)
+        return original_resource(service_name, **kwargs)
+
+    monkeypatch.setattr(session, "client", _client)
+    monkeypatch.setattr(session, "resource", _resource)
+
+    s3._create_s3_client(cfg)
+    s3._create_cloudwatch_client(cfg)
+    DynamoDBStorage(config=cfg)
+
+    assert set(created) == {"s3", "cloudwatch", "dynamodb"}
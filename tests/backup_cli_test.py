@@ -1,5 +1,6 @@
 import importlib
 import json
+from collections.abc import Iterator
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -257,6 +258,72 @@ def test_backup_daily_name_respects_no_s3_sync_and_passphrase(monkeypatch: pytes
     assert daily_backup_calls == [(fake_repo, "cli-passphrase", False)]
 
 
+def test_backup_daily_all_backs_up_repos_on_this_host(monkeypatch: pytest.MonkeyPatch) -> None:
+    local_repo = SimpleNamespace(name="local-repo", path="/fake/local", hostname="this-host")
+    remote_repo = SimpleNamespace(name="remote-repo", path="/fake/remote", hostname="other-host")
+    daily_backup_all_calls: list[tuple[list[object], bool, int]] = []
+
+    class _FakeOrchestrator:
+        def __init__(self, config: object, **_: object) -> None:
+            del config
+
+        def list_repos(self) -> list[object]:
+            return [local_repo, remote_repo]
+
+        def daily_backup_all(
+            self, repos: list[object], sync_to_s3: bool = True, concurrency: int = 4
+        ) -> dict[str, Exception]:
+            daily_backup_all_calls.append((repos, sync_to_s3, concurrency))
+            return {}
+
+    monkeypatch.setattr("borgboi.core.orchestrator.Orchestrator", _FakeOrchestrator)
+    monkeypatch.setattr("socket.gethostname", lambda: "this-host")
+
+    exit_code = invoke_cli(
+        cli_main.cli, ["--offline", "backup", "daily", "--all", "--concurrency", "2", "--no-s3-sync"]
+    )
+
+    assert exit_code == 0
+    assert daily_backup_all_calls == [([local_repo], False, 2)]
+
+
+def test_backup_daily_all_exits_non_zero_on_failures(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    local_repo = SimpleNamespace(name="local-repo", path="/fake/local", hostname="this-host")
+
+    class _FakeOrchestrator:
+        def __init__(self, config: object, **_: object) -> None:
+            del config
+
+        def list_repos(self) -> list[object]:
+            return [local_repo]
+
+        def daily_backup_all(
+            self, repos: list[object], sync_to_s3: bool = True, concurrency: int = 4
+        ) -> dict[str, Exception]:
+            _ = (repos, sync_to_s3, concurrency)
+            return {"local-repo": RuntimeError("borg exploded")}
+
+    monkeypatch.setattr("borgboi.core.orchestrator.Orchestrator", _FakeOrchestrator)
+    monkeypatch.setattr("socket.gethostname", lambda: "this-host")
+
+    exit_code = invoke_cli(cli_main.cli, ["--offline", "backup", "daily", "--all"])
+    captured = capsys.readouterr()
+
+    assert exit_code != 0
+    assert "borg exploded" in captured.out
+    assert "Daily backup failed for 1 of 1 repositories." in captured.out
+
+
+def test_backup_daily_all_rejects_repo_selectors(capsys: pytest.CaptureFixture[str]) -> None:
+    exit_code = invoke_cli(cli_main.cli, ["backup", "daily", "--all", "--name", "my-repo"])
+    captured = capsys.readouterr()
+
+    assert exit_code != 0
+    assert "--all cannot be combined" in captured.out
+
+
 def test_backup_daily_rejects_neither_name_nor_path(capsys: pytest.CaptureFixture[str]) -> None:
     exit_code = invoke_cli(cli_main.cli, ["backup", "daily"])
     captured = capsys.readouterr()
@@ -276,6 +343,38 @@ def test_backup_daily_rejects_both_name_and_path(tmp_path: Path, capsys: pytest.
     assert "mutually exclusive" in captured.out
 
 
+def test_backup_list_renders_streamed_archives(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    fake_repo = SimpleNamespace(name="demo-repo", path="/fake/repo")
+    iter_calls: list[tuple[object, str | None]] = []
+
+    class _FakeOrchestrator:
+        def __init__(self, config: object, **_: object) -> None:
+            del config
+
+        def get_repo(self, name: str | None = None, path: str | None = None) -> object:
+            _ = (name, path)
+            return fake_repo
+
+        def iter_archives(self, repo: object, passphrase: str | None = None) -> Iterator[object]:
+            iter_calls.append((repo, passphrase))
+            yield SimpleNamespace(name="2026-01-01_00:00:00", id="aaa111")
+            yield SimpleNamespace(name="2026-01-02_00:00:00", id="bbb222")
+
+    monkeypatch.setattr("borgboi.core.orchestrator.Orchestrator", _FakeOrchestrator)
+
+    exit_code = invoke_cli(cli_main.cli, ["--offline", "backup", "list", "--name", "demo-repo"])
+    captured = capsys.readouterr()
+
+    assert exit_code == 0
+    assert iter_calls == [(fake_repo, None)]
+    assert "Archives for demo-repo" in captured.out
+    assert "aaa111" in captured.out
+    assert "bbb222" in captured.out
+    assert captured.out.index("bbb222") < captured.out.index("aaa111")
+
+
 def test_summarize_diff_changes_counts_entries_by_type() -> None:
     result = DiffResult.model_validate(
         {
@@ -6,8 +6,10 @@ from pathlib import Path
 from types import SimpleNamespace
 
 import pytest
+from pydantic import ValidationError
 
-from borgboi.clients.borg_client import BorgClient
+from borgboi.clients.borg_client import BorgClient, _resolve_executable
+from borgboi.clients.borg_models import RepoInfo
 from borgboi.config import BorgConfig
 from borgboi.core.errors import BorgError
 from borgboi.core.models import DiffOptions
@@ -40,6 +42,33 @@ def test_create_defaults_to_config_compression(monkeypatch: pytest.MonkeyPatch)
 # so each progress tick becomes its own yielded line.
 
 
+@pytest.fixture(autouse=True)
+def _unresolved_executables(monkeypatch: pytest.MonkeyPatch) -> Generator[None]:
+    """Keep bare executable names as-is so command assertions do not depend on the host PATH."""
+    monkeypatch.setattr("borgboi.clients.borg_client.shutil.which", lambda _name: None)
+    _resolve_executable.cache_clear()
+    yield
+    _resolve_executable.cache_clear()
+
+
+def test_run_command_spawns_resolved_executable_without_closing_fds(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = BorgClient(config=BorgConfig(executable_path="borg"), output_handler=SilentOutputHandler())
+    captured: dict[str, object] = {}
+
+    def fake_run(cmd: list[str], **kwargs: object) -> sp.CompletedProcess[str]:
+        captured["cmd"] = cmd
+        captured["close_fds"] = kwargs.get("close_fds")
+        return sp.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+    monkeypatch.setattr("borgboi.clients.borg_client.shutil.which", lambda name: f"/opt/borg/bin/{name}")
+    monkeypatch.setattr("borgboi.clients.borg_client.sp.run", fake_run)
+
+    client._run_command(["borg", "info", "/repo"])
+
+    assert captured["cmd"] == ["/opt/borg/bin/borg", "info", "/repo"]
+    assert captured["close_fds"] is False
+
+
 def _make_client() -> BorgClient:
     """Create a BorgClient with silent output for testing."""
     return BorgClient(output_handler=SilentOutputHandler())
@@ -81,6 +110,82 @@ def test_streaming_command_splits_on_all_line_endings(
     assert lines == expected
 
 
+def test_stdout_streaming_command_yields_lines_and_raises_with_stderr() -> None:
+    client = _make_client()
+    script = r"import sys; sys.stdout.write('one\ntwo\n'); sys.stdout.flush(); sys.stderr.write('boom'); sys.exit(2)"
+
+    lines: list[str] = []
+    with pytest.raises(BorgError) as exc_info:
+        lines.extend(client._run_stdout_streaming_command([sys.executable, "-c", script]))
+
+    assert lines == ["one", "two"]
+    assert exc_info.value.stderr == "boom"
+
+
+def test_stdout_streaming_command_drains_stderr_concurrently() -> None:
+    client = _make_client()
+    # Fills more than a pipe buffer on stderr before any stdout is written.
+    script = "import sys; sys.stderr.write('w' * (1 << 20)); sys.stderr.flush(); print('done')"
+
+    lines = list(client._run_stdout_streaming_command([sys.executable, "-c", script]))
+
+    assert lines == ["done"]
+
+
+def test_iter_archives_parses_streamed_format_lines(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = _make_client()
+    captured_cmds: list[list[str]] = []
+    test_passphrase = "secret"  # noqa: S105
+
+    def fake_run_stdout_streaming_command(cmd: list[str], passphrase: str | None = None) -> Generator[str]:
+        captured_cmds.append(cmd)
+        assert passphrase == test_passphrase
+        yield "2026-01-01_00:00:00\x00aaa\x002026-01-01T00:00:00.000000\x002026-01-01T00:00:01.000000"
+        yield ""
+        yield "2026-01-02_00:00:00\x00bbb\x002026-01-02T00:00:00.000000\x002026-01-02T00:00:01.000000"
+
+    monkeypatch.setattr(client, "_run_stdout_streaming_command", fake_run_stdout_streaming_command)
+
+    archives = list(client.iter_archives("/repo", passphrase=test_passphrase))
+
+    assert [(archive.name, archive.id) for archive in archives] == [
+        ("2026-01-01_00:00:00", "aaa"),
+        ("2026-01-02_00:00:00", "bbb"),
+    ]
+    assert archives[0].start == "2026-01-01T00:00:00.000000"
+    assert captured_cmds[0][1:3] == ["list", "--format"]
+    assert captured_cmds[0][-1] == "/repo"
+
+
+def test_iter_archives_warns_and_skips_malformed_lines(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = _make_client()
+    warnings: list[tuple[str, dict[str, object]]] = []
+
+    def fake_run_stdout_streaming_command(cmd: list[str], passphrase: str | None = None) -> Generator[str]:
+        _ = (cmd, passphrase)
+        yield "not-a-formatted-line"
+        yield "2026-01-02_00:00:00\x00bbb\x002026-01-02T00:00:00.000000\x002026-01-02T00:00:01.000000"
+
+    monkeypatch.setattr(client, "_run_stdout_streaming_command", fake_run_stdout_streaming_command)
+    monkeypatch.setattr(
+        "borgboi.clients.borg_client.logger",
+        SimpleNamespace(
+            debug=lambda *_args, **_kwargs: None,
+            warning=lambda event, **kwargs: warnings.append((event, kwargs)),
+        ),
+    )
+
+    archives = list(client.iter_archives("/repo"))
+
+    assert [archive.id for archive in archives] == ["bbb"]
+    assert warnings == [
+        (
+            "Skipping malformed archive list line",
+            {"repo_path": "/repo", "field_count": 1, "expected_field_count": 4},
+        )
+    ]
+
+
 def test_set_storage_quota_uses_borg_config(monkeypatch: pytest.MonkeyPatch) -> None:
     client = BorgClient(config=BorgConfig(executable_path="borg"), output_handler=SilentOutputHandler())
     captured: dict[str, object] = {}
@@ -219,11 +324,13 @@ def test_extract_file_to_stdout_capped_returns_full_payload_when_under_cap(monke
         stdout: int | None = None,
         stderr: int | None = None,
         env: dict[str, str] | None = None,
+        close_fds: bool = True,
     ) -> FakeProcess:
         captured["cmd"] = cmd
         captured["stdout"] = stdout
         captured["stderr"] = stderr
         captured["env"] = env
+        captured["close_fds"] = close_fds
         return process
 
     monkeypatch.setattr("borgboi.clients.borg_client.sp.Popen", fake_popen)
@@ -240,6 +347,7 @@ def test_extract_file_to_stdout_capped_returns_full_payload_when_under_cap(monke
     assert payload.payload == b"hello world\n"
     assert payload.truncated is False
     assert captured["stderr"] == sp.PIPE
+    assert captured["close_fds"] is False
     assert process.stdout.closed is True
 
 
@@ -257,8 +365,9 @@ def test_extract_file_to_stdout_capped_preserves_stderr_on_failure(monkeypatch:
         stdout: int | None = None,
         stderr: int | None = None,
         env: dict[str, str] | None = None,
+        close_fds: bool = True,
     ) -> SimpleNamespace:
-        _ = (cmd, stdout, stderr, env)
+        _ = (cmd, stdout, stderr, env, close_fds)
         return process
 
     monkeypatch.setattr("borgboi.clients.borg_client.sp.Popen", fake_popen)
@@ -289,8 +398,9 @@ def test_extract_file_to_stdout_capped_truncates_large_payload(monkeypatch: pyte
         stdout: int | None = None,
         stderr: int | None = None,
         env: dict[str, str] | None = None,
+        close_fds: bool = True,
     ) -> SimpleNamespace:
-        _ = (cmd, stdout, stderr, env)
+        _ = (cmd, stdout, stderr, env, close_fds)
         return process
 
     monkeypatch.setattr("borgboi.clients.borg_client.sp.Popen", fake_popen)
@@ -329,8 +439,9 @@ def test_extract_file_to_stdout_capped_bounds_stderr_thread_join(monkeypatch: py
         stdout: int | None = None,
         stderr: int | None = None,
         env: dict[str, str] | None = None,
+        close_fds: bool = True,
     ) -> SimpleNamespace:
-        _ = (cmd, stdout, stderr, env)
+        _ = (cmd, stdout, stderr, env, close_fds)
         return process
 
     monkeypatch.setattr("borgboi.clients.borg_client.sp.Popen", fake_popen)
@@ -408,3 +519,49 @@ def test_diff_archives_preserves_metadata_change_values(monkeypatch: pytest.Monk
     assert result.entries[0].changes[0].type == "mtime"
     assert result.entries[0].changes[0].old == "2026-04-03T10:00:00"
     assert result.entries[0].changes[0].new == "2026-04-03T11:00:00"
+
+
+_BORG_INFO_JSON = (
+    '{"cache": {"path": "/cache", "stats": {"total_chunks": 10, "total_csize": 2147483648,'
+    ' "total_size": 4294967296, "total_unique_chunks": 8, "unique_csize": 1073741824, "unique_size": 1073741824}},'
+    ' "encryption": {"mode": "repokey-blake2"},'
+    ' "repository": {"id": "abc123", "last_modified": "2026-04-03T10:00:00.000000", "location": "/repo"},'
+    ' "security_dir": "/security/abc123"}'
+)
+
+
+def test_info_builds_repo_info_from_borg_json(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = BorgClient(config=BorgConfig(executable_path="borg"), output_handler=SilentOutputHandler())
+
+    def fake_run_command(
+        cmd: list[str],
+        passphrase: str | None = None,
+        capture_output: bool = True,
+    ) -> SimpleNamespace:
+        _ = (cmd, passphrase, capture_output)
+        return SimpleNamespace(stdout=_BORG_INFO_JSON)
+
+    monkeypatch.setattr(client, "_run_command", fake_run_command)
+
+    repo_info = client.info("/repo")
+
+    assert repo_info == RepoInfo.model_validate_json(_BORG_INFO_JSON)
+    assert repo_info.cache.total_size_gb == "4.29"
+    assert repo_info.model_dump_json() == RepoInfo.model_validate_json(_BORG_INFO_JSON).model_dump_json()
+
+
+def test_info_validates_borg_json_missing_required_fields(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = BorgClient(config=BorgConfig(executable_path="borg"), output_handler=SilentOutputHandler())
+
+    def fake_run_command(
+        cmd: list[str],
+        passphrase: str | None = None,
+        capture_output: bool = True,
+    ) -> SimpleNamespace:
+        _ = (cmd, passphrase, capture_output)
+        return SimpleNamespace(stdout='{"encryption": {"mode": "none"}}')
+
+    monkeypatch.setattr(client, "_run_command", fake_run_command)
+
+    with pytest.raises(ValidationError):
+        client.info("/repo")
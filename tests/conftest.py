@@ -54,6 +54,12 @@ def _common_env_config(monkeypatch: pytest.MonkeyPatch, tmp_path_factory: pytest
 
     monkeypatch.setattr(borgboi.config, "resolve_home_dir", lambda: test_home_dir)
 
+    # Drop any AWS session cached by an earlier test so credential and region
+    # lookups see this test's environment.
+    from borgboi.clients.aws import get_session
+
+    get_session.cache_clear()
+
     # Clear the lru_cache so get_config() will create a fresh config.yaml
     # in the temp directory on next call
     borgboi.config.get_config.cache_clear()
@@ -8,7 +8,7 @@ from unittest.mock import Mock
 import pytest
 
 from borgboi.config import Config
-from borgboi.core.errors import ValidationError
+from borgboi.core.errors import StorageError, ValidationError
 from borgboi.core.orchestrator import Orchestrator
 from borgboi.core.output import CollectingOutputHandler
 from borgboi.models import BorgBoiRepo
@@ -326,3 +326,188 @@ def test_get_exclusions_prefers_repo_specific_excludes_file(monkeypatch: pytest.
     repo_specific_excludes_path.write_text("*.iso\n")
 
     assert orchestrator.get_exclusions(repo) == ["*.iso"]
+
+
+def test_create_exclusions_copies_source_contents(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("BORGBOI_HOME", tmp_path.as_posix())
+    cfg = Config(offline=True)
+
+    orchestrator = Orchestrator(
+        config=cfg,
+        borg_client=cast(Any, Mock()),
+        storage=cast(Any, object()),
+    )
+    repo = _build_repo()
+
+    source_file = tmp_path / "source-excludes.txt"
+    source_file.write_text("*.tmp\n.cache/\n")
+    source_file.chmod(0o400)
+
+    excludes_path = orchestrator.create_exclusions(repo, source_file.as_posix())
+
+    assert excludes_path == cfg.borgboi_dir / f"{repo.name}_{cfg.excludes_filename}"
+    assert excludes_path.read_text() == "*.tmp\n.cache/\n"
+    # Permission bits are not mirrored from the source file, so the copy stays writable.
+    excludes_path.write_text("*.iso\n")
+
+
+def test_create_exclusions_streams_large_source_files(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("BORGBOI_HOME", tmp_path.as_posix())
+    monkeypatch.setattr("borgboi.core.orchestrator._EXCLUDES_INLINE_COPY_MAX_BYTES", 4)
+    copyfile = Mock(side_effect=lambda src, dst: Path(dst).write_bytes(Path(src).read_bytes()))
+    monkeypatch.setattr("borgboi.core.orchestrator.shutil.copyfile", copyfile)
+    cfg = Config(offline=True)
+
+    orchestrator = Orchestrator(
+        config=cfg,
+        borg_client=cast(Any, Mock()),
+        storage=cast(Any, object()),
+    )
+    repo = _build_repo()
+
+    source_file = tmp_path / "source-excludes.txt"
+    source_file.write_text("*.tmp\n.cache/\n")
+
+    excludes_path = orchestrator.create_exclusions(repo, source_file.as_posix())
+
+    copyfile.assert_called_once_with(source_file, excludes_path)
+    assert excludes_path.read_text() == "*.tmp\n.cache/\n"
+
+
+def test_create_exclusions_wraps_missing_source_as_storage_error(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setenv("BORGBOI_HOME", tmp_path.as_posix())
+    cfg = Config(offline=True)
+
+    orchestrator = Orchestrator(
+        config=cfg,
+        borg_client=cast(Any, Mock()),
+        storage=cast(Any, object()),
+    )
+
+    with pytest.raises(StorageError, match="Excludes list not created") as exc_info:
+        orchestrator.create_exclusions(_build_repo(), (tmp_path / "missing.txt").as_posix())
+
+    assert isinstance(exc_info.value.cause, FileNotFoundError)
+
+
+def test_delete_excludes_file_removes_repo_file_and_ignores_missing(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setenv("BORGBOI_HOME", tmp_path.as_posix())
+    cfg = Config(offline=True)
+    output_handler = CollectingOutputHandler()
+
+    orchestrator = Orchestrator(
+        config=cfg,
+        borg_client=cast(Any, Mock()),
+        storage=cast(Any, object()),
+        output_handler=output_handler,
+    )
+    repo = _build_repo()
+
+    excludes_path = cfg.borgboi_dir / f"{repo.name}_{cfg.excludes_filename}"
+    excludes_path.parent.mkdir(parents=True, exist_ok=True)
+    excludes_path.write_text("*.tmp\n")
+
+    orchestrator._delete_excludes_file(repo.name)
+    orchestrator._delete_excludes_file(repo.name)
+
+    assert not excludes_path.exists()
+    assert [message for _, message, _ in output_handler.log_messages] == [f"Deleted excludes file for {repo.name}"]
+
+
+def test_remove_exclusion_rewrites_file_without_line(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("BORGBOI_HOME", tmp_path.as_posix())
+    cfg = Config(offline=True)
+
+    orchestrator = Orchestrator(
+        config=cfg,
+        borg_client=cast(Any, Mock()),
+        storage=cast(Any, object()),
+        output_handler=CollectingOutputHandler(),
+    )
+    repo = _build_repo()
+
+    excludes_path = cfg.borgboi_dir / f"{repo.name}_{cfg.excludes_filename}"
+    excludes_path.parent.mkdir(parents=True, exist_ok=True)
+    excludes_path.write_text("*.tmp\n.cache/\n*.iso\n")
+    excludes_path.chmod(0o640)
+
+    orchestrator.remove_exclusion(repo, 2)
+
+    assert excludes_path.read_text() == "*.tmp\n*.iso\n"
+    assert excludes_path.stat().st_mode & 0o777 == 0o640
+    assert not list(excludes_path.parent.glob(f".{excludes_path.name}.*"))
+
+
+@pytest.mark.parametrize("line_number", [0, 4])
+def test_remove_exclusion_rejects_out_of_range_line(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, line_number: int
+) -> None:
+    monkeypatch.setenv("BORGBOI_HOME", tmp_path.as_posix())
+    cfg = Config(offline=True)
+
+    orchestrator = Orchestrator(
+        config=cfg,
+        borg_client=cast(Any, Mock()),
+        storage=cast(Any, object()),
+        output_handler=CollectingOutputHandler(),
+    )
+    repo = _build_repo()
+
+    excludes_path = cfg.borgboi_dir / f"{repo.name}_{cfg.excludes_filename}"
+    excludes_path.parent.mkdir(parents=True, exist_ok=True)
+    excludes_path.write_text("*.tmp\n.cache/\n*.iso\n")
+    siblings_before = sorted(excludes_path.parent.iterdir())
+
+    with pytest.raises(ValidationError, match=f"Invalid line number: {line_number}"):
+        orchestrator.remove_exclusion(repo, line_number)
+
+    assert excludes_path.read_text() == "*.tmp\n.cache/\n*.iso\n"
+    assert sorted(excludes_path.parent.iterdir()) == siblings_before
+
+
+def test_add_exclusion_appends_pattern_and_returns_its_line(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("BORGBOI_HOME", tmp_path.as_posix())
+    monkeypatch.setattr("borgboi.core.orchestrator._EXCLUDES_READ_CHUNK_CHARS", 4)
+    cfg = Config(offline=True)
+
+    orchestrator = Orchestrator(
+        config=cfg,
+        borg_client=cast(Any, Mock()),
+        storage=cast(Any, object()),
+        output_handler=CollectingOutputHandler(),
+    )
+    repo = _build_repo()
+
+    excludes_path = cfg.borgboi_dir / f"{repo.name}_{cfg.excludes_filename}"
+    excludes_path.parent.mkdir(parents=True, exist_ok=True)
+    excludes_path.write_text("*.tmp\n.cache/\n")
+
+    assert orchestrator.add_exclusion(repo, "*.iso") == 3
+    assert orchestrator.add_exclusion(repo, "logs/") == 4
+    assert excludes_path.read_text() == "*.tmp\n.cache/\n*.iso\nlogs/\n"
+
+
+def test_excludes_paths_resolve_home_dir_once_per_filename(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    resolve_calls: list[None] = []
+
+    def resolve_home_dir() -> Path:
+        resolve_calls.append(None)
+        return tmp_path
+
+    monkeypatch.setattr("borgboi.config.resolve_home_dir", resolve_home_dir)
+    orchestrator = Orchestrator(
+        config=Config(offline=True),
+        borg_client=cast(Any, Mock()),
+        storage=cast(Any, object()),
+    )
+    resolve_calls.clear()
+
+    for _ in range(3):
+        assert orchestrator._get_excludes_path("repo") == tmp_path / ".borgboi" / "repo_excludes.txt"
+        assert orchestrator._get_default_excludes_path() == tmp_path / ".borgboi" / "excludes.txt"
+
+    assert len(resolve_calls) == 2
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import socket
+import threading
 import types
+from collections.abc import Generator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, cast, override
 from unittest.mock import ANY, Mock
@@ -13,7 +16,7 @@ from borgboi.config import Config
 from borgboi.core.errors import RepositoryNotFoundError, StorageError, ValidationError
 from borgboi.core.models import DiffOptions, RetentionPolicy
 from borgboi.core.orchestrator import Orchestrator
-from borgboi.core.output import CollectingOutputHandler
+from borgboi.core.output import CollectingOutputHandler, DefaultOutputHandler
 from borgboi.lib.colors import COLOR_HEX
 from borgboi.models import BorgBoiRepo
 
@@ -1049,11 +1052,140 @@ def test_daily_backup_runs_steps_and_syncs_when_enabled(output_handler: Collecti
         monkeypatch.undo()
 
     assert steps == ["backup", "prune", "compact", "sync"]
-    storage.save.assert_called_once_with(repo)
+    storage.update_fields.assert_called_once_with(repo, ("metadata",))
+    storage.save.assert_not_called()
     assert repo.metadata == {"metadata": "fresh"}
     assert any(message == "Daily backup completed successfully" for _, message, _ in output_handler.log_messages)
 
 
+def test_daily_backup_fetches_repo_info_while_syncing_to_s3(output_handler: CollectingOutputHandler) -> None:
+    repo = _build_repo()
+    storage = Mock()
+    info_started = threading.Event()
+    sync_finished = threading.Event()
+
+    def info(repo_path: str, passphrase: str | None = None) -> RepoInfo:
+        info_started.set()
+        assert not sync_finished.is_set()
+        return _build_repo_info()
+
+    borg_client = Mock()
+    borg_client.info.side_effect = info
+
+    def sync(repo_obj: BorgBoiRepo) -> None:
+        # The sync only finishes once `borg info` is already running alongside it.
+        assert info_started.wait(timeout=5)
+        sync_finished.set()
+
+    orchestrator = Orchestrator(
+        config=Config(offline=False),
+        borg_client=cast(Any, borg_client),
+        storage=cast(Any, storage),
+        s3_client=cast(Any, Mock()),
+        output_handler=output_handler,
+    )
+    monkeypatch = pytest.MonkeyPatch()
+    monkeypatch.setattr(orchestrator, "resolve_passphrase", lambda repo_obj, cli_passphrase=None: "resolved-passphrase")
+    monkeypatch.setattr(orchestrator, "backup", lambda repo_obj, passphrase=None, options=None: None)
+    monkeypatch.setattr(orchestrator, "prune", lambda repo_obj, passphrase=None, retention=None: None)
+    monkeypatch.setattr(orchestrator, "compact", lambda repo_obj, passphrase=None: None)
+    monkeypatch.setattr(orchestrator, "sync_to_s3", sync)
+
+    try:
+        orchestrator.daily_backup(repo, sync_to_s3=True)
+    finally:
+        monkeypatch.undo()
+
+    assert sync_finished.is_set()
+    borg_client.info.assert_called_once_with(repo.path, passphrase="resolved-passphrase")  # noqa: S106
+    storage.update_fields.assert_called_once_with(repo, ("metadata",))
+    assert repo.metadata == _build_repo_info()
+
+
+@pytest.mark.parametrize(
+    ("repo_path", "expected"),
+    [
+        pytest.param("/home/user/tmp/borg-repo", True, id="nested-tmp"),
+        pytest.param("/private/var/folders/ab/T/borg-repo", True, id="macos-private-var"),
+        pytest.param("/private/var", False, id="bare-private-var"),
+        pytest.param("/var/lib/borg-repo", False, id="var"),
+        pytest.param("/home/user/private/borg-repo", False, id="private-component"),
+        pytest.param("/home/user/tmpfiles/borg-repo", False, id="tmp-prefix"),
+    ],
+)
+def test_should_skip_additional_free_space_matches_scratch_paths(
+    orchestrator_factory: Any,
+    repo_path: str,
+    expected: bool,
+) -> None:
+    orchestrator = orchestrator_factory(borg_client=Mock(), storage=Mock())
+
+    assert orchestrator._should_skip_additional_free_space(Path(repo_path)) is expected
+
+
+def test_daily_backup_all_runs_each_repo_and_collects_failures(
+    monkeypatch: pytest.MonkeyPatch,
+    orchestrator_factory: Any,
+) -> None:
+    repos = [_build_repo("repo-one"), _build_repo("repo-two"), _build_repo("repo-three")]
+    orchestrator = orchestrator_factory(borg_client=Mock(), storage=Mock())
+    calls: list[tuple[str, bool]] = []
+    failure = RuntimeError("borg exploded")
+
+    def fake_daily_backup(repo: BorgBoiRepo, passphrase: str | None = None, sync_to_s3: bool = True) -> None:
+        del passphrase
+        calls.append((repo.name, sync_to_s3))
+        if repo.name == "repo-two":
+            raise failure
+
+    monkeypatch.setattr(orchestrator, "daily_backup", fake_daily_backup)
+
+    failures = orchestrator.daily_backup_all(repos, sync_to_s3=False, concurrency=2)
+
+    assert sorted(calls) == [("repo-one", False), ("repo-three", False), ("repo-two", False)]
+    assert failures == {"repo-two": failure}
+
+
+@pytest.mark.parametrize(("concurrency", "expected_buffered"), [(2, 2), (1, 0)])
+def test_daily_backup_all_buffers_output_only_when_running_concurrently(
+    monkeypatch: pytest.MonkeyPatch,
+    concurrency: int,
+    expected_buffered: int,
+) -> None:
+    output_handler = DefaultOutputHandler()
+    orchestrator = Orchestrator(
+        config=Config(offline=True), borg_client=Mock(), storage=Mock(), output_handler=output_handler
+    )
+    buffered_threads: list[str] = []
+    backup_threads: list[str] = []
+
+    @contextmanager
+    def buffered() -> Generator[None]:
+        buffered_threads.append(threading.current_thread().name)
+        yield
+
+    def fake_daily_backup(repo: BorgBoiRepo, passphrase: str | None = None, sync_to_s3: bool = True) -> None:
+        del repo, passphrase, sync_to_s3
+        backup_threads.append(threading.current_thread().name)
+
+    monkeypatch.setattr(output_handler, "buffered", buffered)
+    monkeypatch.setattr(orchestrator, "daily_backup", fake_daily_backup)
+
+    orchestrator.daily_backup_all([_build_repo("repo-one"), _build_repo("repo-two")], concurrency=concurrency)
+
+    assert len(backup_threads) == 2
+    assert len(buffered_threads) == expected_buffered
+    if expected_buffered:
+        assert sorted(buffered_threads) == sorted(backup_threads)
+
+
+def test_daily_backup_all_rejects_non_positive_concurrency(orchestrator_factory: Any) -> None:
+    orchestrator = orchestrator_factory(borg_client=Mock(), storage=Mock())
+
+    with pytest.raises(ValueError, match="concurrency"):
+        orchestrator.daily_backup_all([_build_repo()], concurrency=0)
+
+
 def test_delete_archive_compacts_and_refreshes_metadata(output_handler: CollectingOutputHandler) -> None:
     repo = _build_repo()
     storage = Mock()
@@ -1079,7 +1211,7 @@ def test_delete_archive_compacts_and_refreshes_metadata(output_handler: Collecti
         monkeypatch.undo()
 
     compact.assert_called_once_with(repo, passphrase=resolved_passphrase)
-    storage.save.assert_called_once_with(repo)
+    storage.update_fields.assert_called_once_with(repo, ("metadata",))
     assert repo.metadata == {"metadata": "fresh"}
 
 
@@ -1241,3 +1373,20 @@ def test_auto_migrate_passphrase_logs_failure_without_raising(output_handler: Co
         "Failed to auto-migrate passphrase: bad secret" in message for _, message, _ in output_handler.log_messages
     )
     assert any("migrate manually" in message for _, message, _ in output_handler.log_messages)
+
+
+def test_daily_backup_all_runs_concurrently_without_buffering_for_other_handlers(
+    monkeypatch: pytest.MonkeyPatch,
+    orchestrator_factory: Any,
+) -> None:
+    orchestrator = orchestrator_factory(borg_client=Mock(), storage=Mock())
+    calls: list[str] = []
+
+    def fake_daily_backup(repo: BorgBoiRepo, passphrase: str | None = None, sync_to_s3: bool = True) -> None:
+        del passphrase, sync_to_s3
+        calls.append(repo.name)
+
+    monkeypatch.setattr(orchestrator, "daily_backup", fake_daily_backup)
+
+    assert orchestrator.daily_backup_all([_build_repo("repo-one"), _build_repo("repo-two")], concurrency=2) == {}
+    assert sorted(calls) == ["repo-one", "repo-two"]
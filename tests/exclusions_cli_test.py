@@ -154,9 +154,10 @@ def test_exclusions_add_calls_add_exclusion_and_highlights_last_line(
     excludes_path = exclusions_config.borgboi_dir / f"{repo_info.name}_{exclusions_config.excludes_filename}"
     excludes_path.write_text("*.tmp\n.cache/\n", encoding="utf-8")
 
-    def add_exclusion(_: SimpleNamespace, pattern: str) -> None:
+    def add_exclusion(_: SimpleNamespace, pattern: str) -> int:
         with excludes_path.open("a", encoding="utf-8") as file_obj:
             file_obj.write(pattern + "\n")
+        return 3
 
     orchestrator = SimpleNamespace(get_repo=Mock(return_value=repo_info), add_exclusion=Mock(side_effect=add_exclusion))
     ctx = SimpleNamespace(orchestrator=orchestrator, config=exclusions_config)
@@ -1,12 +1,22 @@
 from collections.abc import Generator
 from contextlib import contextmanager
+from types import SimpleNamespace
 from typing import Any
 
 import pytest
+from rich.console import Console
+from rich.text import Text
 
+from borgboi.core import output as output_module
 from borgboi.core.output import CollectingOutputHandler, DefaultOutputHandler
 
 
+@pytest.fixture(autouse=True)
+def _terminal_console(monkeypatch: pytest.MonkeyPatch) -> None:
+    # render_command only drives the live spinner tail on an interactive terminal.
+    monkeypatch.setattr(Console, "is_terminal", property(lambda self: True))
+
+
 def _capture_prints(
     monkeypatch: pytest.MonkeyPatch, handler: DefaultOutputHandler
 ) -> list[tuple[tuple[Any, ...], dict[str, Any]]]:
@@ -92,10 +102,10 @@ def test_render_command_streams_lines_through_on_stderr(monkeypatch: pytest.Monk
         events.append(("rule", args[0]))
 
     @contextmanager
-    def fake_status(*args: Any, **kwargs: Any) -> Generator[None]:
+    def fake_status(*args: Any, **kwargs: Any) -> Generator[SimpleNamespace]:
         events.append(("status_enter", kwargs["status"]))
         try:
-            yield
+            yield SimpleNamespace(update=lambda **_kwargs: None)
         finally:
             events.append(("status_exit", kwargs["spinner"]))
 
@@ -128,6 +138,161 @@ def test_render_command_streams_lines_through_on_stderr(monkeypatch: pytest.Monk
     ]
 
 
+def test_render_command_buffers_file_lines_in_bounded_tail(monkeypatch: pytest.MonkeyPatch) -> None:
+    handler = DefaultOutputHandler()
+    printed = _capture_prints(monkeypatch, handler)
+    monkeypatch.setattr(handler._console, "rule", lambda *args, **kwargs: None)
+    monkeypatch.setattr(output_module, "_COMMAND_TAIL_LINES", 3)
+    monkeypatch.setattr(output_module, "_COMMAND_TAIL_UPDATE_INTERVAL_SECONDS", 0.0)
+    updates: list[list[str]] = []
+
+    @contextmanager
+    def fake_status(*args: Any, **kwargs: Any) -> Generator[SimpleNamespace]:
+        def update(status: Any) -> None:
+            updates.append([renderable.plain for renderable in status.renderables[1:]])
+
+        yield SimpleNamespace(update=update)
+
+    monkeypatch.setattr(handler._console, "status", fake_status)
+
+    lines = [f'{{"type": "file_status", "status": "A", "path": "/data/file-{index}"}}\n' for index in range(5)]
+    lines.append(
+        '{"type": "log_message", "time": 1771889251.6, "levelname": "WARNING", "name": "borg.output", '
+        '"message": "file changed while we backed it up"}\n'
+    )
+    handler.render_command("Creating new archive", "Archive created successfully", lines)
+
+    assert updates[-1] == ["A /data/file-2", "A /data/file-3", "A /data/file-4"]
+    (warning,), _ = printed[0]
+    assert warning.plain == "file changed while we backed it up"
+    assert warning.spans[0].style == "bold yellow"
+    assert printed[1] == (("",), {})
+    assert handler._active_tail() is None
+
+
+def test_render_command_updates_tail_at_most_once_per_spinner_frame(monkeypatch: pytest.MonkeyPatch) -> None:
+    handler = DefaultOutputHandler()
+    _capture_prints(monkeypatch, handler)
+    monkeypatch.setattr(handler._console, "rule", lambda *args, **kwargs: None)
+    updates: list[object] = []
+
+    @contextmanager
+    def fake_status(*args: Any, **kwargs: Any) -> Generator[SimpleNamespace]:
+        assert kwargs["refresh_per_second"] == output_module._COMMAND_TAIL_REFRESH_PER_SECOND
+
+        def update(status: object) -> None:
+            updates.append(status)
+
+        yield SimpleNamespace(update=update)
+
+    monkeypatch.setattr(handler._console, "status", fake_status)
+    frame = output_module._COMMAND_TAIL_UPDATE_INTERVAL_SECONDS
+    monotonic_values = iter([10.0, 10.0 + frame / 2, 10.0 + frame])
+    monkeypatch.setattr(output_module, "monotonic", lambda: next(monotonic_values))
+
+    lines = [f'{{"type": "file_status", "status": "A", "path": "/data/file-{index}"}}\n' for index in range(3)]
+    handler.render_command("Creating new archive", "Archive created successfully", lines)
+
+    assert len(updates) == 2
+
+
+def test_render_command_batches_log_lines_into_one_print(monkeypatch: pytest.MonkeyPatch) -> None:
+    handler = DefaultOutputHandler()
+    printed = _capture_prints(monkeypatch, handler)
+    monkeypatch.setattr(handler._console, "rule", lambda *args, **kwargs: None)
+
+    @contextmanager
+    def fake_status(*args: Any, **kwargs: Any) -> Generator[SimpleNamespace]:
+        yield SimpleNamespace(update=lambda status: None)
+
+    monkeypatch.setattr(handler._console, "status", fake_status)
+    monotonic_values = iter([0.0, 0.0, 0.0])
+    monkeypatch.setattr(output_module, "monotonic", lambda: next(monotonic_values))
+
+    lines = [
+        '{"type": "log_message", "time": 1771889251.6, "levelname": "INFO", "name": "borg.output.list", '
+        f'"message": "Keeping archive: archive-{index} [unclosed"}}\n'
+        for index in range(3)
+    ]
+    handler.render_command("Pruning old backups", "Pruned", lines)
+
+    args, kwargs = printed[0]
+    assert [text.plain for text in args] == [f"Keeping archive: archive-{index} [unclosed" for index in range(3)]
+    assert kwargs == {"sep": "\n"}
+    assert printed[1] == (("",), {})
+
+
+def test_render_command_prints_lines_directly_when_not_a_terminal(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(Console, "is_terminal", property(lambda self: False))
+    handler = DefaultOutputHandler()
+    printed = _capture_prints(monkeypatch, handler)
+    monkeypatch.setattr(handler._console, "rule", lambda *args, **kwargs: None)
+
+    def fail_status(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("status spinner should not start")
+
+    monkeypatch.setattr(handler._console, "status", fail_status)
+
+    monkeypatch.setattr(output_module, "_BATCHED_OUTPUT_MAX_LINES", 2)
+    monkeypatch.setattr(output_module, "monotonic", lambda: 0.0)
+
+    lines = [f'{{"type": "file_status", "status": "A", "path": "/data/file-{index}"}}\n' for index in range(3)]
+    handler.render_command("Creating new archive", "Archive created successfully", lines)
+
+    assert [[text.plain for text in args] for args, _ in printed[:2]] == [
+        ["A /data/file-0", "A /data/file-1"],
+        ["A /data/file-2"],
+    ]
+    assert printed[2] == (("",), {})
+    assert getattr(handler._render_state, "pending_logs", None) is None
+
+
+def test_render_command_keeps_progress_in_order_with_batched_lines(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(Console, "is_terminal", property(lambda self: False))
+    handler = DefaultOutputHandler()
+    printed = _capture_prints(monkeypatch, handler)
+    monkeypatch.setattr(handler._console, "rule", lambda *args, **kwargs: None)
+    monkeypatch.setattr(output_module, "monotonic", lambda: 0.0)
+
+    lines = [
+        '{"type": "file_status", "status": "A", "path": "/data/file-0"}\n',
+        '{"type": "progress_percent", "operation": 1, "msgid": "extract", "finished": false, '
+        '"current": 1, "total": 2, "time": 1234567890.0}\n',
+        '{"type": "file_status", "status": "A", "path": "/data/file-1"}\n',
+    ]
+    handler.render_command("Creating new archive", "Archive created successfully", lines)
+
+    args, kwargs = printed[0]
+    assert [text.plain for text in args] == [
+        "A /data/file-0",
+        "Progress: 1/2 (50.0%)",
+        "A /data/file-1",
+    ]
+    assert kwargs == {"sep": "\n"}
+    assert all(kwargs.get("end") != "\r" for _, kwargs in printed)
+
+
+def test_buffered_routes_worker_output_to_a_private_console_and_replays_it(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    handler = DefaultOutputHandler()
+    printed = _capture_prints(monkeypatch, handler)
+    shared_console = handler._console
+
+    with handler.buffered():
+        assert handler._console is not shared_console
+        handler.on_log("warning", "first")
+        handler.on_log("info", "second")
+        assert printed == []
+
+    assert handler._console is shared_console
+    assert len(printed) == 1
+    (replayed,), kwargs = printed[0]
+    assert isinstance(replayed, Text)
+    assert replayed.plain == "first\nsecond\n"
+    assert kwargs == {"end": ""}
+
+
 def test_collecting_output_handler_render_command_collects_stderr_lines() -> None:
     handler = CollectingOutputHandler()
 
@@ -1,7 +1,19 @@
+import gzip
+import io
+from datetime import UTC, datetime
+from pathlib import Path
+from platform import system
+
 import pytest
+from rich.console import Console
+from rich.style import Style
+from rich.table import Table
 
 from borgboi import rich_utils
+from borgboi.clients.s3 import S3BucketStats, S3StorageClassBreakdown
 from borgboi.core import output as output_module
+from borgboi.lib.colors import COLOR_HEX
+from borgboi.models import BorgBoiRepo
 
 
 def test_render_cmd_output_lines_reuses_default_output_handler(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -36,3 +48,178 @@ def test_render_cmd_output_lines_reuses_default_output_handler(monkeypatch: pyte
     ]
 
     rich_utils._get_default_output_handler.cache_clear()
+
+
+def test_repo_table_row_formats_each_column() -> None:
+    repo = BorgBoiRepo(
+        path="/repo/test-repo",
+        backup_target="/backup/source",
+        name="test-repo",
+        hostname="localhost",
+        os_platform="Darwin" if system() == "Darwin" else "Linux",
+        metadata=None,
+        last_backup=datetime(2025, 3, 7, 12, 0, tzinfo=UTC),
+    )
+
+    row = rich_utils._repo_table_row(repo)
+
+    assert [cell.plain for cell in row] == [
+        "test-repo",
+        "/repo/test-repo",
+        "localhost",
+        "Fri Mar 07, 2025",
+        "🤷Unknown",
+        "/backup/source",
+    ]
+    assert row[0].style == Style.parse(f"bold {COLOR_HEX.sky}")
+    assert row[3].style == Style.parse(f"bold {COLOR_HEX.yellow}")
+    assert row[4].spans[0].style == Style.parse(f"italic {COLOR_HEX.red}")
+
+    repo.name = "[bold]literal"
+    repo.last_backup = None
+    row = rich_utils._repo_table_row(repo)
+    assert row[0].plain == "[bold]literal"
+    assert row[3].plain == "Never"
+    assert row[3] is rich_utils._REPO_NEVER_BACKED_UP
+    assert row[4] is rich_utils._REPO_SIZE_UNKNOWN
+
+
+def test_console_records_only_after_opt_in(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(rich_utils, "console", rich_utils.Console(file=io.StringIO()))
+
+    rich_utils.console.print("before recording")
+    rich_utils.record_console_output()
+    rich_utils.console.print("while recording")
+    rich_utils.save_console_output()
+    rich_utils.console.print("after saving")
+
+    html = (tmp_path / "borgboi_output.html").read_text()
+    assert "while recording" in html
+    assert "before recording" not in html
+    assert rich_utils.console.record is False
+    rich_utils.record_console_output()
+    assert rich_utils.console.export_text() == ""
+
+
+@pytest.fixture
+def terminal_console(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(rich_utils.Console, "is_terminal", property(lambda self: True))
+    monkeypatch.delenv("BORGBOI_PLAIN", raising=False)
+
+
+@pytest.mark.usefixtures("terminal_console")
+def test_output_repos_table_does_not_share_column_cells(monkeypatch: pytest.MonkeyPatch) -> None:
+    printed: list[object] = []
+    monkeypatch.setattr(rich_utils.console, "print", printed.append)
+    repo = BorgBoiRepo(
+        path="/repo/test-repo",
+        backup_target="/backup/source",
+        name="test-repo",
+        hostname="localhost",
+        os_platform="Darwin" if system() == "Darwin" else "Linux",
+        metadata=None,
+    )
+
+    rich_utils.output_repos_table([repo])
+    rich_utils.output_repos_table([repo, repo])
+
+    first, second = printed
+    assert isinstance(first, Table)
+    assert isinstance(second, Table)
+    assert first.row_count == 1
+    assert [column.header for column in second.columns] == [column.header for column in first.columns]
+    assert all(len(column._cells) == 2 for column in second.columns)
+    assert all(not column._cells for column in rich_utils._REPOS_TABLE_COLUMNS)
+
+    rendered = Console(file=io.StringIO(), width=60)
+    rendered.print(first)
+    rendered.print(second)
+    assert rich_utils._REPO_NEVER_BACKED_UP.plain == "Never"
+    assert rich_utils._REPO_SIZE_UNKNOWN.plain == "🤷Unknown"
+
+
+@pytest.mark.usefixtures("terminal_console")
+def test_output_s3_bucket_stats_formats_storage_breakdown(monkeypatch: pytest.MonkeyPatch) -> None:
+    printed: list[object] = []
+    monkeypatch.setattr(rich_utils.console, "print", printed.append)
+    stats = S3BucketStats(
+        bucket_name="bucket",
+        total_size_bytes=4 * 1024**3,
+        total_object_count=10,
+        storage_breakdown=[
+            S3StorageClassBreakdown(storage_class="STANDARD", tier="Frequent", size_bytes=3 * 1024**3),
+            S3StorageClassBreakdown(storage_class="GLACIER", tier="Archive", size_bytes=1024**3),
+        ],
+    )
+
+    rich_utils.output_s3_bucket_stats(stats)
+
+    composition = printed[-1]
+    assert isinstance(composition, Table)
+    assert [list(column.cells) for column in composition.columns] == [
+        ["STANDARD", "GLACIER"],
+        ["Frequent", "Archive"],
+        ["3.00", "1.00"],
+        ["75.00%", "25.00%"],
+    ]
+
+
+def test_save_console_output_can_write_gzipped_html(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(rich_utils, "console", rich_utils.Console(file=io.StringIO()))
+
+    rich_utils.record_console_output()
+    rich_utils.console.print("compressed line")
+    rich_utils.save_console_output(compress=True)
+
+    assert not (tmp_path / "borgboi_output.html").exists()
+    with gzip.open(tmp_path / "borgboi_output.html.gz", "rt", encoding="utf-8") as html_file:
+        assert "compressed line" in html_file.read()
+    assert rich_utils.console.record is False
+
+
+def test_scoped_console_overrides_get_console_within_the_block() -> None:
+    scoped = rich_utils.Console(file=io.StringIO())
+
+    assert rich_utils.get_console() is rich_utils.console
+    with rich_utils.scoped_console(scoped) as active:
+        assert active is scoped
+        assert rich_utils.get_console() is scoped
+    assert rich_utils.get_console() is rich_utils.console
+
+
+def test_output_repos_table_prints_tab_separated_rows_when_not_a_terminal(monkeypatch: pytest.MonkeyPatch) -> None:
+    printed: list[str] = []
+    monkeypatch.setattr(rich_utils.console, "out", lambda text, **kwargs: printed.append(text))
+    repo = BorgBoiRepo(
+        path="/repo/test-repo",
+        backup_target="/backup/source",
+        name="test-repo",
+        hostname="localhost",
+        os_platform="Darwin" if system() == "Darwin" else "Linux",
+        metadata=None,
+    )
+
+    rich_utils.output_repos_table([repo])
+
+    assert printed == [
+        "Name\tLocal Path\tHostname\tLast Archive\tSize\tBackup Target\n"
+        "test-repo\t/repo/test-repo\tlocalhost\tNever\tUnknown\t/backup/source"
+    ]
+
+
+@pytest.mark.usefixtures("terminal_console")
+def test_borgboi_plain_forces_plain_s3_stats_on_a_terminal(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("BORGBOI_PLAIN", "1")
+    printed: list[str] = []
+    monkeypatch.setattr(rich_utils.console, "out", lambda text, **kwargs: printed.append(text))
+    monkeypatch.setattr(rich_utils.console, "print", lambda *args, **kwargs: pytest.fail("rich output used"))
+    stats = S3BucketStats(bucket_name="bucket", total_size_bytes=0, total_object_count=0, storage_breakdown=[])
+
+    rich_utils.output_s3_bucket_stats(stats)
+
+    (text,) = printed
+    lines = text.splitlines()
+    assert lines[0] == "Bucket\tbucket"
+    assert lines[-3:] == ["", "Storage Class\tTier\tSize (GB)\t% of Bucket", "No data\t-\t0.00\t0.00%"]
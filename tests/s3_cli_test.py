@@ -27,6 +27,8 @@ def test_s3_stats_renders_panel_and_table(monkeypatch: pytest.MonkeyPatch) -> No
     )
 
     monkeypatch.setattr(s3_client, "get_bucket_stats", lambda cfg=None: stats)
+    monkeypatch.setattr(rich_utils.Console, "is_terminal", property(lambda self: True))
+    monkeypatch.delenv("BORGBOI_PLAIN", raising=False)
 
     printed: list[Any] = []
 
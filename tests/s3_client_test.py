@@ -52,7 +52,19 @@ def test_sync_to_bucket_builds_expected_command(
     assert output == ["uploaded"]
     assert recorded == [
         (
-            ["aws", "s3", "sync", "repo-dir", "s3://test-bucket/repo-one", "--storage-class", "INTELLIGENT_TIERING"],
+            [
+                "aws",
+                "s3",
+                "sync",
+                "repo-dir",
+                "s3://test-bucket/repo-one",
+                "--storage-class",
+                "INTELLIGENT_TIERING",
+                "--exclude",
+                "lock.exclusive/*",
+                "--exclude",
+                "lock.roster",
+            ],
             "Failed to sync repo-one to S3",
         )
     ]
@@ -157,6 +169,15 @@ def test_run_streaming_command_splits_aws_progress_line_endings(
     assert lines == expected
 
 
+def test_run_streaming_command_drains_stderr_while_reading_stdout(client: s3_client_module.S3Client) -> None:
+    # Writes more to stderr than a pipe buffer holds before emitting any stdout.
+    script = "import sys; sys.stderr.write('w' * (1 << 20)); sys.stderr.flush(); print('done')"
+
+    lines = list(client._run_streaming_command([sys.executable, "-c", script]))
+
+    assert lines == ["done"]
+
+
 def test_run_streaming_command_raises_when_stdout_missing(
     monkeypatch: pytest.MonkeyPatch,
     client: s3_client_module.S3Client,
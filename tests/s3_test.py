@@ -25,29 +25,15 @@ def test_sync_with_s3_success(monkeypatch: pytest.MonkeyPatch) -> None:
     # Mock subprocess.Popen
     class MockProc:
         def __init__(self) -> None:
-            self.stdout: MockStdout = MockStdout()
+            self.stdout: io.BytesIO = io.BytesIO(
+                b"upload: ./file1.txt to s3://test-bucket/test-repo/file1.txt\n"
+                b"upload: ./file2.txt to s3://test-bucket/test-repo/file2.txt\n"
+            )
+            self.stderr: None = None
 
         def wait(self) -> Literal[0]:
             return 0
 
-    class MockStdout:
-        def __init__(self) -> None:
-            self.call_count: int = 0
-            self.lines: list[bytes] = [
-                b"upload: ./file1.txt to s3://test-bucket/test-repo/file1.txt\n",
-                b"upload: ./file2.txt to s3://test-bucket/test-repo/file2.txt\n",
-                b"",
-            ]
-
-        def readable(self) -> bool:
-            self.call_count += 1
-            return self.call_count <= 2
-
-        def readline(self) -> bytes:
-            if self.call_count <= len(self.lines):
-                return self.lines[self.call_count - 1]
-            return b""
-
     mock_proc = MockProc()
     monkeypatch.setattr("subprocess.Popen", lambda *args, **kwargs: mock_proc)  # pyright: ignore[reportUnknownArgumentType, reportUnknownLambdaType]
     output_lines = list(s3.sync_with_s3("/path/to/repo", "test-repo", cfg=cfg))
@@ -57,6 +43,34 @@ def test_sync_with_s3_success(monkeypatch: pytest.MonkeyPatch) -> None:
     assert "upload: ./file2.txt to s3://test-bucket/test-repo/file2.txt" in output_lines[1]
 
 
+def test_sync_with_s3_yields_carriage_return_progress_as_lines(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Progress redrawn with a bare carriage return is yielded one update at a time."""
+    cfg = _make_config("test-bucket")
+
+    class MockProc:
+        def __init__(self) -> None:
+            self.stdout: io.BytesIO = io.BytesIO(
+                b"Completed 1 MiB/3 MiB\rCompleted 2 MiB/3 MiB\rCompleted 3 MiB/3 MiB\r"
+                b"upload: ./file1.txt to s3://test-bucket/test-repo/file1.txt\n"
+            )
+            self.stderr: None = None
+
+        def wait(self) -> Literal[0]:
+            return 0
+
+    mock_proc = MockProc()
+    monkeypatch.setattr("subprocess.Popen", lambda *args, **kwargs: mock_proc)  # pyright: ignore[reportUnknownArgumentType, reportUnknownLambdaType]
+    output_lines = list(s3.sync_with_s3("/path/to/repo", "test-repo", cfg=cfg))
+
+    assert output_lines == [
+        "Completed 1 MiB/3 MiB\n",
+        "Completed 2 MiB/3 MiB\n",
+        "Completed 3 MiB/3 MiB\n",
+        "upload: ./file1.txt to s3://test-bucket/test-repo/file1.txt\n",
+    ]
+    assert mock_proc.stdout.closed
+
+
 def test_sync_with_s3_missing_bucket_env(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test S3 sync uses default bucket from config when env var is not set."""
     # Config now provides default value, so no KeyError should be raised
@@ -65,15 +79,12 @@ def test_sync_with_s3_missing_bucket_env(monkeypatch: pytest.MonkeyPatch) -> Non
 
     class MockProc:
         def __init__(self) -> None:
-            self.stdout: MockStdout = MockStdout()
+            self.stdout: io.BytesIO = io.BytesIO()
+            self.stderr: None = None
 
         def wait(self) -> Literal[0]:
             return 0
 
-    class MockStdout:
-        def readable(self) -> Literal[False]:
-            return False
-
     mock_proc = MockProc()
     monkeypatch.setattr("subprocess.Popen", lambda *args, **kwargs: mock_proc)  # pyright: ignore[reportUnknownArgumentType, reportUnknownLambdaType]
 
@@ -88,16 +99,13 @@ def test_sync_with_s3_command_failure(monkeypatch: pytest.MonkeyPatch) -> None:
 
     class MockProc:
         def __init__(self) -> None:
-            self.stdout: MockStdout = MockStdout()
+            self.stdout: io.BytesIO = io.BytesIO()
+            self.stderr: None = None
             self.returncode: int = 1  # Non-zero exit code
 
         def wait(self) -> Literal[1]:
             return 1  # Non-zero exit code
 
-    class MockStdout:
-        def readable(self) -> Literal[False]:
-            return False
-
     mock_proc = MockProc()
     monkeypatch.setattr("subprocess.Popen", lambda *args, **kwargs: mock_proc)  # pyright: ignore[reportUnknownArgumentType, reportUnknownLambdaType]
     with pytest.raises(sp.CalledProcessError):
@@ -124,15 +132,12 @@ def test_sync_with_s3_runs_without_error(monkeypatch: pytest.MonkeyPatch) -> Non
 
     class MockProc:
         def __init__(self) -> None:
-            self.stdout: MockStdout = MockStdout()
+            self.stdout: io.BytesIO = io.BytesIO()
+            self.stderr: None = None
 
         def wait(self) -> Literal[0]:
             return 0
 
-    class MockStdout:
-        def readable(self) -> Literal[False]:
-            return False
-
     mock_proc = MockProc()
     monkeypatch.setattr("subprocess.Popen", lambda *args, **kwargs: mock_proc)  # pyright: ignore[reportUnknownArgumentType, reportUnknownLambdaType]
     _ = list(s3.sync_with_s3("/home/user/repos/my-repo", "my-repo", cfg=cfg))
@@ -91,6 +91,53 @@ def test_get_wraps_invalid_table_item_as_storage_error(storage: DynamoDBStorage)
     assert exc_info.value.operation == "get"
 
 
+def test_update_fields_updates_only_named_attributes(storage: DynamoDBStorage) -> None:
+    storage.save(_make_repo())
+
+    repo = _make_repo()
+    repo.backup_target = "/backup/other"
+    repo.last_backup = datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC)
+    storage.update_fields(repo, ("last_backup",))
+
+    result = storage.get(repo.name)
+    assert result.last_backup == repo.last_backup
+    assert result.backup_target == "/backup/source"
+
+
+def test_update_fields_removes_cleared_attributes(storage: DynamoDBStorage) -> None:
+    repo = _make_repo()
+    repo.last_s3_sync = datetime(2026, 1, 2, tzinfo=UTC)
+    storage.save(repo)
+
+    repo.last_s3_sync = None
+    storage.update_fields(repo, ("last_s3_sync",))
+
+    assert storage.get(repo.name).last_s3_sync is None
+
+
+def test_update_fields_does_not_create_missing_repo(storage: DynamoDBStorage) -> None:
+    with pytest.raises(RepositoryNotFoundError):
+        storage.update_fields(_make_repo(), ("last_backup",))
+
+    assert storage.exists("repo-one") is False
+
+
+def test_update_fields_skips_write_for_unpersisted_fields(
+    monkeypatch: pytest.MonkeyPatch, storage: DynamoDBStorage
+) -> None:
+    def fail_update_item(**kwargs: object) -> None:
+        raise AssertionError("update_item should not be called")
+
+    monkeypatch.setattr(storage, "_table", SimpleNamespace(update_item=fail_update_item))
+
+    storage.update_fields(_make_repo(), ("metadata",))
+
+
+def test_update_fields_rejects_key_fields(storage: DynamoDBStorage) -> None:
+    with pytest.raises(ValueError, match="hostname, path"):
+        storage.update_fields(_make_repo(), ("path", "hostname"))
+
+
 def test_list_all_skips_invalid_rows(storage: DynamoDBStorage, monkeypatch: pytest.MonkeyPatch) -> None:
     valid_repo = _make_repo()
     storage.save(valid_repo)
@@ -100,7 +147,7 @@ def test_list_all_skips_invalid_rows(storage: DynamoDBStorage, monkeypatch: pyte
     def record(message: str) -> None:
         print_mock.calls.append(message)
 
-    monkeypatch.setattr("borgboi.storage.dynamodb.console.print", record)
+    monkeypatch.setattr("borgboi.rich_utils.console.print", record)
 
     repos = storage.list_all()
 
@@ -127,16 +174,197 @@ def test_delete_by_path_raises_when_repo_missing(storage: DynamoDBStorage) -> No
 
 def test_exists_returns_false_when_query_raises(monkeypatch: pytest.MonkeyPatch, storage: DynamoDBStorage) -> None:
     fake_table = SimpleNamespace(query=lambda **kwargs: (_ for _ in ()).throw(RuntimeError("boom")))
-    monkeypatch.setattr(DynamoDBStorage, "_table", property(lambda self: fake_table))
+    monkeypatch.setattr(storage, "_table", fake_table)
 
     assert storage.exists("repo-one") is False
 
 
 def test_save_wraps_backend_errors(monkeypatch: pytest.MonkeyPatch, storage: DynamoDBStorage) -> None:
     fake_table = SimpleNamespace(put_item=lambda **kwargs: (_ for _ in ()).throw(RuntimeError("write failed")))
-    monkeypatch.setattr(DynamoDBStorage, "_table", property(lambda self: fake_table))
+    monkeypatch.setattr(storage, "_table", fake_table)
 
     with pytest.raises(StorageError, match="Failed to save repository repo-one") as exc_info:
         storage.save(_make_repo())
 
     assert exc_info.value.operation == "save"
+
+
+def test_get_reuses_cached_repo_until_invalidated(storage: DynamoDBStorage) -> None:
+    repo = _make_repo()
+    storage.save(repo)
+    assert storage.get(repo.name).backup_target == "/backup/source"
+
+    storage._table.update_item(
+        Key={"repo_path": repo.path, "hostname": repo.hostname},
+        UpdateExpression="SET backup_target_path = :target",
+        ExpressionAttributeValues={":target": "/backup/elsewhere"},
+    )
+
+    assert storage.get(repo.name).backup_target == "/backup/source"
+    storage.invalidate_cache()
+    assert storage.get(repo.name).backup_target == "/backup/elsewhere"
+
+
+def test_get_by_path_cache_expires_after_ttl(monkeypatch: pytest.MonkeyPatch, create_dynamodb_table: None) -> None:
+    del create_dynamodb_table
+    now = [100.0]
+    monkeypatch.setattr("borgboi.storage.dynamodb.time.monotonic", lambda: now[0])
+    storage = DynamoDBStorage(config=Config(), cache_ttl_seconds=5)
+    repo = _make_repo()
+    storage.save(repo)
+    storage.get_by_path(repo.path, hostname=repo.hostname)
+    storage._table.delete_item(Key={"repo_path": repo.path, "hostname": repo.hostname})
+
+    now[0] += 4
+    assert storage.get_by_path(repo.path, hostname=repo.hostname).name == repo.name
+
+    now[0] += 1
+    with pytest.raises(RepositoryNotFoundError):
+        storage.get_by_path(repo.path, hostname=repo.hostname)
+
+
+def test_cached_repos_are_independent_copies(storage: DynamoDBStorage) -> None:
+    storage.save(_make_repo())
+
+    first = storage.get("repo-one")
+    first.backup_target = "/mutated"
+
+    assert storage.get("repo-one").backup_target == "/backup/source"
+
+
+def test_writes_invalidate_cached_repos(storage: DynamoDBStorage) -> None:
+    repo = _make_repo()
+    storage.save(repo)
+    storage.get(repo.name)
+
+    repo.last_backup = datetime(2026, 1, 2, tzinfo=UTC)
+    storage.update_fields(repo, ("last_backup",))
+    assert storage.get(repo.name).last_backup == repo.last_backup
+
+    storage.delete(repo.name)
+    with pytest.raises(RepositoryNotFoundError):
+        storage.get(repo.name)
+
+
+def test_list_all_reuses_on_disk_snapshot_across_instances(
+    monkeypatch: pytest.MonkeyPatch, create_dynamodb_table: None
+) -> None:
+    del create_dynamodb_table
+    writer = DynamoDBStorage(config=Config())
+    writer.save(_make_repo())
+    assert [repo.name for repo in writer.list_all()] == ["repo-one"]
+
+    reader = DynamoDBStorage(config=Config())
+
+    def fail_scan(**kwargs: object) -> None:
+        raise AssertionError("scan should not be called while the snapshot is fresh")
+
+    monkeypatch.setattr(reader, "_table", SimpleNamespace(scan=fail_scan))
+
+    assert [repo.name for repo in reader.list_all()] == ["repo-one"]
+    assert reader._repo_list_cache_path.stat().st_mode & 0o777 == 0o600
+
+
+def test_list_all_does_not_snapshot_legacy_passphrases(storage: DynamoDBStorage) -> None:
+    repo = _make_repo()
+    repo.passphrase = "legacy-secret"  # noqa: S105
+    storage.save(repo)
+
+    assert [repo.name for repo in storage.list_all()] == ["repo-one"]
+    assert not storage._repo_list_cache_path.exists()
+
+
+def test_list_all_snapshot_expires_and_is_cleared_by_writes(
+    monkeypatch: pytest.MonkeyPatch, create_dynamodb_table: None
+) -> None:
+    del create_dynamodb_table
+    now = [1_000.0]
+    monkeypatch.setattr("borgboi.storage.dynamodb.time.time", lambda: now[0])
+    storage = DynamoDBStorage(config=Config(), list_cache_ttl_seconds=10)
+    storage.save(_make_repo())
+    storage.list_all()
+
+    storage._table.put_item(
+        Item={
+            "repo_path": "/repos/two",
+            "hostname": "remote-host",
+            "repo_name": "repo-two",
+            "backup_target_path": "/backup/two",
+            "os_platform": "Linux",
+        }
+    )
+    assert [repo.name for repo in storage.list_all()] == ["repo-one"]
+
+    now[0] += 10
+    assert sorted(repo.name for repo in storage.list_all()) == ["repo-one", "repo-two"]
+
+    storage.delete("repo-two")
+    assert not storage._repo_list_cache_path.exists()
+    assert [repo.name for repo in storage.list_all()] == ["repo-one"]
+
+
+def test_table_resource_is_built_when_storage_is_created(storage: DynamoDBStorage) -> None:
+    assert "_table" in vars(storage)
+    assert storage._table.name == storage.table_name
+
+
+def test_list_all_follows_scan_pages_in_every_segment(
+    storage: DynamoDBStorage, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    storage.save(_make_repo())
+    response = storage._table.get_item(Key={"repo_path": "/repos/one", "hostname": "remote-host"})
+    assert "Item" in response
+    item = response["Item"]
+    scan_calls: list[dict[str, object]] = []
+
+    class PagedTable:
+        def scan(self, **kwargs: object) -> dict[str, object]:
+            scan_calls.append(kwargs)
+            segment = kwargs["Segment"]
+            if "ExclusiveStartKey" not in kwargs:
+                return {"Items": [], "LastEvaluatedKey": {"repo_path": f"page-{segment}"}}
+            page_item = {**item, "repo_path": f"/repos/{segment}", "repo_name": f"repo-{segment}"}
+            return {"Items": [page_item]}
+
+    monkeypatch.setattr(storage, "_dynamodb", SimpleNamespace(Table=lambda name: PagedTable()))
+    storage.invalidate_cache()
+
+    repos = storage.list_all()
+
+    segments = {call["TotalSegments"] for call in scan_calls}
+    assert len(segments) == 1
+    total_segments = segments.pop()
+    assert isinstance(total_segments, int)
+    assert len(scan_calls) == 2 * total_segments
+    assert sorted(repo.name for repo in repos) == sorted(f"repo-{segment}" for segment in range(total_segments))
+
+
+def test_delete_reads_only_key_attributes(storage: DynamoDBStorage, monkeypatch: pytest.MonkeyPatch) -> None:
+    storage.save(_make_repo())
+
+    def fail_conversion(*args: object, **kwargs: object) -> None:
+        raise AssertionError("delete should not load the full repository")
+
+    monkeypatch.setattr("borgboi.storage.dynamodb._convert_table_item_to_repo", fail_conversion)
+
+    storage.delete("repo-one")
+
+    assert storage.exists("repo-one") is False
+
+
+def test_delete_raises_not_found_when_item_vanishes_before_delete(
+    storage: DynamoDBStorage, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    storage.save(_make_repo())
+    table = storage._table
+    original_query = table.query
+
+    def query_then_remove(**kwargs: object) -> object:
+        response = original_query(**kwargs)  # type: ignore[arg-type]
+        table.delete_item(Key={"repo_path": "/repos/one", "hostname": "remote-host"})
+        return response
+
+    monkeypatch.setattr(table, "query", query_then_remove)
+
+    with pytest.raises(RepositoryNotFoundError, match="not found"):
+        storage.delete("repo-one")
@@ -200,6 +200,61 @@ class TestLoadPassphraseFromFile:
         # But should have warned (captured in console output)
         # Note: This would require capturing rich console output properly
 
+    def test_insecure_permission_warning_uses_scoped_console(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify the warning follows the active scoped console, as buffered worker output does."""
+        import io
+
+        from rich.console import Console
+
+        import borgboi.config
+        from borgboi.rich_utils import scoped_console
+
+        monkeypatch.setattr(borgboi.config, "resolve_home_dir", lambda: tmp_path)
+        passphrase.save_passphrase_to_file("test-repo", "test-passphrase")
+        passphrase_file = tmp_path / ".borgboi" / "passphrases" / "test-repo.key"
+        passphrase_file.chmod(0o644)
+        buffer = io.StringIO()
+
+        with scoped_console(Console(file=buffer, width=200)):
+            result = passphrase.load_passphrase_from_file("test-repo")
+
+        assert result == "test-passphrase"
+        assert "insecure permissions" in buffer.getvalue()
+
+    def test_reuses_cached_passphrase_while_file_is_unchanged(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify repeated loads of an unchanged file read it only once."""
+        import borgboi.config
+
+        monkeypatch.setattr(borgboi.config, "resolve_home_dir", lambda: tmp_path)
+        passphrase.save_passphrase_to_file("test-repo", "test-passphrase")
+
+        with patch.object(Path, "read_text", autospec=True, side_effect=Path.read_text) as read_text:
+            assert passphrase.load_passphrase_from_file("test-repo") == "test-passphrase"
+            assert passphrase.load_passphrase_from_file("test-repo") == "test-passphrase"
+
+        assert read_text.call_count == 1
+
+    def test_cache_sees_rotated_and_deleted_files(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verify saved, externally rewritten, and deleted files are never served stale."""
+        import borgboi.config
+
+        monkeypatch.setattr(borgboi.config, "resolve_home_dir", lambda: tmp_path)
+        passphrase_file = passphrase.save_passphrase_to_file("test-repo", "first")
+        assert passphrase.load_passphrase_from_file("test-repo") == "first"
+
+        passphrase.save_passphrase_to_file("test-repo", "second")
+        assert passphrase.load_passphrase_from_file("test-repo") == "second"
+
+        passphrase_file.write_text("third-and-longer", encoding="utf-8")
+        assert passphrase.load_passphrase_from_file("test-repo") == "third-and-longer"
+
+        passphrase_file.unlink()
+        assert passphrase.load_passphrase_from_file("test-repo") is None
+
 
 class TestResolvePassphrase:
     """Tests for resolve_passphrase()."""
@@ -1,6 +1,7 @@
 """Tests for SQLiteStorage implementation."""
 
 from collections.abc import Iterator
+from datetime import datetime
 from pathlib import Path
 
 import pytest
@@ -59,6 +60,27 @@ class TestSQLiteStorageCRUD:
         result = storage.get("test-repo")
         assert result.backup_target == "/home/user2"
 
+    def test_update_fields_writes_only_named_fields(self, storage: SQLiteStorage) -> None:
+        storage.save(_make_repo())
+
+        repo = _make_repo()
+        repo.backup_target = "/home/other"
+        repo.last_backup = datetime(2026, 1, 2, 3, 4, 5)
+        storage.update_fields(repo, ("last_backup",))
+
+        result = storage.get("test-repo")
+        assert result.last_backup == datetime(2026, 1, 2, 3, 4, 5)
+        assert result.backup_target == "/home/user"
+
+    def test_update_fields_not_found(self, storage: SQLiteStorage) -> None:
+        with pytest.raises(RepositoryNotFoundError):
+            storage.update_fields(_make_repo(), ("last_backup",))
+
+    def test_update_fields_rejects_key_field(self, storage: SQLiteStorage) -> None:
+        storage.save(_make_repo())
+        with pytest.raises(ValueError, match="name"):
+            storage.update_fields(_make_repo(), ("name",))
+
     def test_list_all_empty(self, storage: SQLiteStorage) -> None:
         assert storage.list_all() == []
 
@@ -131,3 +153,18 @@ class TestSQLiteStorageS3Cache:
 
         storage.delete("test-repo")
         assert storage.get_s3_stats("test-repo") is None
+
+    @pytest.mark.parametrize(
+        ("size", "expected"),
+        [
+            (0, "0 B"),
+            (1023, "1023 B"),
+            (1024, "1.0 KB"),
+            (1024**2 - 1, "1024.0 KB"),
+            (5 * 1024**2, "5.0 MB"),
+            (1024**3, "1.00 GB"),
+            (1024**5, "1048576.00 GB"),
+        ],
+    )
+    def test_total_size_formatted(self, size: int, expected: str) -> None:
+        assert S3RepoStats(total_size_bytes=size).total_size_formatted == expected
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Generator
+from collections.abc import Callable, Collection, Generator
 from datetime import UTC, datetime
 from pathlib import Path
 from types import SimpleNamespace
@@ -69,6 +69,10 @@ class FakeStorage:
     def save(self, repo: BorgBoiRepo) -> None:
         self.saved_repos.append(repo.name)
 
+    def update_fields(self, repo: BorgBoiRepo, fields: Collection[str]) -> None:
+        del fields
+        self.saved_repos.append(repo.name)
+
 
 class FakeSpan:
     def set_attribute(self, _key: str, _value: object) -> None:
@@ -153,6 +153,12 @@ class TestCalculateArchiveAge:
         result = calculate_archive_age(archive_time)
         assert result == "0s"
 
+    def test_calculate_archive_age_uses_explicit_now(self) -> None:
+        """Test that a caller-supplied reference time is used instead of the clock."""
+        now = datetime(2025, 1, 2, 13, 5, 0, tzinfo=UTC)
+
+        assert calculate_archive_age("2025-01-01_12:00:00", now) == "1d 1h 5m"
+
     def test_calculate_archive_age_invalid_format(self) -> None:
         """Test that invalid time format raises ValueError."""
         with pytest.raises(ValueError, match=r"time data .* does not match format"):
@@ -1,8 +1,10 @@
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 from pydantic import ValidationError
 
+from borgboi.clients.utils import borg_logs
 from borgboi.clients.utils.borg_logs import (
     ArchiveProgress,
     FileStatus,
@@ -261,6 +263,24 @@ class TestDiscriminatedUnion:
         assert result.current == 25
         assert result.total == 200
 
+    def test_progress_message_without_percent_keys_parses_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        def fail_payload_path(log_line: str) -> None:
+            raise AssertionError(f"unexpected second parse of {log_line}")
+
+        monkeypatch.setattr(borg_logs, "_parse_borg_log_payload", fail_payload_path)
+        log_json = '{"type": "progress_message", "operation": 1, "msgid": null, "finished": false, "message": "say \\"current\\"", "time": 1234567890.0}'
+        result = parse_log(log_json)
+        assert isinstance(result, ProgressMessage)
+        assert result.message == 'say "current"'
+
+    def test_plain_text_line_skips_typed_json_parse(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        def fail_typed_parse(log_line: str) -> None:
+            raise AssertionError(f"unexpected typed parse of {log_line}")
+
+        monkeypatch.setattr(borg_logs, "_TYPED_EVENT_ADAPTER", SimpleNamespace(validate_json=fail_typed_parse))
+        with pytest.raises(ValidationError):
+            parse_log("Remote: Borg 1.4.0")
+
     def test_unknown_type_falls_back_to_shape(self) -> None:
         log_json = (
             '{"type": "unknown_event", "time": 1234567890.0, "levelname": "INFO", "name": "borg", "message": "Done"}'
@@ -269,6 +289,37 @@ class TestDiscriminatedUnion:
         assert isinstance(result, LogMessage)
         assert result.message == "Done"
 
+    def test_payload_path_dispatches_on_type_without_union_validation(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        def fail_union_validation(payload: object) -> None:
+            raise AssertionError(f"unexpected union validation of {payload}")
+
+        typed_adapter = borg_logs._TYPED_EVENT_ADAPTER
+        monkeypatch.setattr(
+            borg_logs,
+            "_TYPED_EVENT_ADAPTER",
+            SimpleNamespace(validate_json=typed_adapter.validate_json, validate_python=fail_union_validation),
+        )
+        unknown = parse_log(
+            '{"type": "unknown_event", "time": 1234567890.0, "levelname": "INFO", "name": "borg", "message": "Done"}'
+        )
+        percent = parse_log(
+            '{"type": "progress_message", "operation": 1, "msgid": null, "finished": false, "current": 1, "total": 2, "time": 1234567890.0}'
+        )
+        assert isinstance(unknown, LogMessage)
+        assert isinstance(percent, ProgressPercent)
+
+    @pytest.mark.parametrize(
+        ("log_json", "expected_type"),
+        [
+            ('{"original_size": 1, "time": 1234567890.0, "finished": false}', ArchiveProgress),
+            ('{"operation": 1, "msgid": null, "finished": true, "time": 1234567890.0}', ArchiveProgress),
+            ('{"status": "A", "path": "/var/data/file.txt"}', FileStatus),
+            ('{"time": "not-a-time", "finished": false, "status": "M", "path": "/x"}', FileStatus),
+        ],
+    )
+    def test_untyped_payload_matches_first_model_in_shape_order(self, log_json: str, expected_type: type) -> None:
+        assert isinstance(parse_log(log_json), expected_type)
+
     def test_unknown_type_with_unknown_shape_raises_validation_error(self) -> None:
         log_json = '{"type": "unknown_event", "foo": "bar"}'
         with pytest.raises(ValidationError):